@@ -13,7 +13,61 @@ import glob
 import pkgutil
 import importlib
 import inspect
+import json
+import collections.abc
 from moosetools import core
+from moosetools import mooseutils
+
+
+class _TypeRegistry(collections.abc.MutableMapping):
+    """
+    A `dict`-like container of registered names and object types, see `Factory.register`.
+
+    The types added with `defer` are stored as the module and qualified name, the module is imported
+    when the type is first accessed.
+    """
+    def __init__(self):
+        self._types = dict()
+
+    def defer(self, name, module, qualname):
+        """
+        Register *name* to the type *qualname* within the *module*, without importing the module.
+        """
+        self._types[name] = (module, qualname)
+
+    def location(self, name):
+        """
+        Return the module and qualified name of the type registered with *name*.
+        """
+        otype = self._types[name]
+        if isinstance(otype, tuple):
+            return otype
+        return otype.__module__, otype.__qualname__
+
+    def __getitem__(self, name):
+        otype = self._types[name]
+        if isinstance(otype, tuple):
+            module, qualname = otype
+            otype = importlib.import_module(module)
+            for attr in qualname.split('.'):
+                otype = getattr(otype, attr)
+            self._types[name] = otype
+        return otype
+
+    def __setitem__(self, name, otype):
+        self._types[name] = otype
+
+    def __delitem__(self, name):
+        del self._types[name]
+
+    def __contains__(self, name):
+        return name in self._types
+
+    def __iter__(self):
+        return iter(self._types)
+
+    def __len__(self):
+        return len(self._types)
 
 
 class Factory(core.MooseObject):
@@ -23,7 +77,19 @@ class Factory(core.MooseObject):
 
     It was originally designed to be utilized via the `factory.Parser` for creating objects from HIT
     input files.
+
+    If the 'manifest_file' parameter is set, the name, module, and qualified name of the registered
+    types are stored in the file by the `load` method. If the plugins and the modules containing
+    the types are unchanged, the next call to `load` registers the stored types without importing
+    the plugins or searching the loaded modules. The module of a type is imported when the type is
+    first used (e.g., by `create` or `params`). The types are located within all loaded modules, so
+    the file should only be used when the same modules are loaded prior to each call to `load`.
     """
+
+    #: Version of the 'manifest_file' content, increment this when the content changes such that
+    #  existing files are invalidated.
+    MANIFEST_VERSION = 1
+
     @staticmethod
     def validParams():
         params = core.MooseObject.validParams()
@@ -35,6 +101,10 @@ class Factory(core.MooseObject):
                    array=True,
                    default=(core.MooseObject, ),
                    doc="The python type of the plugins to load.")
+        params.add('manifest_file',
+                   vtype=str,
+                   doc="A JSON file for storing the location of the registered types, which are " \
+                       "then imported when first used rather than by `load`.")
         return params
 
     def __init__(self, **kwargs):
@@ -43,7 +113,7 @@ class Factory(core.MooseObject):
         provided via the keyword arguments, as defined in the `validParams` function.
         """
         core.MooseObject.__init__(self, **kwargs)
-        self._registered_types = dict()
+        self._registered_types = _TypeRegistry()
 
     def register(self, name, object_type):
         """
@@ -101,9 +171,12 @@ class Factory(core.MooseObject):
         """
         self.reset()
         plugin_types = self.getParam('plugin_types')
+        plugin_dirs = self.getParam('plugin_dirs')
+
+        # Types stored by a previous call, if the files are unchanged
+        manifest = self._loadManifest() if self.isParamValid('manifest_file') else None
 
         # Import modules from the supplied directories
-        plugin_dirs = self.getParam('plugin_dirs')
         if plugin_dirs is not None:
             for path in set(os.path.abspath(p) for p in plugin_dirs):
                 if not os.path.isdir(path):
@@ -117,12 +190,20 @@ class Factory(core.MooseObject):
                 else:
                     d_name, m_name = path.rsplit(os.sep, maxsplit=1)
                     sys.path.append(d_name)
+                    if manifest is not None:
+                        continue
                     try:
                         importlib.import_module(m_name)
                     except Exception:
                         self.exception("Failed to load module '{}' in directory '{}'", m_name,
                                        d_name)
 
+        if manifest is not None:
+            for name, (module, qualname) in manifest.items():
+                if name not in self._registered_types:
+                    self._registered_types.defer(name, module, qualname)
+            return self.status()
+
         # Load Classes that exist within the available modules
         def predicate(otype):
             return inspect.isclass(otype) and (otype.__name__
@@ -136,6 +217,8 @@ class Factory(core.MooseObject):
             except ModuleNotFoundError:
                 continue
 
+        if self.isParamValid('manifest_file') and (self.status() == 0):
+            self._saveManifest()
         return self.status()
 
     def _getObjectType(self, name):
@@ -144,11 +227,109 @@ class Factory(core.MooseObject):
 
         An error is logged if the supplied *name* is not associated with registered object type.
         """
-        otype = self._registered_types.get(name, None)
+        try:
+            otype = self._registered_types.get(name, None)
+        except Exception:
+            self.exception("Failed to import the type registered with the name '{}'.", name)
+            return None
+
         if otype is None:
             self.error("The supplied name '{}' is not associated with a registered type.", name)
         return otype
 
+    def _getManifestKey(self):
+        """
+        Return the `str` that identifies the types stored in the 'manifest_file' for the
+        'plugin_types' and 'plugin_dirs' parameters of this object.
+        """
+        types = sorted(f'{t.__module__}.{t.__qualname__}' for t in self.getParam('plugin_types'))
+        dirs = sorted(set(os.path.abspath(p) for p in self.getParam('plugin_dirs') or tuple()))
+        return json.dumps([types, dirs])
+
+    def _getManifestFiles(self, modules):
+        """
+        Return a `dict` of the modification times of the files that determine the registered types.
+
+        This includes the directories and python files within the 'plugin_dirs' and the files of
+        the modules in *modules*, including the packages that contain them.
+        """
+        filenames = set()
+        for path in set(os.path.abspath(p) for p in self.getParam('plugin_dirs') or tuple()):
+            for root, _, files in os.walk(path):
+                filenames.add(root)
+                filenames.update(os.path.join(root, f) for f in files if f.endswith('.py'))
+
+        for name in modules:
+            parts = name.split('.')
+            for i in range(1, len(parts) + 1):
+                filename = getattr(sys.modules.get('.'.join(parts[:i])), '__file__', None)
+                if filename:
+                    filenames.add(filename)
+
+        out = dict()
+        for filename in sorted(filenames):
+            try:
+                out[filename] = os.stat(filename).st_mtime_ns
+            except OSError:
+                out[filename] = None
+        return out
+
+    def _loadManifest(self):
+        """
+        Return the `dict` of names to the module and qualified name of the types stored in the
+        'manifest_file', `None` if the file does not exist or the stored types are out of date.
+        """
+        def convert(data):
+            entry = Factory._convertManifest(data).get(self._getManifestKey())
+            if entry is not None:
+                types = {str(k): (str(v[0]), str(v[1])) for k, v in entry['types'].items()}
+                return types, dict(entry['files'])
+            return None
+
+        data = mooseutils.load_data_file(self.getParam('manifest_file'), convert, 'manifest')
+        if data is None:
+            return None
+
+        types, files = data
+        for path, mtime in files.items():
+            try:
+                if os.stat(path).st_mtime_ns != mtime:
+                    return None
+            except OSError:
+                return None
+        return types
+
+    def _saveManifest(self):
+        """
+        Write the location of the registered types to the 'manifest_file', see `_loadManifest`.
+
+        The file is not written if a type cannot be imported by name (e.g., it is defined in a
+        script), the types for other 'plugin_types' and 'plugin_dirs' are preserved.
+        """
+        types = dict()
+        for name in self._registered_types:
+            module, qualname = self._registered_types.location(name)
+            if (module == '__main__') or ('<locals>' in qualname):
+                return
+            types[name] = (module, qualname)
+
+        filename = self.getParam('manifest_file')
+        factories = mooseutils.load_data_file(filename, Factory._convertManifest) or dict()
+        modules = set(module for module, _ in types.values())
+        factories[self._getManifestKey()] = dict(types=types, files=self._getManifestFiles(modules))
+        data = dict(version=Factory.MANIFEST_VERSION, factories=factories)
+        mooseutils.save_data_file(filename, data)
+
+    @staticmethod
+    def _convertManifest(data):
+        """
+        Return the `dict` of entries from the content of the 'manifest_file', an empty `dict` if the
+        version differs.
+        """
+        if data.get('version') == Factory.MANIFEST_VERSION:
+            return dict(data['factories'])
+        return dict()
+
     def toString(self):
         """
         Output the available parameters for each of the registered object types to a string.
@@ -14,22 +14,32 @@ import re
 import time
 import logging
 import enum
-import inspect
 import multiprocessing
 import math
 import itertools
+import hashlib
+import functools
 from moosetools import core
 from moosetools import moosetree
 from moosetools import pyhit
 from moosetools import mooseutils
+from moosetools.parameters import InputParameters
 from .Factory import Factory
 
+#: The `Parser` used by the processes created by `Parser.parse`, see `Parser._initWorker`
+_WORKER_PARSER = None
+
 
 class Parser(core.MooseObject):
     """
     The `Parser` object is designed for creating instances of `core.MooseObject` objects with
     parameters populated from a HIT input file.
     """
+
+    #: Version of the 'cache_file' content, increment this when the content changes such that
+    #  existing files are invalidated.
+    CACHE_VERSION = 1
+
     @staticmethod
     def validParams():
         params = core.MooseObject.validParams()
@@ -38,6 +48,10 @@ class Parser(core.MooseObject):
                    vtype=moosetree.IterMethod,
                    default=moosetree.IterMethod.PRE_ORDER,
                    doc="Iteration method to utilize when traversing HIT tree.")
+        params.add('cache_file',
+                   vtype=str,
+                   doc="File for storing the data extracted from the HIT files by the `parse` " \
+                       "method, which is used in place of parsing unchanged files.")
         return params
 
     def __init__(self, factory, **kwargs):
@@ -47,6 +61,8 @@ class Parser(core.MooseObject):
         """
         kwargs.setdefault('_factory', factory)
         core.MooseObject.__init__(self, **kwargs)
+        self.__cache = None  # data from the 'cache_file', see `parse`
+        self.__signatures = dict()  # signature of the parameters for each type, see `_getSignature`
 
     @property
     def factory(self):
@@ -56,10 +72,34 @@ class Parser(core.MooseObject):
     def parse(self, filenames, *, max_workers=None, chunksize=None):
         """
         Instantiate the `MooseObjects` in the supplied *filenames*.
+
+        The files are parsed by a pool of processes that return the type, name, and converted
+        parameter values of each block (see `_extractNode`), the objects are created by the calling
+        process. Thus, only plain data is transferred between the processes.
+
+        If the 'cache_file' parameter is set, the blocks and converted parameter values extracted
+        from each file are stored in the file. A file with the same modification time and size, or
+        the same content, as the stored data is not parsed. Instead, the objects are created
+        directly from the stored data, unless the parameters of the object types have changed.
         """
+        self.__cache = self._loadCache()
         if chunksize is None:
             chunksize = math.ceil(len(filenames) / (max_workers or os.cpu_count()))
-        return Parser._parseWithMultiprocessingPool(self, filenames, max_workers, chunksize)
+        results = Parser._parseWithMultiprocessingPool(self, filenames, max_workers, chunksize)
+
+        groups = list()
+        modified = False
+        for filename, (records, entry) in zip(filenames, results):
+            objects = self._createObjects(filename, records)
+            groups.append(objects)
+            if (entry is not None) and all(obj is not None for obj in objects) and \
+               (self.__cache.get(filename) != entry):
+                self.__cache[filename] = entry
+                modified = True
+
+        if modified:
+            self._saveCache()
+        return groups
 
     def parseFile(self, filename):
         """
@@ -70,14 +110,8 @@ class Parser(core.MooseObject):
         `status` method (see `core.MooseObject.status()`) will return a non-zero code if an
         error occurred.
         """
-        if not os.path.isfile(filename):
-            self.error("The file '{}' does not exist.".format(filename))
-            return None
-
-        with open(filename, 'r') as fid:
-            content = fid.read()
-
-        return self.parseText(filename, content)
+        records, _ = self._extractFile(filename)
+        return self._createObjects(filename, records)
 
     def parseText(self, filename, content):
         """
@@ -85,22 +119,8 @@ class Parser(core.MooseObject):
 
         The *filename* is provided for error reporting.
         """
-        try:
-            root = pyhit.parse(content, filename=filename)
-        except Exception as err:
-            self.exception("Failed to parse file '{}' with pyhit.", filename)
-            return None
-
-        # Iterate of all nodes with "type = ..."
-        objects = list()
-        paths = set()
-        for node in moosetree.findall(root,
-                                      func=lambda n: 'type' in n,
-                                      method=self.getParam('iteration_method')):
-            self._checkDuplicates(filename, paths, node)
-            objects.append(self.parseNode(filename, node))
-
-        return objects
+        records, _ = self._extractText(filename, content)
+        return self._createObjects(filename, records)
 
     def parseNode(self, filename, node):
         """
@@ -110,33 +130,8 @@ class Parser(core.MooseObject):
         contain a "type" parameter that gives the type of object to be constructed. This type must
         be registered with the `factory.Factory` supplied in the `Parser` constructor.
         """
-        otype = node.get('type', None)
-        if otype is None:
-            msg = "{}:{}\nMissing 'type' in block '{}'"
-            self.error(msg, filename, node.line(-1), node.fullpath)
-            return None
-
-        params = self.factory.params(otype)
-        if params is None:
-            msg = "{}:{}\nFailed to extract parameters from '{}' object in block '{}'"
-            self.error(msg, filename, node.line(-1), otype, node.fullpath, stack_info=True)
-            return None
-
-        # Set the object name to that of the block (e.g., [object])
-        params.setValue('name', node.name)
-        params.add('_hit_path', default=node.fullpath, private=True)
-        params.add('_hit_filename', default=filename, private=True)
-
-        # Update the Parameters with the HIT node
-        self.setParameters(params, filename, node, otype)
-
-        # Attempt to build the object
-        obj = self.factory.create(otype, params)
-        if obj is None:
-            msg = "{}:{}\nFailed to create object of type '{}' in block '{}'"
-            self.error(msg, filename, node.line(-1), otype, node.fullpath, stack_info=True)
-
-        return obj
+        record, _ = self._extractNode(filename, node)
+        return self._createObject(filename, record)
 
     def _checkDuplicates(self, filename, paths, node):
         """
@@ -146,12 +141,13 @@ class Parser(core.MooseObject):
         contains the existing HIT paths for blocks and parameters. The block and parameters from
         the supplied `pyhit.Node` object, *node*, are checked to exist in *paths*. If they are in
         set an error is logged. If they are not, the *paths* are updated to include the syntax from
-        *node*. Refer to `parse` for use.
+        *node*. Refer to `parse` for use. The return value is `False` if a duplicate exists.
         """
-
+        ok = True
         if node.fullpath in paths:
             msg = "{}:{}\Duplicate section '{}'".format(filename, node.line(-1), node.fullpath)
             self.error(msg)
+            ok = False
         else:
             paths.add(node.fullpath)
 
@@ -161,14 +157,30 @@ class Parser(core.MooseObject):
                 msg = "{}:{}\Duplicate parameter '{}'".format(filename, node.line(key, -1),
                                                               fullparam)
                 self.error(msg)
+                ok = False
             else:
                 paths.add(fullparam)
+        return ok
 
     def setParameters(self, params, filename, node, otype):
         """
         Update the `InputParameters` object in *params* with the key/value pairs in *node*,
         which is a `pyhit.Node` object.
         """
+        values, _ = self._getValues(params, filename, node, otype)
+        for key, value in values:
+            params.setValue(key, value)
+
+    def _getValues(self, params, filename, node, otype):
+        """
+        Return the `list` of key/value pairs in *node* converted to the types of the parameters
+        in the `InputParameters` object *params*, see `setParameters`.
+
+        The second return value is `False` if an error occurred.
+        """
+        values = list()
+        ok = True
+
         # Loop through all the parameters in the hit file
         for key, value in node.params():
             if key == 'type':
@@ -177,6 +189,7 @@ class Parser(core.MooseObject):
             if key not in params:
                 msg = "{}:{}\nThe parameter '{}' does not exist in '{}' object parameters."
                 self.error(msg, filename, node.line(key, -1), key, otype)
+                ok = False
                 continue
 
             # Attempt to convert the string value supplied by the HIT parser to types as given
@@ -188,10 +201,202 @@ class Parser(core.MooseObject):
                 if new_value is None:
                     msg = "{}:{}\nFailed to convert '{}' to the correct type(s) of '{}' for '{}' parameter."
                     self.error(msg, filename, node.line(key, -1), value, vtype, key)
+                    ok = False
                 value = new_value
 
             if value is not None:
-                params.setValue(key, value)
+                values.append((key, value))
+
+        return values, ok
+
+    def _extractFile(self, filename):
+        """
+        Return the data required to create the objects in the file *filename*, see `_extractText`,
+        and the data to store in the cache.
+
+        The stored data for the file is used, if it exists and the file is unchanged, otherwise the
+        file is parsed. The data to store is `None` if caching is disabled or the file contains
+        errors.
+        """
+        if not os.path.isfile(filename):
+            self.error("The file '{}' does not exist.".format(filename))
+            return None, None
+
+        content = None
+        stat = os.stat(filename)
+        entry = self.__cache.get(filename) if self.__cache is not None else None
+        if (entry is not None) and ((entry['mtime'], entry['size']) !=
+                                    (stat.st_mtime_ns, stat.st_size)):
+            with open(filename, 'rb') as fid:
+                content = fid.read()
+            if hashlib.sha256(content).hexdigest() == entry['hash']:
+                entry = dict(entry, mtime=stat.st_mtime_ns, size=stat.st_size)
+            else:
+                entry = None
+
+        # The stored data is not used if the parameters for a type changed since it was stored
+        if (entry is not None) and all(
+                self._getSignature(record[0]) == record[4] for record in entry['records']):
+            return entry['records'], entry
+
+        if content is None:
+            with open(filename, 'rb') as fid:
+                content = fid.read()
+        records, ok = self._extractText(filename, content.decode())
+
+        entry = None
+        if (self.__cache is not None) and ok:
+            entry = dict(mtime=stat.st_mtime_ns,
+                         size=stat.st_size,
+                         hash=hashlib.sha256(content).hexdigest(),
+                         records=records)
+        return records, entry
+
+    def _extractText(self, filename, content):
+        """
+        Return the `list` of data required to create the objects in the *content* string, see
+        `_extractNode`. The `list` is `None` if the content cannot be parsed.
+
+        The second return value is `False` if an error occurred.
+        """
+        try:
+            root = pyhit.parse(content, filename=filename)
+        except Exception as err:
+            self.exception("Failed to parse file '{}' with pyhit.", filename)
+            return None, False
+
+        # Iterate of all nodes with "type = ..."
+        records = list()
+        paths = set()
+        ok = True
+        for node in moosetree.findall(root,
+                                      func=lambda n: 'type' in n,
+                                      method=self.getParam('iteration_method')):
+            unique = self._checkDuplicates(filename, paths, node)
+            record, valid = self._extractNode(filename, node)
+            records.append(record)
+            ok = ok and unique and valid
+
+        return records, ok
+
+    def _extractNode(self, filename, node):
+        """
+        Return the data required to create the object for the `pyhit.Node` *node*, see
+        `parseNode`.
+
+        The data is a `tuple` containing the type, name, block path, line number, parameters
+        signature, and the converted parameter values, see `_createObject`. It is `None` if the
+        object cannot be created. The second return value is `False` if an error occurred.
+        """
+        otype = node.get('type', None)
+        if otype is None:
+            msg = "{}:{}\nMissing 'type' in block '{}'"
+            self.error(msg, filename, node.line(-1), node.fullpath)
+            return None, False
+
+        params = self.factory.params(otype)
+        if params is None:
+            msg = "{}:{}\nFailed to extract parameters from '{}' object in block '{}'"
+            self.error(msg, filename, node.line(-1), otype, node.fullpath, stack_info=True)
+            return None, False
+
+        values, ok = self._getValues(params, filename, node, otype)
+        record = (otype, node.name, node.fullpath, node.line(-1), self._getSignature(otype, params),
+                  tuple(values))
+        return record, ok
+
+    def _createObject(self, filename, record):
+        """
+        Return the object created from the data in *record*, see `_extractNode`.
+        """
+        if record is None:
+            return None
+
+        otype, name, fullpath, line, _, values = record
+        params = self.factory.params(otype)
+        if params is None:
+            msg = "{}:{}\nFailed to extract parameters from '{}' object in block '{}'"
+            self.error(msg, filename, line, otype, fullpath, stack_info=True)
+            return None
+
+        # Set the object name to that of the block (e.g., [object])
+        params.setValue('name', name)
+        params.add('_hit_path', default=fullpath, private=True)
+        params.add('_hit_filename', default=filename, private=True)
+
+        # Update the Parameters with the HIT node
+        for key, value in values:
+            params.setValue(key, value)
+
+        # Attempt to build the object
+        obj = self.factory.create(otype, params)
+        if obj is None:
+            msg = "{}:{}\nFailed to create object of type '{}' in block '{}'"
+            self.error(msg, filename, line, otype, fullpath, stack_info=True)
+        return obj
+
+    def _createObjects(self, filename, records):
+        """
+        Return the objects created from the `list` of data in *records*, see `_extractText`.
+        """
+        if records is None:
+            return None
+        return [self._createObject(filename, record) for record in records]
+
+    def _getSignature(self, otype, params=None):
+        """
+        Return a hash of the names, types, and array flags of the parameters of the type *otype*.
+
+        The value is stored for each type. The `InputParameters` object *params* may be provided,
+        if it was already created, it must not contain the private parameters added by
+        `_createObject`. `None` is returned if the parameters cannot be created.
+        """
+        signature = self.__signatures.get(otype)
+        if signature is None:
+            if params is None:
+                params = self.factory.params(otype)
+                if params is None:
+                    return None
+
+            def items(params, prefix):
+                for key in params.keys(private=True):
+                    param = params.parameter(key)
+                    vtype = ','.join(f'{t.__module__}.{t.__qualname__}' for t in param.vtype or [])
+                    yield f'{prefix}{key}:{vtype}:{param.array}'
+                    if isinstance(param.value, InputParameters):
+                        yield from items(param.value, f'{prefix}{key}_')
+
+            text = '\n'.join(items(params, ''))
+            signature = hashlib.sha256(text.encode()).hexdigest()
+            self.__signatures[otype] = signature
+        return signature
+
+    def _loadCache(self):
+        """
+        Return the `dict` of data stored in the 'cache_file', `None` if the parameter is not set.
+        """
+        filename = self.getParam('cache_file')
+        if filename is None:
+            return None
+
+        cache = mooseutils.load_data_file(filename, Parser._convertCache, 'cache', binary=True)
+        return cache or dict()
+
+    @staticmethod
+    def _convertCache(data):
+        """
+        Return the data from the content of the 'cache_file', `None` if the version differs.
+        """
+        if data.get('version') == Parser.CACHE_VERSION:
+            return data['files']
+        return None
+
+    def _saveCache(self):
+        """
+        Write the data to the 'cache_file', see `_loadCache`.
+        """
+        data = dict(version=Parser.CACHE_VERSION, files=self.__cache)
+        mooseutils.save_data_file(self.getParam('cache_file'), data, binary=True)
 
     @staticmethod
     def _getValueFromStr(vtypes, str_value, array):
@@ -200,49 +405,108 @@ class Parser(core.MooseObject):
 
         This method is used by the factor.Parser to convert data from HIT files to correct types.
         """
-        assert isinstance(vtypes, tuple) and all(
-            isinstance(v, type) for v in vtypes), "'vtypes' must be a tuple of types"
         assert isinstance(
             str_value,
             str), "'str_value' must be a string, a type of {} provided in value {}".format(
                 type, str_value, repr(str_value))
+        return Parser._getConverter(vtypes, array)(str_value)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _getConverter(vtypes, array):
+        """
+        Return a function that converts a string to the types in *vtypes*, see `_getValueFromStr`.
+
+        The function is created once for each combination of *vtypes* and *array*. It returns
+        `None` if the string, or any item of an array, cannot be converted.
+        """
+        assert isinstance(vtypes, tuple) and all(
+            isinstance(v, type) for v in vtypes), "'vtypes' must be a tuple of types"
         assert isinstance(array, bool), "'array' must be a bool"
 
-        def convert(val, vtypes):
-            out = None
-            for vtype in vtypes:
-                if vtype is bool:
-                    if val.lower() in ('0', '1', 'true', 'false'):
-                        out = val.lower() in ('1', 'true')
-                        break
-
-                elif enum.Enum in inspect.getmro(vtype):
-                    try:
-                        out = vtype[val]
-                        break
-                    except KeyError:
-                        pass
-                else:
-                    try:
-                        out = vtype(val)
-                        break
-                    except ValueError:
-                        pass
-
-            return out
-
-        if array:
-            value = tuple(convert(v, vtypes) for v in re.split(r' +', str_value))
-            if any(v is None for v in value): value = None
+        def bool_func(val):
+            val = val.lower()
+            return (val in ('1', 'true')) if (val in ('0', '1', 'true', 'false')) else None
+
+        def type_func(vtype):
+            if vtype is bool:
+                return bool_func
+            elif vtype is str:
+                return str
+            elif issubclass(vtype, enum.Enum):
+                return vtype.__members__.get
+
+            def func(val):
+                try:
+                    return vtype(val)
+                except ValueError:
+                    return None
+
+            return func
+
+        # Function for converting a single value, trying each type in order
+        funcs = [type_func(vtype) for vtype in vtypes]
+        if len(funcs) == 1:
+            convert = funcs[0]
+        else:
+
+            def convert(val):
+                for func in funcs:
+                    out = func(val)
+                    if out is not None:
+                        return out
+                return None
+
+        if not array:
+            return convert
+
+        # Items separated by one or more spaces, the regex is only needed for repeated spaces
+        split = re.compile(r' +').split
+
+        # A single type that raises a ValueError on failure (e.g., int) is applied directly
+        vtype = vtypes[0] if len(vtypes) == 1 else None
+        if (vtype is not None) and (vtype is not bool) and (not issubclass(vtype, enum.Enum)):
+
+            def convert_array(str_value):
+                items = split(str_value) if '  ' in str_value else str_value.split(' ')
+                try:
+                    return tuple(map(vtype, items))
+                except ValueError:
+                    return None
+
         else:
-            value = convert(str_value, vtypes)
 
-        return value
+            def convert_array(str_value):
+                items = split(str_value) if '  ' in str_value else str_value.split(' ')
+                value = tuple(map(convert, items))
+                return None if any(v is None for v in value) else value
+
+        return convert_array
 
     @staticmethod
     def _parseWithMultiprocessingPool(parser, filenames, max_workers, chunksize):
+        # The parser is inherited by the forked processes, rather than pickled with each task
         ctx = multiprocessing.get_context('fork')
-        pool = multiprocessing.pool.Pool(max_workers, context=ctx)
-        results = pool.map_async(parser.parseFile, filenames, chunksize=chunksize)
+        pool = multiprocessing.pool.Pool(max_workers,
+                                         initializer=Parser._initWorker,
+                                         initargs=(parser, ),
+                                         context=ctx)
+        results = pool.map_async(Parser._extractFileWorker, filenames, chunksize=chunksize)
         pool.close()
         return results.get()
+
+    @staticmethod
+    def _initWorker(parser):
+        """
+        Store the *parser* for use by `_extractFileWorker` within a process of the pool.
+        """
+        global _WORKER_PARSER
+        _WORKER_PARSER = parser
+
+    @staticmethod
+    def _extractFileWorker(filename):
+        """
+        Return the data for the objects in *filename* using the parser of the process, see
+        `_initWorker` and `_extractFile`.
+        """
+        return _WORKER_PARSER._extractFile(filename)
@@ -12,6 +12,7 @@ import sys
 import importlib
 import unittest
 import tempfile
+import json
 from unittest import mock
 from moosetools import parameters
 from moosetools import factory
@@ -143,6 +144,73 @@ class TestFactory(unittest.TestCase):
         self.assertIn('CustomObject', out)
         self.assertIn('CustomCustomObject', out)
 
+    def testManifest(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            plugin_dir = os.path.join(tmp, 'manifest_plugins')
+            os.mkdir(plugin_dir)
+            with open(os.path.join(plugin_dir, '__init__.py'), 'w') as fid:
+                fid.write("from .ManifestObject import ManifestObject\n")
+            with open(os.path.join(plugin_dir, 'ManifestObject.py'), 'w') as fid:
+                fid.write("from moosetools import core\n" \
+                          "class ManifestObject(core.MooseObject):\n" \
+                          "    pass\n")
+            filename = os.path.join(tmp, 'manifest.json')
+
+            # Cold, the plugins are imported and the types stored
+            f = factory.Factory(plugin_dirs=(plugin_dir, ), manifest_file=filename)
+            self.assertEqual(f.load(), 0)
+            self.assertTrue(os.path.isfile(filename))
+            otype = f._registered_types['ManifestObject']
+
+            # Warm, the modules are not searched and the types are imported when used
+            with mock.patch('inspect.getmembers') as getmembers:
+                f = factory.Factory(plugin_dirs=(plugin_dir, ), manifest_file=filename)
+                self.assertEqual(f.load(), 0)
+            getmembers.assert_not_called()
+            self.assertIn('ManifestObject', f._registered_types)
+            self.assertIsInstance(f._registered_types._types['ManifestObject'], tuple)
+            obj = f.create('ManifestObject', name='Andrew')
+            self.assertIs(type(obj), otype)
+            self.assertEqual(obj.name(), 'Andrew')
+            self.assertIs(f._registered_types._types['ManifestObject'], otype)
+
+            # Other plugin types are stored separately
+            f = factory.Factory(plugin_dirs=(plugin_dir, ),
+                                plugin_types=(parameters.InputParameters, ),
+                                manifest_file=filename)
+            self.assertEqual(f.load(), 0)
+            self.assertNotIn('ManifestObject', f._registered_types)
+            with open(filename, 'r') as fid:
+                self.assertEqual(len(json.load(fid)['factories']), 2)
+
+            # Modified plugins are loaded again
+            with open(os.path.join(plugin_dir, 'Another.py'), 'w') as fid:
+                fid.write("\n")
+            os.utime(plugin_dir, ns=(0, 0))
+            with mock.patch('inspect.getmembers', return_value=[]) as getmembers:
+                f = factory.Factory(plugin_dirs=(plugin_dir, ), manifest_file=filename)
+                self.assertEqual(f.load(), 0)
+            getmembers.assert_called()
+
+            # Stored types that fail to import
+            f = factory.Factory(plugin_dirs=(plugin_dir, ), manifest_file=filename)
+            f.load()
+            f._registered_types.defer('Wrong', 'manifest_plugins.Wrong', 'Wrong')
+            with self.assertLogs(level='CRITICAL') as log:
+                self.assertIsNone(f.create('Wrong'))
+            self.assertEqual(f.status(), 1)
+            self.assertIn("Failed to import the type registered with the name 'Wrong'",
+                          log.output[0])
+
+            # Invalid file
+            with open(filename, 'w') as fid:
+                fid.write('not json')
+            f = factory.Factory(plugin_dirs=(plugin_dir, ), manifest_file=filename)
+            with self.assertLogs(level='WARNING') as log:
+                f.load()
+            self.assertIn("Failed to load the manifest file", log.output[0])
+            self.assertIn('ManifestObject', f._registered_types)
+
     def testPackageError(self):
         f = factory.Factory(plugin_dirs=(self._tmpdir, ))
         with self.assertLogs(level='ERROR') as log:
@@ -13,6 +13,9 @@ import enum
 import time
 import multiprocessing
 import math
+import shutil
+import pickle
+import tempfile
 from unittest import mock
 from moosetools import parameters
 from moosetools import pyhit
@@ -76,6 +79,20 @@ class TestParser(unittest.TestCase):
         value = factory.Parser._getValueFromStr((Name, ), 'ANDREW', False)  # handles wrong name
         self.assertEqual(value, None)
 
+        # Repeated spaces, invalid items, and alternate types
+        self.assertConvertArray(int, '1949  1954   1977', (1949, 1954, 1977))
+        self.assertConvertArray((Name, int), 'ISAAC 1980', (Name.ISAAC, 1980))
+        self.assertIsNone(factory.Parser._getValueFromStr((int, ), '1949 abc', True))
+        self.assertIsNone(factory.Parser._getValueFromStr((int, ), ' 1949', True))
+        self.assertIsNone(factory.Parser._getValueFromStr((bool, ), 'yes', False))
+        self.assertEqual(factory.Parser._getValueFromStr((bool, float), '1.5', False), 1.5)
+
+        # Converters are created once for each type(s) and array flag
+        self.assertIs(factory.Parser._getConverter((int, ), True),
+                      factory.Parser._getConverter((int, ), True))
+        self.assertIsNot(factory.Parser._getConverter((int, ), True),
+                         factory.Parser._getConverter((int, ), False))
+
     def testSimple(self):
         f = factory.Factory()
         f.load()
@@ -231,6 +248,114 @@ class TestParser(unittest.TestCase):
             self.assertIn("Duplicate section 'Tests/obj0'", log.output[0])
             self.assertIn("Duplicate parameter 'Tests/obj0/type'", log.output[1])
 
+    def testRecords(self):
+        f = factory.Factory()
+        f.load()
+        p = factory.Parser(f)
+
+        # Plain data is extracted from the file
+        records, entry = p._extractFile('test1.hit')
+        self.assertIsNone(entry)
+        self.assertEqual(len(records), 4)
+        otype, name, fullpath, line, signature, values = records[0]
+        self.assertEqual(otype, 'TestObject')
+        self.assertEqual(name, 'scalar')
+        self.assertEqual(fullpath, '/Tests/scalar')
+        self.assertEqual(signature, p._getSignature('TestObject'))
+        self.assertEqual(values, (('par_int', 1980), ('par_float', 1.2345),
+                                  ('par_str', 'string with space'), ('par_bool', True)))
+        self.assertEqual(pickle.loads(pickle.dumps(records)), records)
+
+        # The objects are created by the calling process
+        root = pyhit.Node(None, 'Tests')
+        root.append('obj0', type='TestObject')
+        root.append('obj1', type='TestObjectBadInit')
+        with mock.patch('moosetools.pyhit.parse') as load:
+            load.return_value = root
+            with self.assertLogs(level='ERROR') as log:
+                objects = p.parse(['test0.hit'])
+        self.assertEqual(len(objects), 1)
+        self.assertEqual(objects[0][0].name(), 'obj0')
+        self.assertIsNone(objects[0][1])
+        self.assertEqual(len(log.output), 2)
+        self.assertIn("Failed to create 'TestObjectBadInit' object.", log.output[0])
+
+    def testCache(self):
+        f = factory.Factory()
+        f.load()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, 'test1.hit')
+            shutil.copyfile('test1.hit', filename)
+            cache_file = os.path.join(tmp, 'cache', 'parser.pickle')
+
+            # Cold, the file is parsed and stored
+            p = factory.Parser(f, cache_file=cache_file)
+            objects = p.parse([filename])[0]
+            self.assertEqual(len(objects), 4)
+            self.assertTrue(os.path.isfile(cache_file))
+
+            # Warm, the file is not parsed
+            with mock.patch('moosetools.pyhit.parse', side_effect=Exception()):
+                p = factory.Parser(f, cache_file=cache_file)
+                objects = p.parse([filename])[0]
+            self.assertEqual(p.status(), 0)
+            self.assertEqual(len(objects), 4)
+            self.assertEqual(objects[0].name(), 'scalar')
+            self.assertEqual(objects[0].getParam('par_int'), 1980)
+            self.assertEqual(objects[0].getParam('_hit_path'), '/Tests/scalar')
+            self.assertEqual(objects[0].getParam('_hit_filename'), filename)
+            self.assertEqual(objects[1].getParam('vec_int'), (1949, 1954, 1977, 1980))
+            self.assertEqual(objects[1].getParam('vec_bool'),
+                             (True, False, True, False, True, False))
+
+            # Modification time changed, but the content is the same
+            os.utime(filename, ns=(0, 0))
+            with mock.patch('moosetools.pyhit.parse', side_effect=Exception()):
+                p = factory.Parser(f, cache_file=cache_file)
+                objects = p.parse([filename])[0]
+            self.assertEqual(len(objects), 4)
+            with open(cache_file, 'rb') as fid:
+                self.assertEqual(pickle.load(fid)['files'][filename]['mtime'], 0)
+
+            # Content changed
+            with open(filename, 'r') as fid:
+                content = fid.read()
+            with open(filename, 'w') as fid:
+                fid.write(content.replace('1980', '1981', 1))
+            p = factory.Parser(f, cache_file=cache_file)
+            objects = p.parse([filename])[0]
+            self.assertEqual(objects[0].getParam('par_int'), 1981)
+
+            # Parameters of the type changed
+            with mock.patch('moosetools.pyhit.parse', side_effect=Exception()), \
+                 mock.patch.object(factory.Parser, '_getSignature', return_value='changed'):
+                p = factory.Parser(f, cache_file=cache_file)
+                objects = p.parse([filename])
+            self.assertEqual(objects, [None])
+
+            # Files with errors are not stored
+            error_file = os.path.join(tmp, 'error.hit')
+            with open(error_file, 'w') as fid:
+                fid.write("[Tests]\n  [obj]\n    type = TestObject\n    nope = 1\n  []\n[]\n")
+            p = factory.Parser(f, cache_file=cache_file)
+            objects = p.parse([filename, error_file])
+            self.assertEqual(len(objects), 2)
+            with open(cache_file, 'rb') as fid:
+                files = pickle.load(fid)['files']
+            self.assertIn(filename, files)
+            self.assertNotIn(error_file, files)
+
+            # Invalid file
+            with open(cache_file, 'w') as fid:
+                fid.write('not a cache')
+            p = factory.Parser(f, cache_file=cache_file)
+            with self.assertLogs(level='WARNING') as log:
+                objects = p.parse([filename])[0]
+            self.assertEqual(len(log.output), 1)
+            self.assertIn("Failed to load the cache file", log.output[0])
+            self.assertEqual(objects[0].getParam('par_int'), 1981)
+
     def testMultiple(self):
 
         filenames = ['test0.hit', 'test1.hit']
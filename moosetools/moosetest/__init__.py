@@ -11,7 +11,11 @@ from . import base
 from . import controllers
 from . import runners
 from . import differs
+from . import timing
+from . import cache
+from . import index
 from .discover import discover
 from .run import run
+from .shard import shard
 from .fuzzer import fuzzer
 from .main import main
@@ -30,9 +30,17 @@ class Controller(MooseTestObject):
 
     The `Controller` objects within this repository are added by default, custom objects can be
     added by the [Controllers] block with the '.moosetools' configure file.
+
+    If the static `STATIC` member variable is `True`, the result of the `execute` method depends
+    only on the parameters of the object and the environment, which does not change during
+    execution of the tests (e.g., the platform). These are evaluated for the `Runner` objects prior
+    to execution by `moosetest.run` (see `TestCase.evaluateControllers`), such that tests that will
+    not execute are never sent to a worker process. The default is `False` so that custom objects
+    that depend on the execution of other tests (e.g., a created file) continue to operate.
     """
     AUTO_BUILD = False
     OBJECT_TYPES = (Runner, Differ)
+    STATIC = False
 
     @staticmethod
     def validParams():
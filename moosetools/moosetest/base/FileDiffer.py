@@ -36,10 +36,24 @@ class FileDiffer(Differ):
         """
         Differ.preExecute(self)
 
+        filenames, gold_filenames = self.getFilenames()
+        if len(filenames) != len(gold_filenames):
+            msg = "The number of supplied file(s) for comparison are not the same length:\nFile(s):\n{}\nGold File(s):\n{}"
+            self.error(msg, '\n'.join(filenames), '\n'.join(gold_filenames))
+
+        self.__filename_pairs = [(f, g) for f, g in zip(filenames, gold_filenames)]
+
+    def getFilenames(self):
+        """
+        Return the file names, created and gold, for comparison.
+
+        The names are relative to the working directory of the `Runner` object. The lists are
+        not checked for consistency, see `preExecute`.
+        """
         filenames = list(self.getParam('file', 'names_created') or tuple())
         filenames += list(self.getParam('file', 'names_modified') or tuple())
         if self.isParamValid('file', 'goldnames'):
-            gold_filenames = self.getParam('file', 'goldnames') or tuple()
+            gold_filenames = list(self.getParam('file', 'goldnames') or tuple())
 
         else:
             gold_dir = self.getParam('file', 'golddir')
@@ -48,11 +62,7 @@ class FileDiffer(Differ):
                 d, f = os.path.split(filename)
                 gold_filenames.append(os.path.join(d, gold_dir, f))
 
-        if len(filenames) != len(gold_filenames):
-            msg = "The number of supplied file(s) for comparison are not the same length:\nFile(s):\n{}\nGold File(s):\n{}"
-            self.error(msg, '\n'.join(filenames), '\n'.join(gold_filenames))
-
-        self.__filename_pairs = [(f, g) for f, g in zip(filenames, gold_filenames)]
+        return filenames, gold_filenames
 
     def pairs(self):
         """
@@ -188,6 +188,7 @@ class Formatter(MooseObject):
 
         kwargs['stdout'] = data.stdout
         kwargs['stderr'] = data.stderr
+        kwargs['usage'] = data.usage
 
         if obj is tc_obj.runner:
             txt = self.formatRunnerResult(**kwargs)
@@ -79,6 +79,13 @@ class Runner(MooseTestObject):
         """
         return os.path.isdir(path)
 
+    @staticmethod
+    def isPositive(value):
+        """
+        Helper for verify function.
+        """
+        return value > 0
+
     @staticmethod
     def validParams():
         params = MooseTestObject.validParams()
@@ -105,6 +112,30 @@ class Runner(MooseTestObject):
             doc=
             "The name(s) of tests within a group (e.g, a test specification file) that are required to execute prior to running."
         )
+        params.add(
+            'allow_parallel',
+            vtype=bool,
+            default=True,
+            doc=
+            "Allow execution at the same time as other objects with the same 'working_dir'. When disabled, the `moosetest.run` function executes this object when no other object with the same working directory is executing. Objects that expect to create or modify the same file(s) (see the 'file' parameters) are never executed at the same time."
+        )
+
+        # Parameters associated with the resources required for execution
+        params.add(
+            'cores',
+            vtype=int,
+            default=1,
+            verify=(Runner.isPositive, "The number of cores must be greater than zero."),
+            doc=
+            "The number of processor cores consumed by the execution of this object (e.g., the number of MPI processes multiplied by the number of threads). The `moosetest.run` function will not execute objects simultaneously that require more cores than available."
+        )
+        params.add(
+            'memory',
+            vtype=(int, float),
+            verify=(Runner.isPositive, "The memory must be greater than zero."),
+            doc=
+            "The estimated peak memory, in megabytes, consumed by the execution of this object. The `moosetest.run` function will not execute objects simultaneously that require more memory than available."
+        )
 
         # Parameters associated with file names
         params.add(
@@ -175,6 +206,7 @@ class Runner(MooseTestObject):
         self.__expected_names_created = set()
         self.__expected_names_modified = set()
         self.__pre_execute_files = dict()  # dict with name to modified time
+        self.__concurrent_files = set()  # names expected by other objects, see `postExecute`
 
     def preExecute(self):
         """
@@ -253,6 +285,7 @@ class Runner(MooseTestObject):
         if self.getParam('file', 'check_created'):
             post_execute_files = set(os.listdir())
             post_execute_files -= self.__expected_names_created
+            post_execute_files -= self.__concurrent_files
 
             # remove ignored pattern(s)
             ignore_patterns = self.getParam('file', 'ignore_patterns_created') or tuple()
@@ -267,8 +300,10 @@ class Runner(MooseTestObject):
 
         # Check that other files were not modified unexpected
         if self.getParam('file', 'check_modified'):
-            post_execute_files = set(os.listdir())
+            # files created during execution are handled by 'check_created'
+            post_execute_files = set(os.listdir()).intersection(self.__pre_execute_files.keys())
             post_execute_files -= self.__expected_names_modified
+            post_execute_files -= self.__concurrent_files
 
             # remove ignored pattern(s)
             ignore_patterns = self.getParam('file', 'ignore_patterns_modified') or tuple()
@@ -297,6 +332,62 @@ class Runner(MooseTestObject):
         """
         raise NotImplementedError("The 'execute' method must be overridden.")
 
+    def getCommand(self):
+        """
+        Return the command, as a `list` of arguments, executed by this object.
+
+        By default `None` is returned, which indicates that the object does not execute a command.
+        Objects that execute a single command may override this method along with the
+        `executeCommand` method. This allows the command to be executed directly by the `TestCase`
+        object using `asyncio` (see `moosetest.base.TestCase.executeAsync`), rather than calling
+        the `execute` method. The 'timeout' parameter, if defined, limits the execution time of
+        the command.
+        """
+        return None
+
+    def executeCommand(self, returncode, stdout, stderr):
+        """
+        Called in place of the `execute` method with the results of the command from `getCommand`.
+
+        The *returncode*, *stdout*, and *stderr* are the return code and output of the command,
+        this method should return the code as done by the `execute` method.
+        """
+        raise NotImplementedError("The 'executeCommand' method must be overridden.")
+
+    def getResourceUsage(self):
+        """
+        Return a `dict` of the resources used by the last call to the `execute` method.
+
+        By default `None` is returned, which indicates that the information is not available.
+        Objects that execute a command may override this method (see `runners.RunCommand`), the
+        `dict` should contain the following, if available:
+
+        - 'user_time' and 'system_time': the CPU time in seconds;
+        - 'max_rss': the peak resident memory in megabytes;
+        - 'read_bytes' and 'write_bytes': the number of bytes read and written to storage.
+
+        The information is included in the results of the `TestCase` (see `TestCase.Data`) and
+        supplied to the `Formatter` object.
+        """
+        return None
+
+    def getExpectedFiles(self):
+        """
+        Return the `set` of file names expected to be created or modified by this object and the
+        `Differ` objects (see the 'file' parameters).
+        """
+        return self._getExpectedFiles('names_created') | self._getExpectedFiles('names_modified')
+
+    def setConcurrentFiles(self, names):
+        """
+        Set the file *names* expected to be created or modified by other objects that may execute at
+        the same time within the working directory.
+
+        These files are not reported by the checks for unexpected files within `postExecute`, see
+        `moosetest.scheduler.Scheduler`.
+        """
+        self.__concurrent_files = frozenset(names)
+
     def _getExpectedFiles(self, param_name):
         """
         Build the list of expected files, where the supplied `str` *param_name* is the name of the
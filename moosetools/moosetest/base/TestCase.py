@@ -14,12 +14,12 @@ import enum
 import time
 import uuid
 import logging
-import collections
-import multiprocessing
 import traceback
 import textwrap
-import platform
-if platform.python_version() >= "3.7":
+import asyncio
+import functools
+import subprocess
+if sys.version_info >= (3, 7):
     import dataclasses
 
 from moosetools import mooseutils
@@ -60,34 +60,22 @@ class State(enum.Enum):
 
 class RedirectOutput(object):
     """
-    A context object (i.e., `with...`) for redirecting sys.stdout and sys.stderr to `dict` keyed
-    on the current process.
+    A context object (i.e., `with...`) for redirecting sys.stdout and sys.stderr to `io.StringIO`
+    objects.
 
     This object is used by the `TestCase` object to extract all output from the execution of the
     `TestCase` so that that it can be sent back to the root process for output.
 
     It also updates the `Handler` objects from the `logging` package, which store their own
     reference to `sys.stderr`. Thus, without this the logging output will not be redirected.
-    """
-    class SysRedirect(object):
-        """
-        A replacement IO object for sys.stdout/err that stores content in *out*, which should be a
-        `dict` of `io.StringIO` objects.
-        """
-        def __init__(self, out, prefix=''):
-            self._prefix = prefix
-            self._out = out
-
-        def write(self, message):
-            self._out[multiprocessing.current_process().pid].write(
-                textwrap.indent(message, self._prefix))
-
-        def flush(self):
-            pass
 
+    The output is written directly to the `io.StringIO` objects, such that writing has no overhead
+    beyond that of the `io.StringIO` object. The *prefix*, if supplied, is added to each line when
+    the output is retrieved (see `stdout` and `stderr`).
+    """
     def __init__(self, prefix=''):
-        self._stdout = collections.defaultdict(io.StringIO)
-        self._stderr = collections.defaultdict(io.StringIO)
+        self._stdout = io.StringIO()
+        self._stderr = io.StringIO()
 
         self._sys_stdout = sys.stdout
         self._sys_stderr = sys.stderr
@@ -98,24 +86,30 @@ class RedirectOutput(object):
     @property
     def stdout(self):
         """
-        Return the redirect output to `sys.stdout` for the current process.
+        Return the redirect output to `sys.stdout`.
         """
-        return self._stdout[multiprocessing.current_process().pid].getvalue()
+        return self._format(self._stdout.getvalue())
 
     @property
     def stderr(self):
         """
-        Return the redirect output to `sys.stderr` for the current process.
+        Return the redirect output to `sys.stderr`.
+        """
+        return self._format(self._stderr.getvalue())
+
+    def _format(self, text):
+        """
+        Return the *text* with the prefix applied to each line.
         """
-        return self._stderr[multiprocessing.current_process().pid].getvalue()
+        return textwrap.indent(text, self._prefix) if self._prefix else text
 
     def __enter__(self):
         """
         Setup redirection when entering the context (`with...`).
         """
         self._logging_handlers = list()
-        sys.stdout = RedirectOutput.SysRedirect(self._stdout, prefix=self._prefix)
-        sys.stderr = RedirectOutput.SysRedirect(self._stderr, prefix=self._prefix)
+        sys.stdout = self._stdout
+        sys.stderr = self._stderr
 
         logger = logging.getLogger()
         for h in logger.handlers:
@@ -145,6 +139,120 @@ class RedirectOutput(object):
             h.setFormatter(f)
 
 
+class OutputBuffer(object):
+    """
+    Storage for the output of a command that retains at most *limit* bytes in memory.
+
+    The first and last half of the *limit* bytes written are retained, the content between is
+    discarded and replaced by a message indicating the number of bytes removed when the text is
+    retrieved with `getvalue`. If *limit* is `None` all the content is retained.
+
+    If *spill* is supplied, which must be a file object opened in binary mode, all the content
+    written is also written to it. This allows the complete output to be inspected (e.g., by a
+    `Differ`) without retaining it in memory.
+    """
+    def __init__(self, limit=None, spill=None):
+        self._limit = limit
+        self._spill = spill
+        self._head = bytearray()
+        self._tail = bytearray()
+        self._size = 0
+
+    @property
+    def size(self):
+        """
+        Return the total number of bytes written.
+        """
+        return self._size
+
+    @property
+    def truncated(self):
+        """
+        Return `True` if content was discarded.
+        """
+        return len(self._head) + len(self._tail) < self._size
+
+    def write(self, data):
+        """
+        Write the `bytes` in *data*.
+        """
+        self._size += len(data)
+        if self._spill is not None:
+            self._spill.write(data)
+
+        if self._limit is None:
+            self._head += data
+            return
+
+        n_head = self._limit - self._limit // 2
+        if len(self._head) < n_head:
+            count = n_head - len(self._head)
+            self._head += data[:count]
+            data = data[count:]
+
+        if data:
+            n_tail = self._limit // 2
+            self._tail += data
+            if len(self._tail) > n_tail:
+                del self._tail[:len(self._tail) - n_tail]
+
+    def getvalue(self):
+        """
+        Return the retained content as text with universal newlines, as done by `subprocess.run`.
+        """
+        text = self._head.decode('utf-8', errors='replace')
+        if self.truncated:
+            removed = self._size - len(self._head) - len(self._tail)
+            name = getattr(self._spill, 'name', None)
+            text += f"\n...{removed} bytes removed"
+            text += f", see '{name}'...\n" if name else "...\n"
+        text += self._tail.decode('utf-8', errors='replace')
+        return text.replace('\r\n', '\n').replace('\r', '\n')
+
+
+class MemoryMonitor(object):
+    """
+    Tracks the peak resident memory of the process *pid* and its descendants while they run.
+
+    Each call to `sample` reads the peak resident memory ("VmHWM") of the processes from the
+    "/proc/<pid>/status" files, thus the information is only available on Linux and a process that
+    starts and exits between calls is not included. The value reported by `peak` is the largest
+    peak of a single process, which is the meaning of "ru_maxrss" of `resource.getrusage`.
+
+    The peak memory of a finished process cannot be read, so the process must be sampled prior to
+    waiting on it (see `runners.RunCommand` and `TestCase.executeAsync`).
+    """
+    def __init__(self, pid):
+        self._pid = pid
+        self._peak = dict()  # pid to peak resident memory in kB
+
+    @property
+    def peak(self):
+        """
+        Return the peak resident memory in megabytes, `None` is returned if nothing was sampled.
+        """
+        return (max(self._peak.values()) / 1024) if self._peak else None
+
+    def sample(self):
+        """
+        Update the peak resident memory of the process and the descendants that currently exist.
+        """
+        stack = [self._pid]
+        while stack:
+            pid = stack.pop()
+            try:
+                with open(f'/proc/{pid}/status', 'r') as fid:
+                    for line in fid:
+                        if line.startswith('VmHWM:'):
+                            self._peak[pid] = max(self._peak.get(pid, 0), int(line.split()[1]))
+                            break
+                for tid in os.listdir(f'/proc/{pid}/task'):
+                    with open(f'/proc/{pid}/task/{tid}/children', 'r') as fid:
+                        stack.extend(int(child) for child in fid.read().split())
+            except (OSError, ValueError):
+                pass
+
+
 class TestCase(MooseObject):
     """
     An object for managing the data associated with the execution of a test, which is composed of
@@ -195,7 +303,7 @@ class TestCase(MooseObject):
         EXCEPTION = (16, 4, 'EXCEPTION', ('magenta_1', ))  # exception raised by Runner/Differ
         FATAL = (17, 5, 'FATAL', ('white', 'red_1'))  # internal error (see, run.py)
 
-    if platform.python_version() >= "3.7":
+    if sys.version_info >= (3, 7):
 
         @dataclasses.dataclass
         class Data(object):
@@ -205,6 +313,9 @@ class TestCase(MooseObject):
             This is mainly for convenience for accessing the results related data to allow for the API
             to return a single data object for all result related items and should allow for new items
             to be added if needed as the system expands.
+
+            The *usage* is the `dict` of resources used by the `Runner`, if available (see
+            `Runner.getResourceUsage`), it is not considered when comparing objects.
             """
             state: State = None
             returncode: int = None
@@ -212,16 +323,24 @@ class TestCase(MooseObject):
             stderr: str = None
             #reasons: list[str] = None #Py3.9 only
             reasons: list = None
+            usage: dict = dataclasses.field(default=None, compare=False)
 
     else:
 
         class Data(object):
-            def __init__(self, state=None, returncode=None, stdout=None, stderr=None, reasons=None):
+            def __init__(self,
+                         state=None,
+                         returncode=None,
+                         stdout=None,
+                         stderr=None,
+                         reasons=None,
+                         usage=None):
                 self.state = state
                 self.returncode = returncode
                 self.stdout = stdout
                 self.stderr = stderr
                 self.reasons = reasons
+                self.usage = usage
 
             def __eq__(self, other):
                 return self.state == other.state and self.returncode == other.returncode and \
@@ -260,13 +379,13 @@ class TestCase(MooseObject):
 
         self._runner = self.getParam('runner')
         self._differs = self._runner.getParam('differs') or tuple()
-        self._controllers = self.getParam('controllers') or tuple()
         self._min_fail_state = self.getParam('min_fail_state')
         self.parameters().setValue('name', self._runner.name())
 
         self.__results = None  # results from the Runner/Differ objects
         self.__progress = None  # execution progress of this TestCase
         self.__state = None  # the overall state (TestCase.Result)
+        self.__evaluated = None  # output of static Controller objects, see `evaluateControllers`
 
         # The following are various time settings managed via the `setProgress` method
         self.__create_time = None  # time when the object was created
@@ -327,6 +446,16 @@ class TestCase(MooseObject):
         """
         return self._differs
 
+    @property
+    def controllers(self):
+        """
+        Return the `Controller` object(s).
+
+        The objects are not stored as an attribute, which would be pickled with each `TestCase`
+        sent to a worker process in addition to the parameter (see `moosetest.run`).
+        """
+        return self.getParam('controllers') or tuple()
+
     @property
     def state(self):
         """
@@ -497,10 +626,168 @@ class TestCase(MooseObject):
         # Execute the runner, if it does not return a PASS state, then execution is complete
         with mooseutils.CurrentWorkingDirectory(working_dir):
             r_data = self._executeObject(self._runner)
+        r_data.usage = self._runner.getResourceUsage()
+        results[self._runner.name()] = r_data
+        if r_data.state.level != 0:
+            return r_data.state, results
+
+        return self._executeDiffers(working_dir, r_data, results)
+
+    async def executeAsync(self):
+        """
+        Execute the test, as done by `execute`, using `asyncio` for running the command of the
+        `Runner` object.
+
+        If the `Runner` object defines a command (see `Runner.getCommand`), the command is executed
+        with `asyncio.create_subprocess_exec` in place of calling the `Runner.execute` method and
+        the output is supplied to the `Runner.executeCommand` method. This allows for many
+        `TestCase` objects to execute concurrently within a single process, see `moosetest.run`.
+        The processes are not waited on with `os.wait4`, so the resources used only include the
+        sampled peak memory (see `MemoryMonitor`), unless the `Runner.getResourceUsage` method
+        provides them.
+
+        If the task is cancelled while the command is running the command is killed.
+        """
+        command = self._runner.getCommand()
+        if command is None:
+            return self.execute()
+
+        # The results to be returned
+        results = dict()
+
+        # Get the working directory, see `execute`
+        working_dir = self._runner.getParam('working_dir')
+        if not os.path.isdir(working_dir):
+            raise RuntimeError(f"The 'working_dir' does not exist: {working_dir}")
+
+        # Prepare the runner, the working directory is not changed while waiting for the command
+        # because other objects may be executing within the same process
+        with mooseutils.CurrentWorkingDirectory(working_dir):
+            r_data, stdout, stderr, out = self._prepareObject(self._runner)
+
+        # Execute the command, if the runner was not stopped by preparation
+        if r_data is None:
+            func, usage = await self._executeCommand(command, working_dir)
+            with mooseutils.CurrentWorkingDirectory(working_dir):
+                r_data = self._completeObject(self._runner, stdout, stderr, out, func)
+            r_data.usage = self._runner.getResourceUsage() or usage
+
         results[self._runner.name()] = r_data
         if r_data.state.level != 0:
             return r_data.state, results
 
+        return self._executeDiffers(working_dir, r_data, results)
+
+    def evaluateControllers(self):
+        """
+        Execute the static `Controller` objects (see `Controller`) with the `Runner` object.
+
+        If the `Runner` should not execute, the state and results are returned in the same form as
+        the `execute` method, otherwise `None` is returned. The static `Controller` objects are not
+        executed again when the test is executed. This is called by `moosetest.run` prior to
+        scheduling, such that tests that will not execute are not sent to a worker process.
+        """
+        controllers = [controller for controller in self.controllers if controller.STATIC]
+        data, stdout, stderr = self._executeControllers(self._runner, controllers)
+        if data is not None:
+            return data.state, {self._runner.name(): data}
+        self.__evaluated = (stdout, stderr)
+        return None
+
+    async def _executeCommand(self, command, working_dir):
+        """
+        Execute the *command* within the *working_dir* using `asyncio`, see `executeAsync`.
+
+        A function is returned for calling in place of the `Runner.execute` method (see
+        `_completeObject`), which raises the exception that occurred when running the command, if
+        any, so that the errors are handled in the same manner as `execute`. The function is
+        returned with the `dict` of resources used by the command, see `executeAsync`.
+
+        The output is captured with `OutputBuffer` objects, using the 'output_limit' and
+        'output_file' parameters of the `Runner`, if they exist (see `runners.RunCommand`).
+        """
+        params = self._runner.parameters()
+        timeout = params.getValue('timeout') if ('timeout' in params) else None
+        limit = params.getValue('output_limit') if ('output_limit' in params) else None
+        filename = params.getValue('output_file') if ('output_file' in params) else None
+
+        spill = None
+        try:
+            if filename is not None:
+                spill = open(os.path.join(working_dir, filename), 'wb')
+            stdout = OutputBuffer(limit, spill)
+            stderr = OutputBuffer(limit, spill)
+            proc = await asyncio.create_subprocess_exec(*command,
+                                                        stdout=asyncio.subprocess.PIPE,
+                                                        stderr=asyncio.subprocess.PIPE,
+                                                        cwd=working_dir)
+        except Exception as ex:
+            if spill is not None:
+                spill.close()
+            return functools.partial(TestCase._raise, ex), None
+
+        monitor = MemoryMonitor(proc.pid)
+        sampler = asyncio.ensure_future(TestCase._sampleMemory(monitor))
+        try:
+            streams = asyncio.gather(TestCase._readStream(proc.stdout, stdout),
+                                     TestCase._readStream(proc.stderr, stderr), proc.wait())
+            await asyncio.wait_for(streams, timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            ex = subprocess.TimeoutExpired(command, timeout)
+            return functools.partial(TestCase._raise, ex), None
+        except asyncio.CancelledError:
+            proc.kill()
+            await proc.wait()
+            raise
+        finally:
+            sampler.cancel()
+            if spill is not None:
+                spill.close()
+
+        usage = {'max_rss': monitor.peak} if (monitor.peak is not None) else None
+        func = functools.partial(self._runner.executeCommand, proc.returncode, stdout.getvalue(),
+                                 stderr.getvalue())
+        return func, usage
+
+    @staticmethod
+    async def _sampleMemory(monitor):
+        """
+        Sample the memory with the `MemoryMonitor` *monitor* at an increasing interval until the
+        task is cancelled, see `_executeCommand`.
+        """
+        delay = 0.0005
+        while True:
+            monitor.sample()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.05)
+
+    @staticmethod
+    async def _readStream(stream, buffer):
+        """
+        Write the content of the `asyncio.StreamReader` *stream* to the `OutputBuffer` *buffer*.
+        """
+        while True:
+            data = await stream.read(65536)
+            if not data:
+                break
+            buffer.write(data)
+
+    @staticmethod
+    def _raise(ex):
+        """
+        Helper for raising the exception *ex*, see `_executeCommand`.
+        """
+        raise ex
+
+    def _executeDiffers(self, working_dir, r_data, results):
+        """
+        Execute the `Differ` objects given the `TestCase.Data` from the `Runner` in *r_data*.
+
+        The *results* is updated with the data from each `Differ` and the overall state and
+        *results* are returned, see `execute`.
+        """
         # Execute the differs, when the runner returns a PASS state. All differs run, regardless of
         # the state returned by each. The overall state is tracked and is always set to the largest
         # state level.
@@ -529,6 +816,68 @@ class TestCase(MooseObject):
         around the calling it (via `TestCase.execute` method) in the
         `moosetest.run._execute_testcase` function.
         """
+        data, stdout, stderr, out = self._prepareObject(obj)
+        if data is not None:
+            return data
+        return self._completeObject(obj, stdout, stderr, out, lambda: obj.execute(*args, **kwargs))
+
+    def _prepareObject(self, obj):
+        """
+        Prepare the supplied *obj* for execution, see `_executeObject`.
+
+        The `reset` method of the *obj* is called, followed by the `Controller` objects and the
+        `preExecute` method of the *obj*. A `tuple` is returned containing a `TestCase.Data` object,
+        the accumulated output, and the `RedirectOutput` object used for the `preExecute` method,
+        which should be supplied to `_completeObject`. If the *obj* should not execute the data
+        object is returned, otherwise it is `None`.
+
+        The static `Controller` objects are not executed for the `Runner` object if they were
+        already evaluated by `evaluateControllers`.
+        """
+        controllers = self.controllers
+        stdout, stderr = '', ''
+        if (obj is self._runner) and (self.__evaluated is not None):
+            controllers = [controller for controller in controllers if not controller.STATIC]
+            stdout, stderr = self.__evaluated
+
+        data, c_stdout, c_stderr = self._executeControllers(obj, controllers)
+        if data is not None:
+            return data, None, None, None
+        stdout += c_stdout
+        stderr += c_stderr
+
+        # Prepare the object for execution, the output from `preExecute` is included with the
+        # output of the `execute` and `postExecute` methods (see `_completeObject`)
+        out = RedirectOutput()
+        with out:
+
+            # Call `preExecute`, stop if this fails in any capacity
+            try:
+                obj.reset()
+                obj.preExecute()
+                if obj.status():
+                    self.error(
+                        "An error occurred within the `preExecute` method of the '{}' object.",
+                        obj.name())
+                    return TestCase.Data(TestCase.Result.FATAL, None, out.stdout, out.stderr,
+                                         obj.getReasons()), None, None, None
+
+            except Exception as ex:
+                self.exception(
+                    "An exception occurred within the `preExecute` method of the '{}' object.",
+                    obj.name())
+                return TestCase.Data(TestCase.Result.FATAL, None, out.stdout, out.stderr,
+                                     None), None, None, None
+
+        return None, stdout, stderr, out
+
+    def _executeControllers(self, obj, controllers):
+        """
+        Reset the supplied *obj* and execute the *controllers* with it, see `_prepareObject`.
+
+        A `tuple` is returned containing a `TestCase.Data` object and the accumulated output. If
+        the *obj* should not execute the data object is returned, otherwise it is `None`.
+        """
 
         # The supplied *obj* as well as the `Controller` objects are expected to be a
         # `core.MooseObject` derived objects. As such the built-in logging capability is leveraged.
@@ -553,14 +902,15 @@ class TestCase(MooseObject):
                 self.exception(
                     "An exception occurred within the `reset` method of the '{}' object.",
                     obj.name())
-                return TestCase.Data(TestCase.Result.FATAL, None, out.stdout, out.stderr, None)
+                return TestCase.Data(TestCase.Result.FATAL, None, out.stdout, out.stderr,
+                                     None), None, None
 
             finally:
                 stdout += out.stdout
                 stderr += out.stderr
 
         # Loop through each `Controller` object
-        for controller in self._controllers:
+        for controller in controllers:
 
             # Skip of controller not associated with current type
             if not isinstance(obj, controller.OBJECT_TYPES):
@@ -583,7 +933,7 @@ class TestCase(MooseObject):
                             "An error occurred, on the controller, within the `execute` method of the {} controller with '{}' object.",
                             type(controller).__name__, obj.name())
                         return TestCase.Data(TestCase.Result.FATAL, None, out.stdout, out.stderr,
-                                             controller.getReasons())
+                                             controller.getReasons()), None, None
 
                     # Stop if an error is logged on the object, due to execution of Controller
                     if obj.status():
@@ -591,49 +941,43 @@ class TestCase(MooseObject):
                             "An error occurred, on the object, within the `execute` method of the {} controller with '{}' object.",
                             type(controller).__name__, obj.name())
                         return TestCase.Data(TestCase.Result.FATAL, None, out.stdout, out.stderr,
-                                             obj.getReasons())
+                                             obj.getReasons()), None, None
 
                     # Skip it...maybe
                     c_state = controller.state()
                     if c_state is not None:
                         return TestCase.Data(c_state, None, out.stdout, out.stderr,
-                                             controller.getReasons())
+                                             controller.getReasons()), None, None
 
                 except Exception as ex:
                     self.error(
                         "An exception occurred within the `execute` method of the {} controller with '{}' object.\n{}",
                         type(controller).__name__, obj.name(), traceback.format_exc())
-                    return TestCase.Data(TestCase.Result.FATAL, None, out.stdout, out.stderr, None)
+                    return TestCase.Data(TestCase.Result.FATAL, None, out.stdout, out.stderr,
+                                         None), None, None
 
                 finally:
                     stdout += out.stdout
                     stderr += out.stderr
 
-        # Execute the object
-        with RedirectOutput() as out:
+        return None, stdout, stderr
 
-            # Call `preExecute`, stop if this fails in any capacity
-            try:
-                obj.reset()
-                obj.preExecute()
-                if obj.status():
-                    self.error(
-                        "An error occurred within the `preExecute` method of the '{}' object.",
-                        obj.name())
-                    return TestCase.Data(TestCase.Result.FATAL, None, out.stdout, out.stderr,
-                                         obj.getReasons())
+    def _completeObject(self, obj, stdout, stderr, out, func):
+        """
+        Execute the *obj*, which was prepared by `_prepareObject`, and return a `TestCase.Data`.
 
-            except Exception as ex:
-                self.exception(
-                    "An exception occurred within the `preExecute` method of the '{}' object.",
-                    obj.name())
-                return TestCase.Data(TestCase.Result.FATAL, None, out.stdout, out.stderr, None)
+        The *stdout*, *stderr*, and *out* are the values returned from `_prepareObject`. The *func*
+        is called in place of the `execute` method of the *obj* and must return the same. This
+        allows for the `execute` method to be replaced when the execution is performed elsewhere
+        (see `executeAsync`).
+        """
+        with out:
 
             # Call `execute`, always call `postExecute` even if this fails
             execute_failure = None
             try:
                 obj.reset()
-                rcode = obj.execute(*args, **kwargs)
+                rcode = func()
                 if obj.status():
                     state = TestCase.Result.DIFF if isinstance(obj,
                                                                Differ) else TestCase.Result.ERROR
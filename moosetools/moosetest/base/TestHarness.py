@@ -24,6 +24,14 @@ class TestHarness(core.MooseObject):
 
     Please refer to `moostest.main` for use.
     """
+    @staticmethod
+    def isShard(value):
+        """
+        Helper for verify function.
+        """
+        index, _, count = value.partition('/')
+        return index.isdigit() and count.isdigit() and (1 <= int(index) <= int(count))
+
     @staticmethod
     def validParams():
         params = core.MooseObject.validParams()
@@ -47,6 +55,66 @@ class TestHarness(core.MooseObject):
                    default=300,
                    vtype=int,
                    doc="The maximum number of failures allowed before terminating all test cases.")
+        params.add('max_memory',
+                   vtype=(int, float),
+                   doc=("The memory, in megabytes, available for running tests simultaneously, "
+                        "by default the physical memory is used (see 'memory' parameter of the "
+                        "`Runner` object)."))
+        params.add('soft_limit',
+                   vtype=bool,
+                   default=True,
+                   doc=("Allow a test that requires more cores or memory than available to run "
+                        "when no other tests are running, if disabled the test is skipped."))
+        params.add('async_commands',
+                   vtype=bool,
+                   default=False,
+                   doc=("Execute the commands of `Runner` objects (e.g., `RunCommand`) "
+                        "concurrently from a single process using `asyncio`, rather than "
+                        "requiring a process for each test."))
+        params.add(
+            'cache_file',
+            vtype=str,
+            doc=("A JSON file for storing the fingerprint of each passing test. If provided, "
+                 "tests that are unchanged since passing in a previous run are not "
+                 "executed (see `moosetest.cache.ResultCache`)."))
+        params.add('clear_cache',
+                   vtype=bool,
+                   default=False,
+                   doc="Remove the fingerprints stored in the 'cache_file' prior to running.")
+        params.add(
+            'shard',
+            vtype=str,
+            verify=(TestHarness.isShard,
+                    "The shard must be in the form INDEX/COUNT, with 1 <= INDEX <= COUNT."),
+            doc=("Execute a portion of the tests, given as INDEX/COUNT (e.g., 2/12), for "
+                 "distributing the tests across machines. The tests are balanced by the times "
+                 "in the 'timing_file', if available (see `moosetest.shard`), which is not "
+                 "updated so that every machine computes the same partition."))
+        params.add('timing_file',
+                   vtype=str,
+                   doc=("A JSON file for storing the execution time of each test. If provided, the "
+                        "times from previous runs are used to execute the longest tests first. The "
+                        "file is not updated when the 'shard' parameter is provided."))
+        params.add('prune_dirs',
+                   vtype=str,
+                   array=True,
+                   default=('.git', '.svn', '.hg', '__pycache__'),
+                   doc="Directory names (or glob patterns) to skip when searching for tests.")
+        params.add('prune_repositories',
+                   vtype=bool,
+                   default=True,
+                   doc=("Skip directories that contain a '.git' file or directory (e.g., "
+                        "submodules) when searching for tests."))
+        params.add('index_file',
+                   vtype=str,
+                   doc=("A JSON file for storing the location of the test specification files. If "
+                        "provided, only directories modified since the previous run are read "
+                        "when searching for tests (see `moosetest.index.DirectoryIndex`)."))
+        params.add('spec_cache_file',
+                   vtype=str,
+                   doc=("A file for storing the content of the test specification files. If "
+                        "provided, unchanged files are not parsed when creating the tests (see "
+                        "`factory.Parser`)."))
 
         # These are not intended to be set by the HIT configuration file
         params.add(
@@ -73,7 +141,13 @@ class TestHarness(core.MooseObject):
                             "'.moosetest' file is searched up the directory tree beginning with " \
                             "the current working directory.")
 
-        params.toArgs(parser, 'n_threads', 'timeout', 'max_failures', 'spec_file_names')
+        parser.add_argument('--clear_cache',
+                            action='store_true',
+                            help=params.parameter('clear_cache').doc)
+
+        params.toArgs(parser, 'n_threads', 'timeout', 'max_failures', 'spec_file_names',
+                      'timing_file', 'max_memory', 'cache_file', 'shard', 'index_file',
+                      'spec_cache_file')
 
         # Add CLI arguments from other top-level objects
         for obj in (params.getValue('controllers') or tuple()):
@@ -102,13 +176,26 @@ class TestHarness(core.MooseObject):
         Locate and test groups to execute.
         """
 
+        # Load the location of the test specification files from previous runs
+        index = None
+        if self.isParamValid('index_file'):
+            index = moosetest.index.DirectoryIndex(self.getParam('index_file'))
+
         # Locate the tests to execute
         groups = moosetest.discover(os.getcwd(),
                                     self.getParam('controllers') or tuple(),
                                     self.getParam('spec_file_names'),
                                     plugin_dirs=os.getenv('MOOSETOOLS_PLUGIN_DIRS', '').split(),
                                     n_threads=self.getParam('n_threads'),
-                                    object_defaults=self.getParam('object_defaults'))
+                                    object_defaults=self.getParam('object_defaults'),
+                                    prune=self.getParam('prune_dirs'),
+                                    prune_repositories=self.getParam('prune_repositories'),
+                                    index=index,
+                                    spec_cache_file=self.getParam('spec_cache_file'),
+                                    manifest_file=os.getenv('MOOSETOOLS_FACTORY_MANIFEST'))
+
+        if index is not None:
+            index.save()
         return groups
 
     def run(self, groups):
@@ -116,13 +203,40 @@ class TestHarness(core.MooseObject):
         Execute the tests in *groups*, where *groups* is the output from the `discover` method.
         """
 
+        # Load the execution times from previous runs
+        timing = None
+        if self.isParamValid('timing_file'):
+            timing = moosetest.timing.TimingStore(self.getParam('timing_file'))
+
+        # Load the fingerprints of tests that passed in previous runs
+        cache = None
+        if self.isParamValid('cache_file'):
+            cache = moosetest.cache.ResultCache(self.getParam('cache_file'),
+                                                clear=self.getParam('clear_cache'))
+
+        # Limit the tests to the portion for this machine
+        if self.isParamValid('shard'):
+            index, count = self.getParam('shard').split('/')
+            groups = moosetest.shard(groups, int(index), int(count), durations=timing)
+
         # Execute the tests
         rcode = moosetest.run(groups,
                               self.getParam('controllers') or tuple(),
                               self.getParam('formatter'),
                               n_threads=self.getParam('n_threads'),
                               timeout=self.getParam('timeout'),
-                              max_fails=self.getParam('max_failures'))
+                              max_fails=self.getParam('max_failures'),
+                              timing=timing,
+                              max_memory=self.getParam('max_memory'),
+                              soft_limit=self.getParam('soft_limit'),
+                              async_commands=self.getParam('async_commands'),
+                              cache=cache)
+
+        # The times are not stored when sharding, each machine must partition with the same times
+        if (timing is not None) and (not self.isParamValid('shard')):
+            timing.save()
+        if cache is not None:
+            cache.save()
 
         return rcode
 
@@ -130,7 +244,9 @@ class TestHarness(core.MooseObject):
         """
         Apply options provided via the command line to the TestHarness object parameters.
         """
-        self.parameters().fromArgs(args, 'n_threads', 'timeout', 'max_failures', 'spec_file_names')
+        self.parameters().fromArgs(args, 'n_threads', 'timeout', 'max_failures', 'spec_file_names',
+                                   'timing_file', 'max_memory', 'cache_file', 'clear_cache',
+                                   'shard', 'index_file', 'spec_cache_file')
 
         # Call setup function from other top-level objects
         for obj in (self.getParam('controllers') or tuple()):
@@ -13,5 +13,5 @@ from .Runner import Runner, make_runner
 from .Differ import Differ, make_differ
 from .FileDiffer import FileDiffer
 from .Formatter import Formatter
-from .TestCase import TestCase, State, RedirectOutput
+from .TestCase import TestCase, State, RedirectOutput, OutputBuffer, MemoryMonitor
 from .TestHarness import TestHarness
@@ -0,0 +1,315 @@
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import os
+import re
+import sys
+import enum
+import shutil
+import fnmatch
+import hashlib
+import inspect
+import platform
+import subprocess
+from moosetools import mooseutils
+from moosetools.core import MooseObject
+from moosetools.parameters import InputParameters
+from moosetools.moosetest.base import TestCase, FileDiffer
+
+
+class ResultCache(object):
+    """
+    Persistent storage of the fingerprints of passing `TestCase` objects, keyed by the `TestCase`
+    name.
+
+    The fingerprint of a `TestCase` (see `fingerprint`) is computed prior to execution. If a test
+    passed in a previous run with an identical fingerprint, then it does not need to be executed
+    again, see `moosetest.run` for use.
+
+    The fingerprints are loaded from the JSON file in *filename*, if it exists, and written to the
+    same file with the `save` method. If *filename* is `None` the fingerprints are only stored in
+    memory. The stored fingerprints are removed if *clear* is `True`.
+    """
+
+    #: Version of the fingerprint, increment this when the content of the fingerprint changes such
+    #  that existing cache files are invalidated.
+    VERSION = 1
+
+    #: Patterns (see `fnmatch`) of the names of the environment variables included in the
+    #  fingerprint, these are the variables commonly used to locate and configure the executable of
+    #  a command. The variables referenced by the arguments of the command (e.g., "$MOOSE_DIR") are
+    #  also included.
+    ENVIRONMENT = ('PATH', 'LD_LIBRARY_PATH', 'DYLD_LIBRARY_PATH', 'PYTHONPATH', 'MOOSE_*',
+                   'MOOSETOOLS_*', 'LIBMESH_*', 'PETSC_*', 'METHOD', 'OMP_*', 'MPI*', 'OMPI_*',
+                   'I_MPI_*', 'MV2_*')
+
+    def __init__(self, filename=None, clear=False):
+        self._filename = filename
+        self._fingerprints = dict()
+        self._files = dict()  # memoized file hashes, see `_hashFile`
+        self._executables = dict()  # memoized executable hashes, see `_hashExecutable`
+        self._environment = None  # environment variables in the fingerprint, see `fingerprint`
+        if not clear:
+            data = mooseutils.load_data_file(filename, ResultCache._convert, 'test cache')
+            self._fingerprints = data or dict()
+
+    @staticmethod
+    def _convert(data):
+        """
+        Return the fingerprints from the content of the file, `None` if the version differs.
+        """
+        if data.get('version') == ResultCache.VERSION:
+            return {str(k): str(v) for k, v in data['tests'].items()}
+        return None
+
+    @property
+    def filename(self):
+        """
+        Return the filename used for storing the fingerprints.
+        """
+        return self._filename
+
+    def __len__(self):
+        return len(self._fingerprints)
+
+    def __contains__(self, name):
+        return name in self._fingerprints
+
+    def get(self, name, default=None):
+        """
+        Return the stored fingerprint for the `TestCase` with *name*, *default* if it does not
+        exist.
+        """
+        return self._fingerprints.get(name, default)
+
+    def set(self, name, fingerprint):
+        """
+        Store the *fingerprint* for the passing `TestCase` with *name*.
+        """
+        self._fingerprints[name] = fingerprint
+
+    def remove(self, name):
+        """
+        Remove the stored fingerprint for the `TestCase` with *name*, if it exists.
+        """
+        self._fingerprints.pop(name, None)
+
+    def clear(self):
+        """
+        Remove all stored fingerprints.
+        """
+        self._fingerprints.clear()
+
+    def check(self, tc, fingerprint):
+        """
+        Return `True` if the *fingerprint* matches the stored value for the `TestCase` *tc*.
+        """
+        return self._fingerprints.get(tc.name(), None) == fingerprint
+
+    def update(self, tc, fingerprint):
+        """
+        Store the *fingerprint* of the finished `TestCase` *tc*, if it passed.
+
+        The fingerprint of a `TestCase` that did not pass is removed. A `TestCase` that was skipped
+        or removed does not change the stored value.
+        """
+        if tc.state == TestCase.Result.PASS:
+            self.set(tc.name(), fingerprint)
+        elif tc.state not in (TestCase.Result.SKIP, TestCase.Result.REMOVE):
+            self.remove(tc.name())
+
+    def save(self):
+        """
+        Write the stored fingerprints to the file supplied upon construction, see
+        `mooseutils.save_data_file`.
+        """
+        if self._filename is not None:
+            data = {'version': ResultCache.VERSION, 'tests': self._fingerprints}
+            mooseutils.save_data_file(self._filename, data)
+
+    def fingerprint(self, tc):
+        """
+        Return the fingerprint, as a hex `str`, of the `TestCase` *tc*.
+
+        The fingerprint is a hash of the following:
+
+        - the parameters of the `Runner` and `Differ` objects, which includes the content of the
+          test specification block that created the objects;
+        - the content of files given as parameters of the `Runner` and `Differ` objects (e.g.,
+          input files) and the gold files of `FileDiffer` objects, relative to the 'working_dir';
+        - the path, modification time, and size of the executable of a `Runner` object command and
+          of the shared libraries it depends on (see `_getDependencies`);
+        - the environment variables matching the `ENVIRONMENT` patterns or referenced by the
+          command;
+        - the content of the python source files defining the objects;
+        - the parameters of the `Controller` objects and the platform information.
+
+        Files listed as created by the test are not included, because these are the output. The
+        environment is otherwise not included because it contains many variables that change
+        between shells (e.g., "PWD" or "SSH_*") without changing the result of a test.
+        """
+        runner = tc.runner
+        working_dir = runner.getParam('working_dir')
+
+        if self._environment is None:
+            names = [
+                k for k in os.environ if any(
+                    fnmatch.fnmatchcase(k, p) for p in ResultCache.ENVIRONMENT)
+            ]
+            self._environment = ';'.join(f'{k}={os.environ[k]}' for k in sorted(names))
+
+        sha = hashlib.sha256()
+        sha.update(f'{platform.platform()};{sys.version}'.encode())
+        sha.update(self._environment.encode())
+        for obj in [runner] + list(tc.differs) + list(tc.controllers):
+            sha.update(self._hashObject(obj).encode())
+
+        # Files referenced by parameters
+        created = runner._getExpectedFiles('names_created')
+        filenames = set()
+        for obj in [runner] + list(tc.differs):
+            filenames.update(ResultCache._getStrings(obj.parameters()))
+            if isinstance(obj, FileDiffer):
+                filenames.update(obj.getFilenames()[1])
+
+        for name in sorted(filenames - created):
+            path = os.path.join(working_dir, name)
+            if os.path.isfile(path):
+                sha.update(f'{name}:{self._hashFile(path)}'.encode())
+
+        # The executable, the content is not hashed because it may be large
+        command = runner.getCommand()
+        if command:
+            exe = command[0]
+            path = os.path.join(working_dir, exe) if os.sep in exe else shutil.which(exe)
+            if (path is not None) and os.path.isfile(path):
+                sha.update(self._hashExecutable(path).encode())
+
+            # The environment variables referenced by the command
+            names = set()
+            for arg in command:
+                names.update(re.findall(r'\$\{?(\w+)', arg))
+            for name in sorted(names):
+                sha.update(f'{name}={os.environ.get(name)}'.encode())
+
+        return sha.hexdigest()
+
+    def _hashObject(self, obj):
+        """
+        Return a `str` representing the type, source, and parameters of the *obj*.
+        """
+        sources = list()
+        for cls in inspect.getmro(type(obj)):
+            if issubclass(cls, MooseObject) and (cls is not MooseObject):
+                try:
+                    sources.append(self._hashFile(inspect.getfile(cls)))
+                except (TypeError, OSError):
+                    pass
+        params = ResultCache._toString(obj.parameters())
+        return f'{type(obj).__module__}.{type(obj).__name__};{";".join(sources)};{params}'
+
+    def _hashExecutable(self, path):
+        """
+        Return a `str` representing the path, modification time, and size of the executable in
+        *path* and the shared libraries it depends on.
+
+        The value is stored based on the modification time and size of the executable, so the
+        dependencies are determined once.
+        """
+        stat = os.stat(path)
+        key = (path, stat.st_mtime_ns, stat.st_size)
+        value = self._executables.get(key, None)
+        if value is None:
+            items = list()
+            for name in [path] + ResultCache._getDependencies(path):
+                try:
+                    stat = os.stat(name)
+                    items.append(f'{name}:{stat.st_mtime_ns}:{stat.st_size}')
+                except OSError:
+                    items.append(f'{name}:None')
+            value = ';'.join(items)
+            self._executables[key] = value
+        return value
+
+    @staticmethod
+    def _getDependencies(path):
+        """
+        Return the paths of the shared libraries that the executable in *path* depends on.
+
+        The libraries are listed with "ldd" on Linux and "otool -L" on macOS, an empty `list` is
+        returned if the information is not available (e.g., the executable is a script).
+        """
+        cmd = ['otool', '-L', path] if sys.platform == 'darwin' else ['ldd', path]
+        try:
+            out = subprocess.run(cmd,
+                                 stdout=subprocess.PIPE,
+                                 stderr=subprocess.DEVNULL,
+                                 universal_newlines=True,
+                                 timeout=10).stdout
+        except (OSError, subprocess.SubprocessError):
+            return list()
+
+        libs = list()
+        for line in out.splitlines():
+            for token in line.split():
+                if token.startswith('/') and (not token.endswith(':')) and (token != path):
+                    libs.append(token)
+        return sorted(set(libs))
+
+    def _hashFile(self, path):
+        """
+        Return the hash of the content of the file in *path*.
+
+        The hash is stored based on the modification time and size, so each file is read once.
+        """
+        stat = os.stat(path)
+        key = (path, stat.st_mtime_ns, stat.st_size)
+        value = self._files.get(key, None)
+        if value is None:
+            sha = hashlib.sha256()
+            with open(path, 'rb') as fid:
+                for chunk in iter(lambda: fid.read(1024 * 1024), b''):
+                    sha.update(chunk)
+            value = sha.hexdigest()
+            self._files[key] = value
+        return value
+
+    @staticmethod
+    def _toString(value):
+        """
+        Return a `str` representation of the parameter *value*, which must not include memory
+        addresses (e.g., the default `object.__repr__`).
+        """
+        if isinstance(value, InputParameters):
+            items = [f'{k}={ResultCache._toString(v)}' for k, v in value.items()]
+            return '{' + ','.join(items) + '}'
+        elif isinstance(value, MooseObject):
+            return f'{type(value).__name__}({value.name()})'
+        elif isinstance(value, (list, tuple, set)):
+            return '(' + ','.join(ResultCache._toString(v) for v in value) + ')'
+        elif isinstance(value, dict):
+            items = [f'{k}={ResultCache._toString(v)}' for k, v in sorted(value.items())]
+            return '{' + ','.join(items) + '}'
+        elif isinstance(value, (str, int, float, bool, enum.Enum)) or (value is None):
+            return repr(value)
+        return type(value).__name__
+
+    @staticmethod
+    def _getStrings(value):
+        """
+        Return the `str` values within the parameter *value*.
+        """
+        if isinstance(value, str):
+            yield value
+        elif isinstance(value, InputParameters):
+            for v in value.values():
+                yield from ResultCache._getStrings(v)
+        elif isinstance(value, (list, tuple)):
+            for v in value:
+                yield from ResultCache._getStrings(v)
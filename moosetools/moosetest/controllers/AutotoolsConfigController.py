@@ -39,6 +39,7 @@ class AutotoolsConfigController(Controller):
     """
     A base `Controller` to dictate if an object should run based on Autotools configuration file(s).
     """
+    STATIC = True
     RE_DEFINE = re.compile(r"#define\s+(?P<key>\S+)\s+(?P<value>.*?)#endif", flags=re.DOTALL)
 
     @staticmethod
@@ -22,6 +22,7 @@ class EnvironmentController(Controller):
     A controller to dictate if an object should run based on the environment.
     """
     AUTO_BUILD = True
+    STATIC = True
 
     @staticmethod
     def validParams():
@@ -19,6 +19,7 @@ class NameController(Controller):
     A controller to dictate if an object should run based on the name.
     """
     AUTO_BUILD = True
+    STATIC = True
 
     @staticmethod
     def validParams():
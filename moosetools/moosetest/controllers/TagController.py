@@ -16,6 +16,7 @@ class TagController(Controller):
     A controller to dictate if an object should run based on allowable tags.
     """
     AUTO_BUILD = True
+    STATIC = True
 
     @staticmethod
     def validParams():
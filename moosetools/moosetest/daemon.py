@@ -0,0 +1,222 @@
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+"""
+A long-lived local process that keeps `moosetools` imported and forks a process for each
+`moosetest` invocation.
+
+Importing `moosetools` (and the packages it depends on) dominates the startup time of `moosetest`.
+The daemon, started with `python -m moosetools.moosetest.daemon <socket>`, imports everything once
+and waits for requests on the Unix socket. For each request a process is forked that executes
+`moosetest.main` with the working directory, environment, arguments, and terminal (i.e., the
+standard file descriptors) of the client, see `serve` and `request`.
+
+The daemon executes the requests as the user that started it, so the socket is only accessible by
+that user and the requests of other users are rejected, see `serve`.
+
+The plugins (see MOOSETOOLS_PLUGIN_DIRS) are loaded by the forked process, so changes to them are
+used by the next invocation. If the source of `moosetools` changes the daemon exits, the client
+then executes as usual.
+
+This module only imports from the standard library at the module level, so the client does not
+pay the cost that the daemon avoids (see bin/moosetest).
+"""
+import os
+import sys
+import json
+import stat
+import socket
+import signal
+import struct
+import traceback
+import multiprocessing.reduction
+
+
+def request(address, argv, fds=(0, 1, 2)):
+    """
+    Execute `moosetest.main` with the arguments in *argv* by the daemon listening on the Unix socket
+    at *address*, returning the exit code.
+
+    The file descriptors in *fds* are used for stdin, stdout, and stderr of the process. `None` is
+    returned if the daemon is not available, in which case the caller should execute as usual.
+    """
+    if not hasattr(socket, 'AF_UNIX'):
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(address)
+    except OSError:
+        sock.close()
+        return None
+
+    previous = signal.getsignal(signal.SIGINT)
+    with sock, sock.makefile('r') as reader:
+        message = dict(argv=list(argv), cwd=os.getcwd(), env=dict(os.environ))
+        try:
+            multiprocessing.reduction.sendfds(sock, list(fds))
+            sock.sendall(json.dumps(message).encode() + b'\n')
+            reply = json.loads(reader.readline() or 'null')
+        except (OSError, ValueError):
+            return None
+        if not reply or ('pid' not in reply):
+            return None
+
+        # Interrupting the client interrupts the process executing the tests
+        pid = reply['pid']
+        signal.signal(signal.SIGINT, lambda *args: os.kill(pid, signal.SIGINT))
+        try:
+            reply = json.loads(reader.readline() or 'null')
+        except (OSError, ValueError):
+            reply = None
+        finally:
+            signal.signal(signal.SIGINT, previous)
+
+    return reply['returncode'] if reply else 1
+
+
+def serve(address, func=None):
+    """
+    Listen on the Unix socket at *address* and execute *func* for each `request`.
+
+    The *func* is called without arguments from a forked process, after the arguments, working
+    directory, environment, and file descriptors of the client are applied. It should return the
+    exit code, by default `moosetest.main` is used. The function returns when the source of the
+    imported `moosetools` modules changes.
+
+    The socket is created with permissions that only allow access by the owner. Where the user of
+    the client is available (i.e., "SO_PEERCRED" on Linux) requests from other users are rejected.
+    """
+    if func is None:
+        from moosetools import moosetest
+        func = moosetest.main
+    sources = _get_sources()
+
+    if os.path.exists(address):
+        os.remove(address)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    umask = os.umask(0o177)  # the socket is created with the permissions, so there is no window
+    try:
+        server.bind(address)
+    finally:
+        os.umask(umask)
+    os.chmod(address, stat.S_IRUSR | stat.S_IWUSR)
+    server.listen()
+    server.settimeout(1)
+    signal.signal(signal.SIGTERM, lambda *args: sys.exit(0))  # so the socket is removed
+    try:
+        while True:
+            _reap()
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:
+                continue
+
+            with conn:
+                conn.settimeout(None)
+                uid = _get_peer_uid(conn)
+                if (uid is not None) and (uid != os.getuid()):
+                    continue
+                if _get_sources() != sources:
+                    conn.sendall(b'{"stale": true}\n')
+                    break
+                if os.fork() == 0:
+                    server.close()
+                    os._exit(_execute(conn, func))
+    finally:
+        server.close()
+        if os.path.exists(address):
+            os.remove(address)
+
+
+def _execute(conn, func):
+    """
+    Execute the *func* for the request on the connection *conn*, see `serve`.
+    """
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    try:
+        fds = multiprocessing.reduction.recvfds(conn, 3)
+        with conn.makefile('r') as reader:
+            message = json.loads(reader.readline())
+        for fd, target in zip(fds, (0, 1, 2)):
+            os.dup2(fd, target)
+            os.close(fd)
+        sys.stdin = open(0, 'r', closefd=False)
+        sys.stdout = open(1, 'w', buffering=1, closefd=False)
+        sys.stderr = open(2, 'w', buffering=1, closefd=False)
+        os.chdir(message['cwd'])
+        os.environ.clear()
+        os.environ.update(message['env'])
+        sys.argv = message['argv']
+        conn.sendall(json.dumps(dict(pid=os.getpid())).encode() + b'\n')
+    except Exception:
+        traceback.print_exc()
+        return 1
+
+    try:
+        returncode = func()
+    except SystemExit as e:
+        returncode = e.code if isinstance(e.code, int) else int(e.code is not None)
+    except BaseException:
+        traceback.print_exc()
+        returncode = 1
+
+    try:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        conn.sendall(json.dumps(dict(returncode=returncode or 0)).encode() + b'\n')
+    except OSError:
+        pass
+    return 0
+
+
+def _get_peer_uid(conn):
+    """
+    Return the user identifier of the process connected to the socket *conn*.
+
+    `None` is returned if the information is not available (i.e., "SO_PEERCRED" is Linux only), in
+    which case the permissions of the socket limit access, see `serve`.
+    """
+    if not hasattr(socket, 'SO_PEERCRED'):
+        return None
+    size = struct.calcsize('3i')
+    _, uid, _ = struct.unpack('3i', conn.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, size))
+    return uid
+
+
+def _reap():
+    """
+    Collect the exit status of the finished processes created by `serve`.
+    """
+    try:
+        while os.waitpid(-1, os.WNOHANG)[0] > 0:
+            pass
+    except ChildProcessError:
+        pass
+
+
+def _get_sources():
+    """
+    Return the modification times of the source files of the imported `moosetools` modules.
+    """
+    out = dict()
+    for name, module in list(sys.modules.items()):
+        filename = getattr(module, '__file__', None)
+        if name.startswith('moosetools') and filename:
+            try:
+                out[filename] = os.stat(filename).st_mtime_ns
+            except OSError:
+                out[filename] = None
+    return out
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 2:
+        print(f"usage: {sys.executable} -m moosetools.moosetest.daemon <socket>")
+        sys.exit(1)
+    serve(sys.argv[1])
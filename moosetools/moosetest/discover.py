@@ -8,6 +8,8 @@
 #* https://www.gnu.org/licenses/lgpl-2.1.html
 
 import os
+import json
+import fnmatch
 import inspect
 import importlib
 import concurrent.futures
@@ -45,11 +47,32 @@ class MooseTestFactory(factory.Factory):
                         "`dict` of parameter names and values."))
         return params
 
+    def __init__(self, *args, **kwargs):
+        factory.Factory.__init__(self, *args, **kwargs)
+        self._templates = dict()  # parameters for each type, see `params`
+
     def params(self, name):
         """
         Creates the parameters with sub-parameters for each `Controller` object.
+
+        The parameters are created once for each type, subsequent calls return a copy (see
+        `InputParameters.copy`).
+        """
+        template = self._templates.get(name)
+        if template is None:
+            template = self._createParams(name)
+            if template is None:
+                return None
+            self._templates[name] = template
+        return template.copy()
+
+    def _createParams(self, name):
+        """
+        Return the parameters for the registered *name*, see `params`.
         """
         params = factory.Factory.params(self, name)
+        if params is None:
+            return None
 
         # Add defaults, if any
         object_defaults = self.getParam('object_defaults')
@@ -87,18 +110,117 @@ class MooseTestFactory(factory.Factory):
         return factory.Factory.create(self, otype, params)
 
 
+def find_spec_files(start,
+                    spec_file_names,
+                    *,
+                    prune=('.git', '.svn', '.hg', '__pycache__'),
+                    prune_repositories=True,
+                    n_threads=None,
+                    index=None):
+    """
+    Return the files with a name in *spec_file_names* by recursively searching from the *start*
+    directory.
+
+    The directories with a name that matches a pattern in *prune* (see `fnmatch`) are not searched.
+    If *prune_repositories* is enabled, directories other than *start* that contain a ".git" file
+    or directory (i.e., a nested repository or submodule) are not searched. Symbolic links to
+    directories are not followed.
+
+    The directories are read using a thread pool, with the number of threads provided in
+    *n_threads*. The *index* is a `moosetest.index.DirectoryIndex` object, if provided, the content
+    of directories with a modification time that matches the stored value are not read again. The
+    content for this search is stored in the object upon completion.
+
+    The files are returned in the order of a depth-first search with the directory content sorted
+    by name, files before sub-directories.
+    """
+    start = os.path.abspath(start)
+    names = set(spec_file_names)
+    if index is not None:
+        index.prepare(json.dumps([start, sorted(names), sorted(prune), prune_repositories]))
+
+    def scan(relpath):
+        path = os.path.join(start, relpath)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return relpath, None
+
+        entry = index.get(relpath) if (index is not None) else None
+        if (entry is not None) and (entry[0] == mtime):
+            return relpath, entry
+
+        try:
+            with os.scandir(path) as it:
+                items = list(it)
+        except OSError:
+            return relpath, (mtime, [], [])
+
+        if prune_repositories and relpath and any(item.name == '.git' for item in items):
+            return relpath, (mtime, [], [])
+
+        files = list()
+        dirs = list()
+        for item in items:
+            try:
+                is_dir = item.is_dir()
+            except OSError:
+                is_dir = False
+            if not is_dir:
+                if item.name in names:
+                    files.append(item.name)
+            elif (not item.is_symlink()) and (not any(
+                    fnmatch.fnmatch(item.name, pattern) for pattern in prune)):
+                dirs.append(item.name)
+        return relpath, (mtime, sorted(files), sorted(dirs))
+
+    # Read the directories in parallel, sub-directories are submitted as each directory is read
+    entries = dict()
+    with concurrent.futures.ThreadPoolExecutor(n_threads) as pool:
+        pending = {pool.submit(scan, '')}
+        while pending:
+            done, pending = concurrent.futures.wait(pending,
+                                                    return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                relpath, entry = future.result()
+                if entry is not None:
+                    entries[relpath] = entry
+                    for name in entry[2]:
+                        pending.add(pool.submit(scan, os.path.join(relpath, name)))
+
+    if index is not None:
+        index.update(entries)
+
+    # Build the list in depth-first order
+    spec_files = list()
+    stack = ['']
+    while stack:
+        relpath = stack.pop()
+        if relpath in entries:
+            _, files, dirs = entries[relpath]
+            spec_files += [os.path.join(start, relpath, f) for f in files]
+            stack += [os.path.join(relpath, d) for d in reversed(dirs)]
+    return spec_files
+
+
 def discover(start,
              controllers,
              spec_file_names,
              *,
              object_defaults=None,
              plugin_dirs=None,
-             n_threads=None):
+             n_threads=None,
+             prune=('.git', '.svn', '.hg', '__pycache__'),
+             prune_repositories=True,
+             index=None,
+             spec_cache_file=None,
+             manifest_file=None):
     """
     Return groups of `Runner` objects to execute by recursively searching from the *start* directory.
 
     The directories are searched for file names that match those in the  *spec_file_names*
-    (e.g., ['tests', 'examples']).
+    (e.g., ['tests', 'examples']). See `find_spec_files` for the *prune*, *prune_repositories*, and
+    *index* arguments.
 
     The types of objects created must have a parent class of `Runner` or `Differ` and able to loaded
     from the loaded python paths or within the paths provided in *plugin_dirs*. When the objects
@@ -106,21 +228,30 @@ def discover(start,
 
     The parsing of the files occurs within a thread pool, with the given number of threads provided
     in *n_threads*. If not provide the default is used from `concurrent.futures.ThreadPoolExecutor`.
+    The content of the files is stored in *spec_cache_file*, if provided, so unchanged files are not
+    parsed by subsequent calls (see the 'cache_file' parameter of `factory.Parser`). Similarly, the
+    location of the object types is stored in *manifest_file*, if provided (see the 'manifest_file'
+    parameter of `factory.Factory`).
     """
     # Create a list of files
-    spec_files = list()
-    for root, _, files in os.walk(start):
-        spec_files += [os.path.join(root, f) for f in files if f in spec_file_names]
+    start = os.path.abspath(start)
+    spec_files = find_spec_files(start,
+                                 spec_file_names,
+                                 prune=prune,
+                                 prune_repositories=prune_repositories,
+                                 n_threads=n_threads,
+                                 index=index)
 
     # Factory for creating the test objects
     obj_factory = MooseTestFactory(plugin_dirs=tuple(plugin_dirs),
                                    plugin_types=(Runner, Differ),
                                    controllers=tuple(controllers or []),
-                                   object_defaults=object_defaults or dict())
+                                   object_defaults=object_defaults or dict(),
+                                   manifest_file=manifest_file)
     obj_factory.load()
 
     # Build objects
-    obj_parser = factory.Parser(obj_factory)
+    obj_parser = factory.Parser(obj_factory, cache_file=spec_cache_file)
     groups = obj_parser.parse(spec_files)
 
     # Add Differs to Runner
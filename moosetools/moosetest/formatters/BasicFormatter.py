@@ -100,6 +100,11 @@ class BasicFormatter(Formatter):
                    default=5,
                    vtype=int,
                    doc="Print the given number of the longest running test cases.")
+        params.add('print_resource_usage_tests',
+                   default=5,
+                   vtype=int,
+                   doc="Print the given number of test cases with the highest CPU time and " \
+                       "memory, if the resource usage is available (see Runner.getResourceUsage).")
         return params
 
     @staticmethod
@@ -232,6 +237,28 @@ class BasicFormatter(Formatter):
                 if shown > longest:
                     break
 
+        # Highest resource usage tests, this is only available for some Runner objects
+        count = self.getParam('print_resource_usage_tests')
+        if (count is not None) and (count > 0):
+            usage = list()
+            for tc in complete:
+                data = tc.results.get(tc.name(), None) if tc.results else None
+                if (data is not None) and data.usage:
+                    usage.append((tc, data.usage))
+
+            cpu = [(u['user_time'] + u.get('system_time', 0), tc) for tc, u in usage
+                   if u.get('user_time') is not None]
+            if cpu:
+                out.append('\nHighest CPU time test(s):')
+                for t, tc in sorted(cpu, key=lambda x: x[0], reverse=True)[:count]:
+                    out.append(f'  {t:.2f}s {tc.name()}')
+
+            mem = [(u['max_rss'], tc) for tc, u in usage if u.get('max_rss') is not None]
+            if mem:
+                out.append('\nHighest memory test(s):')
+                for m, tc in sorted(mem, key=lambda x: x[0], reverse=True)[:count]:
+                    out.append(f'  {m:.1f}MB {tc.name()}')
+
         return '\n'.join(out)
 
     def _formatProgress(self, **kwargs):
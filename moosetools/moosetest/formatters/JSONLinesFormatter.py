@@ -0,0 +1,86 @@
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import os
+import json
+from .BasicFormatter import BasicFormatter
+
+
+class JSONLinesFormatter(BasicFormatter):
+    """
+    A `Formatter` that writes the results of each `TestCase` to a JSON Lines file, in addition to
+    the output of the `BasicFormatter`.
+
+    Each line of the file is a JSON object with the results of a single `TestCase`, which is
+    written and flushed as soon as the results are reported. Thus, memory use does not increase with
+    the number of tests and the results of the finished tests are available if the run is stopped.
+    """
+    @staticmethod
+    def validParams():
+        params = BasicFormatter.validParams()
+        params.add('filename',
+                   vtype=str,
+                   default='moosetest.jsonl',
+                   doc="The JSON Lines file to create, the file is overwritten if it exists.")
+        return params
+
+    def __init__(self, *args, **kwargs):
+        BasicFormatter.__init__(self, *args, **kwargs)
+        self._file = None
+
+    def reportResults(self, tc_obj):
+        """
+        Print the results of the `TestCase` in *tc_obj* and write them to the file. (override)
+        """
+        BasicFormatter.reportResults(self, tc_obj)
+        self._open()
+        self._file.write(json.dumps(JSONLinesFormatter.toDict(tc_obj)) + '\n')
+        self._file.flush()
+
+    def reportComplete(self, complete, start_time):
+        """
+        Close the file and return the summary output of the `BasicFormatter`. (override)
+        """
+        self._open()
+        self._file.close()
+        self._file = None
+        return BasicFormatter.reportComplete(self, complete, start_time)
+
+    @staticmethod
+    def toDict(tc_obj):
+        """
+        Return a `dict` containing the results of the finished `TestCase` in *tc_obj*.
+        """
+        results = dict()
+        for name, data in tc_obj.results.items():
+            results[name] = {
+                'state': data.state.name if data.state is not None else None,
+                'returncode': data.returncode,
+                'reasons': data.reasons,
+                'stdout': data.stdout,
+                'stderr': data.stderr,
+                'usage': data.usage
+            }
+        return {
+            'name': tc_obj.name(),
+            'state': tc_obj.state.name,
+            'time': tc_obj.time,
+            'results': results
+        }
+
+    def _open(self):
+        """
+        Open the file for writing, if it is not already open.
+        """
+        if self._file is None:
+            filename = self.getParam('filename')
+            dirname = os.path.dirname(filename)
+            if dirname:
+                os.makedirs(dirname, exist_ok=True)
+            self._file = open(filename, 'w', encoding='utf-8')
@@ -0,0 +1,142 @@
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import os
+import re
+import datetime
+from xml.sax.saxutils import escape, quoteattr
+from moosetools.moosetest.base import TestCase
+from .BasicFormatter import BasicFormatter
+
+
+class JUnitFormatter(BasicFormatter):
+    """
+    A `Formatter` that writes the results of each `TestCase` to a JUnit XML file, in addition to the
+    output of the `BasicFormatter`.
+
+    Each `TestCase` is written as a "testcase" element and flushed as soon as the results are
+    reported. The closing tags are written after each element and replaced by the next element,
+    thus the file is valid XML containing the finished tests if the run is stopped.
+
+    The "classname" is the part of the `TestCase` name prior to the ":" (i.e., the test
+    specification file) and the "name" is the remainder. A state of `TestCase.Result.SKIP` or
+    `TestCase.Result.REMOVE` is reported as skipped, states with a level greater than zero are
+    reported as a failure, except for `TestCase.Result.EXCEPTION` and `TestCase.Result.FATAL` that
+    are reported as an error.
+    """
+    #: Characters that are not allowed in XML 1.0 documents
+    _INVALID_XML_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]')
+
+    @staticmethod
+    def validParams():
+        params = BasicFormatter.validParams()
+        params.add('filename',
+                   vtype=str,
+                   default='moosetest.xml',
+                   doc="The JUnit XML file to create, the file is overwritten if it exists.")
+        params.add('suite_name',
+                   vtype=str,
+                   default='moosetest',
+                   doc="The name of the test suite that contains the test cases.")
+        return params
+
+    def __init__(self, *args, **kwargs):
+        BasicFormatter.__init__(self, *args, **kwargs)
+        self._file = None
+        self._position = None  # location of the closing tags, see `_write`
+
+    def reportResults(self, tc_obj):
+        """
+        Print the results of the `TestCase` in *tc_obj* and write them to the file. (override)
+        """
+        BasicFormatter.reportResults(self, tc_obj)
+        self._write(JUnitFormatter.toXML(tc_obj))
+
+    def reportComplete(self, complete, start_time):
+        """
+        Close the file and return the summary output of the `BasicFormatter`. (override)
+        """
+        self._write('')
+        self._file.close()
+        self._file = None
+        return BasicFormatter.reportComplete(self, complete, start_time)
+
+    @staticmethod
+    def toXML(tc_obj):
+        """
+        Return the "testcase" element, as a `str`, for the finished `TestCase` in *tc_obj*.
+        """
+        classname, _, name = tc_obj.name().rpartition(':')
+        attrs = f'name={JUnitFormatter._attr(name)} classname={JUnitFormatter._attr(classname)}'
+        out = [f'    <testcase {attrs} time="{tc_obj.time or 0:.3f}">']
+
+        state = tc_obj.state
+        reasons = list()
+        stdout = list()
+        stderr = list()
+        for data in tc_obj.results.values():
+            reasons += data.reasons or list()
+            if data.stdout:
+                stdout.append(data.stdout)
+            if data.stderr:
+                stderr.append(data.stderr)
+
+        message = JUnitFormatter._attr(', '.join(reasons) or state.text)
+        if state in (TestCase.Result.SKIP, TestCase.Result.REMOVE):
+            out.append(f'      <skipped message={message}/>')
+        elif state in (TestCase.Result.EXCEPTION, TestCase.Result.FATAL):
+            out.append(f'      <error message={message} type="{state.name}"/>')
+        elif state.level > 0:
+            out.append(f'      <failure message={message} type="{state.name}"/>')
+
+        if stdout:
+            out.append(f'      <system-out>{JUnitFormatter._text(stdout)}</system-out>')
+        if stderr:
+            out.append(f'      <system-err>{JUnitFormatter._text(stderr)}</system-err>')
+        out.append('    </testcase>\n')
+        return '\n'.join(out)
+
+    def _write(self, text):
+        """
+        Write the *text* to the file followed by the closing tags, the file is opened if needed.
+
+        The closing tags are overwritten by the next call, so the file is always complete.
+        """
+        if self._file is None:
+            filename = self.getParam('filename')
+            dirname = os.path.dirname(filename)
+            if dirname:
+                os.makedirs(dirname, exist_ok=True)
+            timestamp = datetime.datetime.now().isoformat(timespec='seconds')
+            self._file = open(filename, 'wb')
+            self._file.write(b'<?xml version="1.0" encoding="UTF-8"?>\n<testsuites>\n')
+            self._file.write(f'  <testsuite name={self._attr(self.getParam("suite_name"))} ' \
+                             f'timestamp="{timestamp}">\n'.encode('utf-8'))
+            self._position = self._file.tell()
+
+        self._file.seek(self._position)
+        self._file.truncate()
+        self._file.write(text.encode('utf-8'))
+        self._position = self._file.tell()
+        self._file.write(b'  </testsuite>\n</testsuites>\n')
+        self._file.flush()
+
+    @staticmethod
+    def _attr(text):
+        """
+        Return the *text* as a quoted XML attribute value.
+        """
+        return quoteattr(JUnitFormatter._INVALID_XML_CHARS.sub('', text))
+
+    @staticmethod
+    def _text(items):
+        """
+        Return the `list` of `str` *items* joined and escaped for XML element content.
+        """
+        return escape(JUnitFormatter._INVALID_XML_CHARS.sub('', '\n'.join(items)))
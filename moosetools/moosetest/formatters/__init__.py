@@ -8,3 +8,5 @@
 #* https://www.gnu.org/licenses/lgpl-2.1.html
 
 from .BasicFormatter import shorten_line, shorten_text, ShortenMode, BasicFormatter
+from .JSONLinesFormatter import JSONLinesFormatter
+from .JUnitFormatter import JUnitFormatter
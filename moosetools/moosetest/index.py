@@ -0,0 +1,98 @@
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+from moosetools import mooseutils
+
+
+class DirectoryIndex(object):
+    """
+    Persistent storage of the contents of the directories searched for test specification files,
+    keyed by the path of the directory relative to the search location.
+
+    Each entry contains the modification time of the directory, the names of the specification
+    files, and the names of the sub-directories to search. A directory with an unchanged
+    modification time does not need to be read again, see `moosetest.discover.find_spec_files` for
+    use.
+
+    The entries are loaded from the JSON file in *filename*, if it exists, and written to the same
+    file with the `save` method. If *filename* is `None` the entries are only stored in memory.
+    """
+
+    #: Version of the file format, increment this when the content changes such that existing
+    #  files are invalidated.
+    VERSION = 1
+
+    def __init__(self, filename=None):
+        self._filename = filename
+        data = mooseutils.load_data_file(filename, DirectoryIndex._convert, 'directory index')
+        self._signature, self._entries = data or (None, dict())
+
+    @staticmethod
+    def _convert(data):
+        """
+        Return the signature and entries from the content of the file, `None` if the version
+        differs.
+        """
+        if data.get('version') == DirectoryIndex.VERSION:
+            entries = {
+                str(k): (int(v[0]), list(v[1]), list(v[2]))
+                for k, v in data['directories'].items()
+            }
+            return data['signature'], entries
+        return None
+
+    @property
+    def filename(self):
+        """
+        Return the filename used for storing the entries.
+        """
+        return self._filename
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, path):
+        return path in self._entries
+
+    def prepare(self, signature):
+        """
+        Remove the stored entries if the `str` *signature* differs from the stored value.
+
+        The *signature* should represent the search settings (e.g., the start directory and the
+        names of the specification files), so the entries are not used for a different search.
+        """
+        if signature != self._signature:
+            self._entries.clear()
+            self._signature = signature
+
+    def get(self, path, default=None):
+        """
+        Return the stored modification time, the `list` of file names, and the `list` of
+        sub-directory names for the directory *path*, *default* if it does not exist.
+        """
+        return self._entries.get(path, default)
+
+    def update(self, entries):
+        """
+        Replace the stored entries with the `dict` *entries*, see `get` for the content.
+        """
+        self._entries = dict(entries)
+
+    def save(self):
+        """
+        Write the stored entries to the file supplied upon construction, see
+        `mooseutils.save_data_file`.
+        """
+        if self._filename is not None:
+            data = {
+                'version': DirectoryIndex.VERSION,
+                'signature': self._signature,
+                'directories': self._entries
+            }
+            mooseutils.save_data_file(self._filename, data)
@@ -105,7 +105,9 @@ def _make_harness(filename, root, controllers, formatter, object_defaults):
             os.path.abspath(mooseutils.eval_path(path))
             for path in os.getenv('MOOSETOOLS_PLUGIN_DIRS', '').split()
         ]
-    h_factory = factory.Factory(plugin_dirs=tuple(plugin_dirs), plugin_types=(base.TestHarness, ))
+    h_factory = factory.Factory(plugin_dirs=tuple(plugin_dirs),
+                                plugin_types=(base.TestHarness, ),
+                                manifest_file=os.getenv('MOOSETOOLS_FACTORY_MANIFEST'))
     h_factory.load()
     if h_factory.status() > 0:
         msg = "An error occurred during registration of the TestHarness type, see console message(s) for details."
@@ -146,7 +148,9 @@ def _make_controllers(filename, root):
             os.path.abspath(mooseutils.eval_path(path))
             for path in os.getenv('MOOSETOOLS_PLUGIN_DIRS', '').split()
         ]
-    c_factory = factory.Factory(plugin_dirs=tuple(plugin_dirs), plugin_types=(base.Controller, ))
+    c_factory = factory.Factory(plugin_dirs=tuple(plugin_dirs),
+                                plugin_types=(base.Controller, ),
+                                manifest_file=os.getenv('MOOSETOOLS_FACTORY_MANIFEST'))
     c_factory.load()
     if c_factory.status() > 0:
         msg = "An error occurred registering the Controller type, see console message(s) for details."
@@ -191,7 +195,9 @@ def _make_formatter(filename, root):
             os.path.abspath(mooseutils.eval_path(path))
             for path in os.getenv('MOOSETOOLS_PLUGIN_DIRS', '').split()
         ]
-    f_factory = factory.Factory(plugin_dirs=tuple(plugin_dirs), plugin_types=(base.Formatter, ))
+    f_factory = factory.Factory(plugin_dirs=tuple(plugin_dirs),
+                                plugin_types=(base.Formatter, ),
+                                manifest_file=os.getenv('MOOSETOOLS_FACTORY_MANIFEST'))
     f_factory.load()
     if f_factory.status() > 0:
         msg = "An error occurred registering the Formatter type, see console message(s) for details."
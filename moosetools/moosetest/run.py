@@ -10,15 +10,18 @@
 import os
 import sys
 import time
-import traceback
-import queue
-import platform
-import concurrent.futures
+import heapq
+import signal
+import asyncio
+import itertools
 import threading
+import traceback
+import contextlib
 import multiprocessing
-import time
-import enum
+import multiprocessing.connection
+from moosetools.parameters import InputParameters
 from moosetools.moosetest.base import TestCase
+from moosetools.moosetest.scheduler import Scheduler
 
 # By default macOS use 'spawn' for creating processes. However, I had problems with the following
 # warning being produced. I couldn't figure out that root cause of the warning with respect to the
@@ -28,6 +31,17 @@ from moosetools.moosetest.base import TestCase
 # UserWarning: resource_tracker: There appear to be 5 leaked semaphore objects to clean up at shutdown
 MULTIPROCESSING_CONTEXT = 'fork'
 
+# The number of seconds the busy workers are given to exit when interrupted, see `run`
+INTERRUPT_TIMEOUT = 2
+
+# The number of seconds past the timeout that a concurrent worker, which enforces the timeout itself,
+# is allowed before it is stopped by the root process, see `_Worker`
+CONCURRENT_TIMEOUT_MARGIN = 2
+
+# The signals, in addition to SIGINT, that are forwarded to the busy workers, see `run`
+TERMINATE_SIGNALS = tuple(
+    getattr(signal, name) for name in ('SIGTERM', 'SIGHUP') if hasattr(signal, name))
+
 
 def run(groups,
         controllers,
@@ -37,90 +51,277 @@ def run(groups,
         timeout=None,
         max_fails=sys.maxsize,
         min_fail_state=TestCase.Result.TIMEOUT,
-        method=None):
+        method=None,
+        timing=None,
+        max_memory=None,
+        soft_limit=True,
+        async_commands=False,
+        cache=None):
     """
     Primary function for running tests.
 
-    The *groups* is a `list` of `list` of `Runner` object to be executed. The outer list is
-    distributed for execution using a process pool. The inner list is executed sequentially within
-    that pool.
+    The *groups* is a `list` of `list` of `Runner` object to be executed. Each `Runner` is
+    distributed for execution to a worker process as soon as it is ready, that is when all the
+    tests listed in the 'requires' parameter have passed. The names in the 'requires' parameter
+    refer to the `Runner` objects within the same inner list (see `moosetest.scheduler.Scheduler`),
+    otherwise the inner lists have no impact on the execution order. The `Runner` objects that
+    expect to create or modify the same files are executed one at a time, as are the objects with
+    the same 'working_dir' parameter if the 'allow_parallel' parameter is disabled.
 
     The *controllers* is a list of `Controller` objects to be used during execution. The
     sub-parameters for each should already be injected into the `Runner` objects (i.e., they
-    should be created with the `make_runner` function).
+    should be created with the `make_runner` function). The static `Controller` objects (see
+    `Controller.STATIC`) are evaluated for each `Runner` prior to execution in the root process,
+    tests that are skipped or removed as a result are reported without being sent to a worker.
 
     The *formatter* is a `Formatter` object used to format all output of progress and results.
 
-    The process pool will execute with *n_threads*, if provided, otherwise it will utilize the
-    number returned by `os.cpu_count`. Each `Runner` object will execute and wait for *timeout*
-    seconds to complete, before a timeout error is produced. Execution will continue until all
-    objects had executed or timeout, unless the number of failures exceeds *max_fails*. If this
-    is triggered all running objects will continue to run and all objects waiting will be canceled.
+    Execution will use *n_threads* worker processes, if provided, otherwise it will utilize the
+    number returned by `os.cpu_count`. The processes are reused for each `Runner`, a process is
+    only replaced if it is stopped due to a timeout or exits unexpectedly. The working directory,
+    environment variables, `sys.path`, imported modules, umask, and signal handlers of a process are
+    restored after each `Runner` (see `_worker_main`), other changes made to the process by a
+    `Runner` or `Differ` remain for the next object. Each `Runner` object will execute and wait for
+    *timeout* seconds to complete, before a timeout error is produced. Execution will continue until
+    all objects had executed or timeout, unless the number of failures exceeds *max_fails*. If this
+    is triggered the running objects are stopped, including the commands that they started, and
+    all objects not finished are reported as skipped. If the process is interrupted (SIGINT) or
+    terminated (SIGTERM or SIGHUP) the signal is forwarded to the running objects, which are given
+    `INTERRUPT_TIMEOUT` seconds to exit before they are stopped.
+
+    The *timing* is a `moosetest.timing.TimingStore` object that contains the execution time of
+    previous runs. If provided, the ready `Runner` objects with the longest expected execution time
+    are executed first. New tests, without a stored time, are expected to require *timeout*
+    seconds. The times for this run are stored in the object upon completion.
+
+    The 'cores' and 'memory' parameters of the `Runner` objects define the resources required for
+    execution. The `Runner` objects are only executed simultaneously if the total cores do not
+    exceed *n_threads* and the total memory (in MB) does not exceed *max_memory*, which defaults to
+    the physical memory of the machine. If *soft_limit* is enabled, objects requiring more than
+    the available resources execute when nothing else is running, otherwise they are skipped.
+
+    If *async_commands* is enabled, the `Runner` objects that define a command (see
+    `Runner.getCommand`) are executed concurrently by a single worker process using `asyncio`
+    rather than requiring a worker process for each `Runner`. The number of these objects executed
+    simultaneously remains limited by the available cores.
+
+    The *cache* is a `moosetest.cache.ResultCache` object that contains the fingerprints of tests
+    that passed in previous runs. If provided, a `Runner` with a fingerprint identical to a
+    previous passing run is reported as passing without being executed. The fingerprints for
+    this run are stored in the object upon completion.
 
     The function will return 1 if any test case has a state with a level greater than
     *min_fail_state*, otherwise a 0 is returned.
     """
-    if platform.python_version() < '3.7':
+    if sys.version_info < (3, 7):
         raise RuntimeError("Python 3.7 or greater required.")
 
     # Capture for computing the total execution time for all test cases
     start_time = time.time()
 
-    # Arguments that will be passed to the `TestCase` object created
-    tc_kwargs = dict()
-    tc_kwargs['controllers'] = controllers
-    tc_kwargs['min_fail_state'] = min_fail_state
+    # The parameters of the `TestCase` objects, which are copied for each object (see
+    # `InputParameters.copy`). The arguments that are the same for all objects are the defaults, so
+    # they are not included when the objects are sent to a worker process (see `_Worker.submit`).
+    params = TestCase.validParams()
+    params.setDefault('controllers', controllers)
+    params.setDefault('min_fail_state', min_fail_state)
 
-    # Setup process pool, the result_map is used to collecting results returned from workers
-    ctx = multiprocessing.get_context(MULTIPROCESSING_CONTEXT)
-    manager = ctx.Manager()
-    executor = concurrent.futures.ProcessPoolExecutor(mp_context=ctx, max_workers=n_threads)
-
-    futures = list()  # pool workers
+    # Create the TestCase objects and the Scheduler that determines the order of execution. The
+    # TestCase objects that will not execute, as determined by the static Controller objects, are
+    # resolved by the Scheduler without being executed.
     testcases = dict()  # unique_id to TestCase object
-    readers = list()
+    tc_groups = list()
+    pruned = dict()  # unique_id to (state, results) of TestCase objects that will not execute
     for runners in groups:
-        result_send = manager.Queue()
-        readers.append(result_send)
-        local = [TestCase(runner=runner, **tc_kwargs) for runner in runners]
-        futures.append(executor.submit(_execute_testcases, local, result_send, timeout))
-        testcases.update({tc.unique_id: tc for tc in local})
+        local = [TestCase(params.copy(), runner=runner) for runner in runners]
+        for tc in local:
+            testcases[tc.unique_id] = tc
+            out = tc.evaluateControllers()
+            if out is not None:
+                pruned[tc.unique_id] = out
+        tc_groups.append(local)
+    n_workers = n_threads or os.cpu_count()
+    max_memory = max_memory or _get_physical_memory()
+    scheduler = Scheduler(tc_groups,
+                          durations=timing,
+                          default_duration=timeout or 0,
+                          max_cores=n_workers,
+                          max_memory=max_memory,
+                          soft_limit=soft_limit,
+                          resolved=pruned)
+
+    # The persistent workers, which are created as needed. Each worker executes one TestCase at a
+    # time, which is sent by the root process when the TestCase is ready and the required resources
+    # are available, such that the Scheduler is in control of the order of execution. A worker is
+    # only replaced if it is stopped due to a timeout or it exits unexpectedly. If *async_commands*
+    # is enabled, a single worker executes all the TestCase objects with a command concurrently.
+    ctx = multiprocessing.get_context(MULTIPROCESSING_CONTEXT)
+    workers = list()
 
-    # Loop until the Future objects are complete
+    # Loop until all the TestCase objects are complete. The root process sleeps until a result
+    # arrives, a timeout expires, or the progress interval expires, at which time the progress of
+    # running test cases is reported.
+    cores_used = 0
+    memory_used = 0
     n_fails = 0
-    while any(f.running() for f in futures):
-        for reader in readers:
-            try:
-                unique_id, progress, state, results = reader.get_nowait()
-                tc = testcases.get(unique_id)
-                _report_progress_and_results(tc, formatter, progress, state, results)
-                if tc.finished:
+    fingerprints = dict()  # unique_id to fingerprint, see `moosetest.cache.ResultCache`
+
+    # The running TestCase objects are stored in a heap, ordered by the time (in the `time.time`
+    # units used by `Formatter.reportProgress`) that the next progress message is due. Thus, the
+    # progress is only checked for objects that need to report and the loop only wakes up as needed.
+    progress_interval = formatter.getParam('progress_interval')
+    progress_heap = list()  # (time, count, TestCase)
+    progress_count = itertools.count()  # unique second item, so TestCase objects are not compared
+    terminated = None  # the `_Terminated` exception, if a signal in TERMINATE_SIGNALS is received
+    _install_signal_handlers()
+    try:
+        while True:
+
+            # Report TestCase objects that finished without executing (e.g., failed dependency),
+            # which may cause other TestCase objects to do the same
+            resolved = scheduler.resolved()
+            while resolved:
+                for tc, state, results in resolved:
+                    _report_progress_and_results(tc, formatter, TestCase.Progress.FINISHED, state,
+                                                 results)
                     n_fails += int(tc.state.level >= min_fail_state.level)
-            except queue.Empty:
-                pass
-
-            for tc in filter(lambda obj: obj.running, testcases.values()):
-                formatter.reportProgress(tc)
-
-        if n_fails >= max_fails:
-            for f in futures:
-                f.cancel()
-
-    # Shutdown the pool of workers.
-    executor.shutdown()
-
-    # Raise any exceptions from Future objects
-    for f_obj in filter(lambda f: not f.cancelled(), futures):
-        exc = f_obj.exception()
-        if exc is not None:
-            raise exc
-
-    # Report any messages that remain in the Queues
-    while any(not r.empty() for r in readers):
-        for reader in [r for r in readers if not r.empty()]:
-            unique_id, progress, state, results = reader.get_nowait()
-            tc = testcases.get(unique_id)
-            _report_progress_and_results(tc, formatter, progress, state, results)
+                    scheduler.finish(tc)
+                resolved = scheduler.resolved()
+
+            # Submit the TestCase objects that are ready, unless max failures has been reached. The
+            # number of workers never exceeds the number of cores because each TestCase requires at
+            # least one core.
+            while (n_fails < max_fails) and (cores_used < n_workers):
+                memory_available = (max_memory - memory_used) if (max_memory is not None) else None
+                tc = scheduler.pop(n_workers - cores_used, memory_available)
+                if tc is None:
+                    break
+
+                # Report the TestCase as passing if it is unchanged since a previous passing run
+                if cache is not None:
+                    fingerprints[tc.unique_id] = cache.fingerprint(tc)
+                    if cache.check(tc, fingerprints[tc.unique_id]):
+                        results = {
+                            tc.name(): TestCase.Data(TestCase.Result.PASS, None, '', '', ['cached'])
+                        }
+                        _report_progress_and_results(tc, formatter, TestCase.Progress.FINISHED,
+                                                     TestCase.Result.PASS, results)
+                        scheduler.finish(tc)
+                        continue
+
+                resources = scheduler.resources(tc)
+                cores_used += resources[0]
+                memory_used += resources[1]
+                concurrent = async_commands and (tc.runner.getCommand() is not None)
+                worker = _get_worker(workers, ctx, concurrent)
+                worker.submit(tc, timeout, resources)
+                _report_progress_and_results(tc, formatter, TestCase.Progress.RUNNING, None, None)
+                heapq.heappush(progress_heap,
+                               (tc.start_time + progress_interval, next(progress_count), tc))
+
+            # Nothing is running and nothing more can be submitted
+            busy = [w for w in workers if w.busy]
+            if not busy:
+                break
+
+            # Wait for a result, a timeout to expire, or the next progress message to be due
+            while progress_heap and (not progress_heap[0][2].running):
+                heapq.heappop(progress_heap)
+            current = time.monotonic()
+            wait_times = [max(w.deadline - current, 0) for w in busy if w.deadline is not None]
+            if progress_heap:
+                wait_times.append(max(progress_heap[0][0] - time.time(), 0))
+            wait_time = min(wait_times) if wait_times else None
+            ready = multiprocessing.connection.wait([w.connection for w in busy], wait_time)
+
+            for worker in busy:
+                finished = list()  # (TestCase, resources, state, results)
+                if worker.connection in ready:
+                    try:
+                        unique_id, state, results = worker.recv()
+                        finished.append((*worker.release(unique_id), state, results))
+                    except EOFError:
+                        for tc, resources in worker.releaseAll():
+                            results = {
+                                tc.name():
+                                TestCase.Data(
+                                    TestCase.Result.FATAL, None, None,
+                                    "The process executing the test exited unexpectedly.",
+                                    ['worker process exited'])
+                            }
+                            finished.append((tc, resources, TestCase.Result.FATAL, results))
+                        worker.stop()
+                        workers.remove(worker)
+
+                elif worker.expired():
+                    # A concurrent worker that exceeded the deadline is not responding, so the other
+                    # TestCase objects that it is executing are stopped as well
+                    worker.stop()  # kills the running TestCase objects, so stop prior to release
+                    for tc, resources in worker.releaseExpired():
+                        state, results = _get_timeout_results(tc, timeout)
+                        finished.append((tc, resources, state, results))
+                    for tc, resources in worker.releaseAll():
+                        results = {
+                            tc.name():
+                            TestCase.Data(
+                                TestCase.Result.FATAL, None, None,
+                                "The process executing the test was stopped because it was not "
+                                "responding.", ['worker process stopped'])
+                        }
+                        finished.append((tc, resources, TestCase.Result.FATAL, results))
+                    workers.remove(worker)
+
+                for tc, resources, state, results in finished:
+                    cores_used -= resources[0]
+                    memory_used -= resources[1]
+                    _report_progress_and_results(tc, formatter, TestCase.Progress.FINISHED, state,
+                                                 results)
+                    n_fails += int(tc.state.level >= min_fail_state.level)
+                    scheduler.finish(tc)
+
+            # Stop the running TestCase objects if max failures is reached, these are reported along
+            # with the objects waiting to execute after the loop
+            if n_fails >= max_fails:
+                for worker in [w for w in workers if w.busy]:
+                    worker.stop()
+                    for _, resources in worker.releaseAll():
+                        cores_used -= resources[0]
+                        memory_used -= resources[1]
+                    workers.remove(worker)
+
+            current = time.time()
+            while progress_heap and (progress_heap[0][0] <= current):
+                _, _, tc = heapq.heappop(progress_heap)
+                if tc.running:
+                    formatter.reportProgress(tc)
+                    heapq.heappush(progress_heap,
+                                   (time.time() + progress_interval, next(progress_count), tc))
+
+    except (KeyboardInterrupt, _Terminated) as ex:
+        # The workers are not in the foreground process group of the terminal (see `_Worker`), so
+        # the SIGINT from Ctrl-C is only received by this process. It is forwarded to the busy
+        # workers, and thus the commands they started, which are allowed to exit before the
+        # remaining processes are killed by stopping the workers. The signals in TERMINATE_SIGNALS
+        # (e.g., from a batch scheduler or a closed terminal) are handled in the same manner.
+        terminated = ex if isinstance(ex, _Terminated) else None
+        busy = [worker for worker in workers if worker.busy]
+        for worker in busy:
+            worker.interrupt(terminated.signum if terminated else signal.SIGINT)
+        deadline = time.monotonic() + INTERRUPT_TIMEOUT
+        for worker in busy:
+            worker.join(max(deadline - time.monotonic(), 0))
+        raise
+
+    finally:
+        # Shutdown the workers, any running TestCase objects are stopped
+        for worker in workers:
+            worker.stop()
+
+        # The process ends by the received signal, as expected by the sender, after the workers are
+        # stopped
+        _restore_signal_handlers()
+        if terminated is not None:
+            os.kill(os.getpid(), terminated.signum)
 
     # If there are test cases not finished they must have been skipped because of the early max
     # failures exit, So, mark them as finished and report.
@@ -135,21 +336,438 @@ def run(groups,
         formatter.reportProgress(tc)
         formatter.reportResults(tc)
 
+    # Update the execution times and the fingerprints of passing tests
+    if timing is not None:
+        timing.update(testcases.values())
+    if cache is not None:
+        for unique_id, fingerprint in fingerprints.items():
+            cache.update(testcases[unique_id], fingerprint)
+
     # Produce exit code and return
     print(formatter.reportComplete(testcases.values(), start_time))
     failed = sum(tc.state.level >= min_fail_state.level for tc in testcases.values())
     return 1 if failed > 0 else 0
 
 
-def _execute_testcase(tc, conn):
+def _get_physical_memory():
     """
-    Function for executing the `TestCase` *tc* with exception handling from within a subprocess.
+    Return the physical memory of the machine in megabytes, `None` is returned if it is unknown.
+    """
+    try:
+        return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') / 1024**2
+    except (ValueError, OSError, AttributeError):
+        return None
 
-    This function is expected to be called by a `multiprocessing.Process`, as such the *conn* is
-    expected to be a `multiprocessing.Pipe` that the be used to send the results to the spawning
-    process.
 
-    See the `_execute_testcases` for use.
+class _Worker(object):
+    """
+    A persistent process for executing `TestCase` objects, see `_worker_main`.
+
+    The *ctx* is the `multiprocessing` context used to create the process. The `TestCase` objects
+    are sent to the process with `submit` and the results are returned via a `multiprocessing.Pipe`,
+    the receiving end of the pipe (see `connection`) is intended to be used with
+    `multiprocessing.connection.wait` for waiting on many workers.
+
+    The process is reused for each `TestCase`, which avoids the cost of creating a process for
+    each test. The timeout is enforced by the root process (see `expired`), in which case the
+    worker is stopped and must be replaced.
+
+    The process is the leader of a new process group, which includes the processes started by the
+    `TestCase` objects (e.g., the command of a `runners.RunCommand`). Thus, stopping a busy worker
+    also stops the commands that it started, see `stop`. As a consequence, the processes are not in
+    the foreground process group of the terminal: reading from the terminal would stop them (i.e.,
+    SIGTTIN), so the standard input of the worker is the null device (see `_worker_main`), and the
+    SIGINT from Ctrl-C is only received by the root process, which forwards it (see `interrupt`).
+    The SIGTERM and SIGHUP signals received by the root process are forwarded in the same manner
+    (see `TERMINATE_SIGNALS`), so the workers are stopped before the root process exits.
+
+    If *concurrent* is `True` the process executes many `TestCase` objects concurrently using
+    `asyncio` (see `_async_worker_main`) and enforces the timeout itself. The root process stops
+    the worker if the timeout is exceeded by more than `CONCURRENT_TIMEOUT_MARGIN` seconds (e.g.,
+    a `TestCase` blocks the event loop).
+    """
+    def __init__(self, ctx, concurrent=False):
+        self._conn, child_conn = ctx.Pipe(True)
+        target = _async_worker_main if concurrent else _worker_main
+        self._proc = ctx.Process(target=target, args=(child_conn, ))
+        self._proc.start()
+        child_conn.close()
+
+        # The process does not start anything until a TestCase is sent, so the group is set here
+        self._pgid = None
+        if hasattr(os, 'setpgid'):
+            try:
+                os.setpgid(self._proc.pid, self._proc.pid)
+                self._pgid = self._proc.pid
+            except OSError:
+                pass
+
+        self._concurrent = concurrent
+        self._running = dict()  # unique_id to (TestCase, resources, deadline)
+        self._schemas = set()  # parameter schemas sent to the process, see `submit`
+
+    @property
+    def connection(self):
+        """
+        Return the connection that receives the results from the worker process.
+        """
+        return self._conn
+
+    @property
+    def concurrent(self):
+        """
+        Return `True` if the worker executes many `TestCase` objects concurrently.
+        """
+        return self._concurrent
+
+    @property
+    def busy(self):
+        """
+        Return `True` if the worker is executing a `TestCase` object.
+        """
+        return len(self._running) > 0
+
+    @property
+    def deadline(self):
+        """
+        Return the earliest time, in terms of `time.monotonic`, that a running `TestCase` will
+        timeout, `None` is returned if the time is not limited.
+        """
+        deadlines = [item[2] for item in self._running.values() if item[2] is not None]
+        return min(deadlines, default=None)
+
+    def submit(self, tc, timeout, resources):
+        """
+        Send the `TestCase` *tc* to the worker process for execution.
+
+        The *timeout* is the number of seconds the *tc* is allowed to run, if `None` the time is not
+        limited. The *resources* are stored and returned by `release`.
+
+        The parameters of the objects are sent in a compact format, where the parts that do not
+        change are sent once for each process (see `InputParameters.compact`).
+        """
+        deadline = None
+        if timeout:
+            margin = CONCURRENT_TIMEOUT_MARGIN if self._concurrent else 0
+            deadline = time.monotonic() + timeout + margin
+        self._running[tc.unique_id] = (tc, resources, deadline)
+        with InputParameters.compact(self._schemas):
+            self._conn.send((tc, timeout))
+
+    def recv(self):
+        """
+        Return the unique identifier, state, and results of a finished `TestCase`.
+
+        This will block until the results are available, an `EOFError` is raised if the worker
+        process exited.
+        """
+        return self._conn.recv()
+
+    def release(self, unique_id):
+        """
+        Return, and remove, the running `TestCase` object with *unique_id* and the resources
+        supplied to `submit`.
+        """
+        tc, resources, _ = self._running.pop(unique_id)
+        return tc, resources
+
+    def releaseAll(self):
+        """
+        Return, and remove, all of the running `TestCase` objects and resources (see `release`).
+        """
+        return [self.release(unique_id) for unique_id in list(self._running.keys())]
+
+    def releaseExpired(self):
+        """
+        Return, and remove, the running `TestCase` objects that exceeded the timeout and the
+        resources (see `release`).
+        """
+        current = time.monotonic()
+        expired = [
+            unique_id for unique_id, (_, _, deadline) in self._running.items()
+            if (deadline is not None) and (current >= deadline)
+        ]
+        return [self.release(unique_id) for unique_id in expired]
+
+    def expired(self):
+        """
+        Return `True` if a running `TestCase` exceeded the timeout.
+        """
+        deadline = self.deadline
+        return (deadline is not None) and (time.monotonic() >= deadline)
+
+    def stop(self):
+        """
+        Stop the worker process.
+
+        An idle process is asked to exit, otherwise it is killed along with the processes in the
+        process group (i.e., the commands started by the running `TestCase` objects).
+        """
+        if self._proc is None:
+            return
+
+        if (not self._running) and self._proc.is_alive():
+            try:
+                self._conn.send(None)
+            except OSError:
+                self._kill()
+        else:
+            self._kill()
+
+        self._proc.join()
+        self._proc.close()
+        self._proc = None
+        self._conn.close()
+
+    def interrupt(self, signum=signal.SIGINT):
+        """
+        Send the signal *signum* to the process group of a busy worker, see `run`.
+        """
+        if (self._pgid is not None) and self._running:
+            try:
+                os.killpg(self._pgid, signum)
+            except OSError:
+                pass
+
+    def join(self, timeout=None):
+        """
+        Wait, for at most *timeout* seconds, for the worker process to exit.
+        """
+        if self._proc is not None:
+            self._proc.join(timeout)
+
+    def _kill(self):
+        """
+        Kill the process group of the worker, the process is terminated if the group is not
+        available.
+        """
+        if self._pgid is not None:
+            try:
+                os.killpg(self._pgid, signal.SIGKILL)
+                return
+            except OSError:
+                pass
+        self._proc.terminate()
+
+
+def _get_worker(workers, ctx, concurrent):
+    """
+    Return an available `_Worker` from *workers*, a new worker is added if one is not available.
+
+    If *concurrent* is `True` the worker for concurrent execution is returned, see `_Worker`.
+    """
+    for worker in workers:
+        if (worker.concurrent == concurrent) and (concurrent or not worker.busy):
+            return worker
+    worker = _Worker(ctx, concurrent)
+    workers.append(worker)
+    return worker
+
+
+def _worker_main(conn):
+    """
+    Function for executing `TestCase` objects within a persistent process.
+
+    This function is expected to be called by a `multiprocessing.Process` (see `_Worker`). The
+    *conn* is a `multiprocessing.Pipe` used to receive `TestCase` objects and send the state and
+    results of each back to the root process, a `None` stops the process.
+
+    The process is not replaced for each `TestCase`, so the state of the process that is commonly
+    changed is restored after each `TestCase` (see `_restore_process_state`). Other changes to the
+    process (e.g., threads started or files opened by a `TestCase`) are not isolated.
+
+    The standard input is replaced by the null device, which is inherited by the commands executed,
+    and the process exits when interrupted by the root process, see `_Worker`. The handlers for the
+    signals in TERMINATE_SIGNALS inherited from the root process are removed.
+    """
+    _redirect_stdin()
+    _restore_signal_handlers()
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            break
+        if message is None:
+            break
+
+        tc, _ = message
+        try:
+            with _restore_process_state():
+                out = _execute_testcase(tc)
+        except KeyboardInterrupt:
+            break
+        conn.send((tc.unique_id, *out))
+
+
+def _redirect_stdin():
+    """
+    Replace the standard input (i.e., file descriptor 0) of the process with the null device.
+
+    The worker processes are not in the foreground process group of the terminal, so a command that
+    reads from the terminal would be stopped (SIGTTIN) rather than fail, see `_Worker`.
+    """
+    fd = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(fd, 0)
+    os.close(fd)
+
+
+class _Terminated(BaseException):
+    """
+    Exception raised in the root process when a signal in TERMINATE_SIGNALS is received, see `run`.
+    """
+    def __init__(self, signum):
+        super().__init__(signum)
+        self.signum = signum
+
+
+def _raise_terminated(signum, frame):
+    """
+    Signal handler that raises `_Terminated`, see `_install_signal_handlers`.
+    """
+    raise _Terminated(signum)
+
+
+def _install_signal_handlers():
+    """
+    Install the handler that raises `_Terminated` for the signals in TERMINATE_SIGNALS.
+
+    The handler is only installed, from the main thread, for the signals with the default handler,
+    which would end the process without stopping the workers. See `run` for use.
+    """
+    if threading.current_thread() is threading.main_thread():
+        for signum in TERMINATE_SIGNALS:
+            if signal.getsignal(signum) == signal.SIG_DFL:
+                signal.signal(signum, _raise_terminated)
+
+
+def _restore_signal_handlers():
+    """
+    Restore the default handler for the signals handled by `_install_signal_handlers`.
+
+    The worker processes inherit the handlers of the root process, thus the handlers are also
+    restored when a worker starts, see `_worker_main`.
+    """
+    if threading.current_thread() is threading.main_thread():
+        for signum in TERMINATE_SIGNALS:
+            if signal.getsignal(signum) is _raise_terminated:
+                signal.signal(signum, signal.SIG_DFL)
+
+
+@contextlib.contextmanager
+def _restore_process_state():
+    """
+    Restore the working directory, environment variables, `sys.path`, umask, and signal handlers of
+    the process upon exiting the context, the modules imported within the context are removed.
+
+    See `_worker_main` for use.
+    """
+    cwd = os.getcwd()
+    environ = dict(os.environ)
+    path = list(sys.path)
+    modules = set(sys.modules.keys())
+    umask = os.umask(0)
+    os.umask(umask)
+    signals = signal.valid_signals() if hasattr(signal, 'valid_signals') else range(1, signal.NSIG)
+    handlers = {sig: signal.getsignal(sig) for sig in signals}
+    try:
+        yield
+    finally:
+        os.chdir(cwd)
+        for key in [key for key in os.environ.keys() if key not in environ]:
+            del os.environ[key]
+        for key, value in environ.items():
+            if os.environ.get(key) != value:
+                os.environ[key] = value
+        sys.path[:] = path
+        for name in [name for name in sys.modules.keys() if name not in modules]:
+            del sys.modules[name]
+        os.umask(umask)
+        for sig, handler in handlers.items():
+            if (handler is not None) and (signal.getsignal(sig) != handler):
+                signal.signal(sig, handler)
+
+
+def _async_worker_main(conn):
+    """
+    Function for executing `TestCase` objects concurrently within a persistent process.
+
+    This function is expected to be called by a `multiprocessing.Process` (see `_Worker`), the
+    *conn* is used in the same manner as for `_worker_main`. Each `TestCase` is executed as an
+    `asyncio` task (see `TestCase.executeAsync`), thus commands are executed as subprocesses of
+    this process without blocking the execution of other `TestCase` objects. The `TestCase` objects
+    execute at the same time, so the state of the process is not restored for each as done by
+    `_worker_main`. The standard input and interrupts are handled as done by `_worker_main`.
+    """
+    _redirect_stdin()
+    _restore_signal_handlers()
+    asyncio.run(_async_worker_loop(conn))
+
+
+async def _async_worker_loop(conn):
+    """
+    The `asyncio` event loop for `_async_worker_main`.
+    """
+    loop = asyncio.get_event_loop()
+    messages = asyncio.Queue()
+
+    def receive():
+        try:
+            messages.put_nowait(conn.recv())
+        except EOFError:
+            loop.remove_reader(conn.fileno())
+            messages.put_nowait(None)
+
+    # The commands also receive the SIGINT sent by the root process (see `_Worker.interrupt`), so
+    # the running tasks are not cancelled, which would kill the commands, but allowed to finish
+    loop.add_reader(conn.fileno(), receive)
+    loop.add_signal_handler(signal.SIGINT, messages.put_nowait, KeyboardInterrupt)
+    tasks = set()
+    while True:
+        message = await messages.get()
+        if message is None:
+            break
+        if message is KeyboardInterrupt:
+            loop.remove_reader(conn.fileno())
+            await asyncio.gather(*tasks, return_exceptions=True)
+            return
+
+        tc, timeout = message
+        task = asyncio.ensure_future(_execute_testcase_async(tc, timeout, conn))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    loop.remove_reader(conn.fileno())
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _execute_testcase_async(tc, timeout, conn):
+    """
+    Function for executing the `TestCase` *tc* with exception handling within an `asyncio` loop.
+
+    The *tc* is allowed to execute for *timeout* seconds, the state and results are sent using the
+    *conn*. See the `_async_worker_loop` for use.
+    """
+    try:
+        state, results = await asyncio.wait_for(tc.executeAsync(), timeout or None)
+    except asyncio.TimeoutError:
+        state, results = _get_timeout_results(tc, timeout)
+    except Exception:
+        state = TestCase.Result.FATAL
+        results = {
+            tc.name(): TestCase.Data(TestCase.Result.FATAL, None, None, traceback.format_exc(),
+                                     None)
+        }
+    conn.send((tc.unique_id, state, results))
+
+
+def _execute_testcase(tc):
+    """
+    Function for executing the `TestCase` *tc* with exception handling, returning the state and
+    results.
+
+    See the `_worker_main` for use.
     """
     try:
         state, results = tc.execute()
@@ -159,92 +777,18 @@ def _execute_testcase(tc, conn):
             tc.name(): TestCase.Data(TestCase.Result.FATAL, None, None, traceback.format_exc(),
                                      None)
         }
-    conn.send((state, results))
-
-
-def _execute_testcases(testcases, result_send, timeout):
-    """
-    Function for executing groups of `TestCase` objects, *testcases*, each within a subprocess.
-
-    This function is expected to be called from `concurrent.futures.ProcessPoolExecutor`. The *q*,
-    which is a `multiprocessing.Queue` is used to send the results from the run of +each+ `TestCase`
-    to the main process. This is done to allow the main process to report the results without
-    waiting for the entire group to complete.
-
-    The *timeout* is the number of seconds that each `TestCase` is allowed to run before it is
-    aborted. This is accomplished by running the cases in another process.
-
-    See the `run` function for use.
-    """
-
-    # Storage for the state of complete TestCase. This is used to make sure that tests with
-    # 'requires' parameter have executed and passed.
-    test_results = dict()
-
-    # TestCase objects are executed in order recieved
-    for tc in testcases:
-
-        # If a TestCase Runner object has a 'requires' parameter, make sure that those tests have
-        # run and passed.
-        requires = tc.runner.getParam('requires')
-        if (requires is not None):
-
-            # Case where the names do not exist, thus cannot have run. The 'discover' method creates
-            # the names for the Runner (i.e., TestCase) using HIT information. However, it is desired
-            # that handling 'requires' have no knowledge of HIT. Thus, the just check that the
-            # known names end with names in 'requires'.
-            not_in = [
-                name for name in requires if not any(k.endswith(name) for k in test_results.keys())
-            ]
-            if not_in:
-                msg = "For the test '{}', the required test(s) '{}' have not executed. Either the names provided the the 'requires' parameter are incorrect or the tests are in the wrong order.".format(
-                    tc.name(), ', '.join(not_in))
-                state = TestCase.Result.FATAL
-                results = {
-                    tc.name(): TestCase.Data(state, None, None, msg, ['unknown required test(s)'])
-                }
-                test_results[tc.name()] = state
-                result_send.put((tc.unique_id, TestCase.Progress.FINISHED, state, results))
-                continue
-
-            # Case when names do exist, but have not passed. See comment above for "not_in" variable.
-            not_pass = [
-                name for name in requires
-                if any((k.endswith(name) and v.level != 0) for k, v in test_results.items())
-            ]
-            if not_pass:
-                msg = "For the test '{}', the required test(s) '{}' have not executed and passed.".format(
-                    tc.name(), ', '.join(not_pass))
-                state = TestCase.Result.SKIP
-                results = {tc.name(): TestCase.Data(state, None, None, msg, ['failed dependency'])}
-                test_results[tc.name()] = state
-                result_send.put((tc.unique_id, TestCase.Progress.FINISHED, state, results))
-                continue
-
-        # Execute the TestCase object, this is done in separate process to allow for the timeout
-        # to be applied to the execution
-        result_send.put((tc.unique_id, TestCase.Progress.RUNNING, None, None))
-        ctx = multiprocessing.get_context(MULTIPROCESSING_CONTEXT)
-        conn_recv, conn_send = ctx.Pipe(False)
-        proc = ctx.Process(target=_execute_testcase, args=(tc, conn_send))
-        proc.start()
-
-        if conn_recv.poll(timeout):
-            state, results = conn_recv.recv()
-        else:
-            proc.terminate()
-            state = TestCase.Result.TIMEOUT
-            results = {
-                tc.name():
-                TestCase.Data(TestCase.Result.TIMEOUT, None, None, None,
-                              [f'max time ({timeout}) exceeded'])
-            }
-
-        proc.join()
-        proc.close()
-
-        test_results[tc.name()] = state
-        result_send.put((tc.unique_id, TestCase.Progress.FINISHED, state, results))
+    return state, results
+
+
+def _get_timeout_results(tc, timeout):
+    """
+    Return the state and results for the `TestCase` *tc* that exceeded the *timeout*.
+    """
+    results = {
+        tc.name():
+        TestCase.Data(TestCase.Result.TIMEOUT, None, None, None, [f'max time ({timeout}) exceeded'])
+    }
+    return TestCase.Result.TIMEOUT, results
 
 
 def _report_progress_and_results(tc, formatter, progress, state, results):
@@ -9,10 +9,17 @@
 
 import os
 import sys
+import time
 import threading
+import contextlib
 import multiprocessing
 import subprocess
-from moosetools.moosetest.base import Runner
+from moosetools.moosetest.base import Runner, OutputBuffer, MemoryMonitor
+
+try:
+    import resource
+except ImportError:
+    resource = None
 
 
 class RunCommand(Runner):
@@ -24,7 +31,7 @@ class RunCommand(Runner):
             'timeout',
             vtype=(int, float),
             doc=
-            "Limit the execution to the specified time; implemented via 'timeout' flag in `subprocess.run` command."
+            "Limit the execution to the specified time; implemented via 'timeout' flag in `subprocess.Popen.wait` command."
         )
         params.add(
             'allow_exception',
@@ -33,20 +40,200 @@ class RunCommand(Runner):
             doc=
             "Do not raise exception if the process fails; implemented via 'check' flag in `subprocess.run` command."
         )
+        params.add(
+            'output_limit',
+            vtype=int,
+            default=10 * 1024**2,
+            verify=(Runner.isPositive, "The output limit must be greater than zero."),
+            doc=
+            "The maximum number of bytes of each of stdout and stderr of the command to retain in memory, the beginning and end of the output are retained."
+        )
+        params.add(
+            'output_file',
+            vtype=str,
+            doc=
+            "File name to which the complete output (stdout and stderr) of the command is written, relative to the 'working_dir'. The file is expected to be created by this object, thus it may be inspected by a `Differ` object (e.g., `TextFileContentDiffer`)."
+        )
 
         return params
 
+    def __init__(self, *args, **kwargs):
+        Runner.__init__(self, *args, **kwargs)
+        self.__usage = None  # resources used by the command, see `getResourceUsage`
+
+    def getCommand(self):
+        return self.getParam('command')
+
+    def getResourceUsage(self):
+        """
+        Return the resources used by the process tree of the command, see `Runner`.
+
+        The CPU time and peak memory are available on POSIX systems and the bytes read and written
+        are available on Linux. The information is not available when the command is executed
+        via `executeCommand`.
+
+        The peak memory of a child process includes the memory of the process that created it, so
+        the peak reported by the operating system for a command is at least the peak of the Python
+        process executing it. The peak is therefore sampled while the command runs (see
+        `MemoryMonitor`), unless the command exceeds the peak of the Python process. Where sampling
+        is not available (i.e., not Linux) the 'max_rss' is an upper bound.
+        """
+        return self.__usage
+
     def execute(self):
-        kwargs = dict()
-        kwargs['capture_output'] = True  # MOOSE executable output is not captured without this
-        kwargs['encoding'] = 'utf-8'
-        kwargs['check'] = self.getParam('allow_exception')
-        kwargs['timeout'] = self.getParam('timeout')
+        self.__usage = None
+        cmd = self.getCommand()
+        self._printCommand(cmd)
+
+        # The output is read as it is produced, such that only the portion limited by the
+        # 'output_limit' parameter is retained in memory (see `OutputBuffer`)
+        limit = self.getParam('output_limit')
+        filename = self.getParam('output_file')
+        with contextlib.ExitStack() as stack:
+            spill = stack.enter_context(open(filename, 'wb')) if filename else None
+            stdout = OutputBuffer(limit, spill)
+            stderr = OutputBuffer(limit, spill)
+
+            # MOOSE executable output is not captured without the pipes
+            proc = stack.enter_context(
+                subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE))
+            threads = [
+                threading.Thread(target=RunCommand._readPipe, args=(proc.stdout, stdout)),
+                threading.Thread(target=RunCommand._readPipe, args=(proc.stderr, stderr))
+            ]
+            for thread in threads:
+                thread.start()
+
+            timeout = self.getParam('timeout')
+            try:
+                self.__usage = RunCommand._wait(proc, threads, timeout)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                raise
+            finally:
+                for thread in threads:
+                    thread.join()
+
+        return self._processOutput(cmd, proc.returncode, stdout.getvalue(), stderr.getvalue())
 
-        cmd = self.getParam('command')
+    def executeCommand(self, returncode, stdout, stderr):
+        self.__usage = None
+        cmd = self.getCommand()
+        self._printCommand(cmd)
+        return self._processOutput(cmd, returncode, stdout, stderr)
+
+    def _getExpectedFiles(self, param_name):
+        """
+        Include the 'output_file' with the files expected to be created, see `Runner`.
+        """
+        expected = Runner._getExpectedFiles(self, param_name)
+        if (param_name == 'names_created') and self.isParamValid('output_file'):
+            expected.add(self.getParam('output_file'))
+        return expected
+
+    @staticmethod
+    def _wait(proc, threads, timeout):
+        """
+        Wait for the process of the `subprocess.Popen` object *proc* to exit and return the
+        resources used, see `getResourceUsage`.
+
+        The *threads* are the `threading.Thread` objects reading the output of the process, see
+        `execute`. A `subprocess.TimeoutExpired` exception is raised if the process does not exit
+        within *timeout* seconds.
+        """
+        if not hasattr(os, 'wait4'):
+            proc.wait(timeout)
+            return None
+
+        # The output pipes are closed when the process exits, so wait on the threads reading them,
+        # the memory of the running processes is sampled at an increasing interval while waiting
+        monitor = MemoryMonitor(proc.pid)
+        deadline = (time.monotonic() + timeout) if timeout else None
+        delay = 0.0005
+        for thread in threads:
+            while thread.is_alive():
+                monitor.sample()
+                remaining = (deadline - time.monotonic()) if deadline else None
+                if (remaining is not None) and (remaining <= 0):
+                    break
+                thread.join(min(delay, remaining) if remaining else delay)
+                delay = min(delay * 2, 0.05)
+
+        # The process is reaped with `os.wait4` to get the resources used by it and the children
+        # that it waited on. On Linux, it is first waited on without reaping so that the I/O
+        # statistics are available.
+        usage = dict()
+        delay = 0.0005
+        while True:
+            monitor.sample()
+            if hasattr(os, 'waitid'):
+                if os.waitid(os.P_PID, proc.pid, os.WEXITED | os.WNOWAIT | os.WNOHANG):
+                    usage.update(RunCommand._readIO(proc.pid))
+                    _, status, rusage = os.wait4(proc.pid, 0)
+                    break
+            else:
+                pid, status, rusage = os.wait4(proc.pid, os.WNOHANG)
+                if pid != 0:
+                    break
+
+            if (deadline is not None) and (time.monotonic() >= deadline):
+                raise subprocess.TimeoutExpired(proc.args, timeout)
+            time.sleep(delay)
+            delay = min(delay * 2, 0.05)
+
+        # The peak memory reported for the process is at least the peak of this process when the
+        # command was started, a larger value is the peak of the command (see `getResourceUsage`)
+        proc.returncode = -os.WTERMSIG(status) if os.WIFSIGNALED(status) else os.WEXITSTATUS(status)
+        usage['user_time'] = rusage.ru_utime
+        usage['system_time'] = rusage.ru_stime
+        usage['max_rss'] = rusage.ru_maxrss / (1024**2 if sys.platform == 'darwin' else 1024)
+        if (monitor.peak is not None) and (resource is not None):
+            if rusage.ru_maxrss <= resource.getrusage(resource.RUSAGE_SELF).ru_maxrss:
+                usage['max_rss'] = monitor.peak
+        return usage
+
+    @staticmethod
+    def _readIO(pid):
+        """
+        Return the bytes read and written to storage by the process *pid* from "/proc/<pid>/io".
+
+        An empty `dict` is returned if the information is not available.
+        """
+        out = dict()
+        try:
+            with open(f'/proc/{pid}/io', 'r') as fid:
+                for line in fid:
+                    key, _, value = line.partition(':')
+                    if key in ('read_bytes', 'write_bytes'):
+                        out[key] = int(value)
+        except (OSError, ValueError):
+            pass
+        return out
+
+    @staticmethod
+    def _readPipe(pipe, buffer):
+        """
+        Write the content of the *pipe* to the `OutputBuffer` *buffer*, see `execute`.
+        """
+        for data in iter(lambda: pipe.read1(65536), b''):
+            buffer.write(data)
+
+    def _printCommand(self, cmd):
+        """
+        Print the command, *cmd*, being executed.
+        """
         str_cmd = ' '.join(cmd)
         print('RUNNING COMMAND:\n{0}\n{1}\n{0}'.format('-' * len(str_cmd), str_cmd))
-        out = subprocess.run(cmd, **kwargs)
-        sys.stdout.write(out.stdout)
-        sys.stderr.write(out.stderr)
-        return out.returncode
+
+    def _processOutput(self, cmd, returncode, stdout, stderr):
+        """
+        Write the output of the command, *cmd*, and return the *returncode*.
+
+        If the 'allow_exception' parameter is enabled a `subprocess.CalledProcessError` is raised
+        for a non-zero return code, as done by the 'check' flag of `subprocess.run`.
+        """
+        if self.getParam('allow_exception') and (returncode != 0):
+            raise subprocess.CalledProcessError(returncode, cmd, stdout, stderr)
+        sys.stdout.write(stdout)
+        sys.stderr.write(stderr)
+        return returncode
@@ -0,0 +1,379 @@
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import os
+import heapq
+import itertools
+import collections
+from moosetools.moosetest.base import TestCase
+
+
+class Scheduler(object):
+    """
+    Object for determining the order of execution of `TestCase` objects.
+
+    The *groups* is a `list` of `list` of `TestCase` objects. A directed acyclic graph (DAG) is
+    created from all the `TestCase` objects, where the edges are defined by the 'requires' parameter
+    of the `Runner` object of each `TestCase`. The names provided in the 'requires' parameter are
+    matched with the `TestCase` objects within the same group, any name that ends with the required
+    name is considered a match. The 'discover' method creates the names for the Runner (i.e.,
+    TestCase) using HIT information, but it is desired that handling 'requires' have no knowledge of
+    HIT, thus the suffix matching.
+
+    The `TestCase` objects are otherwise independent, so a `TestCase` object is ready to execute
+    as soon as all of the required `TestCase` objects have finished with a passing state. If a
+    required `TestCase` does not pass, the dependent `TestCase` objects are skipped.
+
+    The `TestCase` objects that are ready are executed in order of the longest expected time
+    first, where the time includes the time of the dependent `TestCase` objects (i.e., the critical
+    path). The expected time of each `TestCase` is taken from *durations*, which should be a
+    `moosetest.timing.TimingStore` or any object with a `get` method that accepts the `TestCase`
+    name and a default value. If a time is not available the 'timeout' parameter of the `Runner`
+    is used, if it exists, otherwise the *default_duration* is used. Objects with the same expected
+    time execute in the order supplied in *groups*.
+
+    The resources required by each `TestCase` are defined by the 'cores' and 'memory' (in MB)
+    parameters of the `Runner`. The *max_cores* and *max_memory* define the resources available,
+    `None` indicates no limit. If *soft_limit* is `True` a `TestCase` requiring more than the
+    available resources is executed when nothing else is running, otherwise it is skipped.
+
+    The `TestCase` objects that expect to create or modify the same files (see the 'file' parameters
+    of the `Runner` and `Differ` objects) are executed one at a time, as are the `TestCase` objects
+    with the same 'working_dir' parameter of the `Runner` when the 'allow_parallel' parameter of
+    either is disabled. A `TestCase` that is ready waits until the conflicting `TestCase` objects
+    finish. The file checks of the `Runner` consider all the files within the working directory, so
+    the files expected by the other `TestCase` objects in the directory are ignored by the checks
+    (see `Runner.setConcurrentFiles`).
+
+    The *resolved* is a `dict` of unique identifiers to the state and results of `TestCase` objects
+    that finished prior to scheduling (e.g., removed by a `Controller`), these are never executed
+    and are returned by the `resolved` method. Their dependents are handled as for any other
+    `TestCase` when the `finish` method is called.
+
+    See `moosetest.run` for use.
+    """
+    def __init__(self,
+                 groups,
+                 durations=None,
+                 default_duration=0,
+                 max_cores=None,
+                 max_memory=None,
+                 soft_limit=True,
+                 resolved=None):
+        self._testcases = dict()  # unique_id to TestCase object
+        self._requires = dict()  # unique_id to set of unique_id of required TestCase objects
+        self._dependents = collections.defaultdict(list)  # unique_id to list of dependent unique_id
+        self._ready = dict()  # (cores, memory) to heap of (-priority, count, TestCase) ready
+        self._priority = dict()  # unique_id to the expected time of the critical path
+        self._counter = itertools.count()
+        self._resources = dict()  # unique_id to (cores, memory) required for execution
+        self._resolved = list()  # (TestCase, state, results) finished without being executed
+        self._unresolvable = set()  # unique_id of TestCase objects that will not be executed
+        self._conflicts = dict()  # unique_id to set of unique_id that cannot execute at once
+        self._active = set()  # unique_id of TestCase objects with conflicts ready or running
+        self._blocked = dict()  # unique_id to item of TestCase objects waiting on a conflict
+        self._n_finished = 0
+
+        resolved = resolved or dict()
+        for testcases in groups:
+            for tc in testcases:
+                self._testcases[tc.unique_id] = tc
+                if tc.unique_id in resolved:
+                    self._resolved.append((tc, *resolved[tc.unique_id]))
+                    self._unresolvable.add(tc.unique_id)
+                    self._requires[tc.unique_id] = set()
+                else:
+                    self._requires[tc.unique_id] = self._getRequires(tc, testcases)
+                self._resources[tc.unique_id] = self._getResources(tc, max_cores, max_memory,
+                                                                   soft_limit)
+        self._conflicts = self._getConflicts()
+
+        for uid, requires in self._requires.items():
+            for other in requires:
+                self._dependents[other].append(uid)
+
+        # The dependents that are part of a cycle are not in the order, they are resolved as failed
+        order = self._checkCycles()
+        for uid in reversed(order):
+            tc = self._testcases[uid]
+            dependents = self._dependents.get(uid, tuple())
+            critical = max(
+                (self._priority[other] for other in dependents if other in self._priority),
+                default=0)
+            self._priority[uid] = self._getDuration(tc, durations, default_duration) + critical
+
+        for uid, tc in self._testcases.items():
+            if (not self._requires[uid]) and (uid not in self._unresolvable):
+                self._push(tc)
+
+    def __len__(self):
+        """
+        Return the number of `TestCase` objects that have not finished.
+        """
+        return len(self._testcases) - self._n_finished
+
+    def pop(self, cores=None, memory=None):
+        """
+        Return the next `TestCase` object to execute, `None` is returned if nothing is ready.
+
+        The *cores* and *memory* are the resources currently available, the `TestCase` with the
+        highest priority that requires no more than these resources is returned. If `None` is
+        supplied the resource is not considered.
+
+        The ready `TestCase` objects are stored in a heap for each distinct pair of required
+        resources, so only the first item of each heap that fits within the available resources is
+        inspected.
+        """
+        key = None
+        for (c, m), heap in self._ready.items():
+            if ((cores is None) or (c <= cores)) and ((memory is None) or (m <= memory)):
+                if (key is None) or (heap[0] < self._ready[key][0]):
+                    key = (c, m)
+        if key is None:
+            return None
+
+        heap = self._ready[key]
+        item = heapq.heappop(heap)
+        if not heap:
+            del self._ready[key]
+        return item[-1]
+
+    def resources(self, tc):
+        """
+        Return the cores and memory (in MB) reserved for the execution of *tc*.
+
+        When using a soft limit, the values are limited to the available resources.
+        """
+        return self._resources[tc.unique_id]
+
+    def resolved(self):
+        """
+        Return, and clear, the list of `TestCase` objects that finished without being executed.
+
+        Each item in the list is a `tuple` containing the `TestCase` object along with the state
+        and results that should be applied.
+        """
+        out = self._resolved
+        self._resolved = list()
+        return out
+
+    def finish(self, tc):
+        """
+        Update the dependency graph for the finished `TestCase` in *tc*.
+
+        The `TestCase` object must have the finished state and results applied. If it did not pass,
+        all dependent `TestCase` objects are resolved as skipped (see `resolved`), otherwise the
+        dependents are marked as ready when all the required `TestCase` objects have passed. The
+        waiting `TestCase` objects that conflict with *tc* are marked as ready, if possible.
+        """
+        self._n_finished += 1
+        self._release(tc)
+        for uid in self._dependents.get(tc.unique_id, tuple()):
+            if uid in self._unresolvable:
+                continue
+
+            other = self._testcases[uid]
+            requires = self._requires[uid]
+            if tc.state.level != 0:
+                msg = "For the test '{}', the required test(s) '{}' have not executed and passed.".format(
+                    other.name(), tc.name())
+                self._resolve(other, TestCase.Result.SKIP, msg, ['failed dependency'])
+            else:
+                requires.discard(tc.unique_id)
+                if not requires:
+                    self._push(other)
+
+    def _push(self, tc):
+        """
+        Add the *tc* to the `TestCase` objects ready for execution.
+
+        If a conflicting `TestCase` is ready or running, the *tc* waits until it finishes, see
+        `_release`.
+        """
+        priority = self._priority.get(tc.unique_id, 0)
+        item = (-priority, next(self._counter), tc)
+        conflicts = self._conflicts.get(tc.unique_id)
+        if conflicts is not None:
+            if not conflicts.isdisjoint(self._active):
+                self._blocked[tc.unique_id] = item
+                return
+            self._active.add(tc.unique_id)
+        self._setReady(item)
+
+    def _release(self, tc):
+        """
+        Mark the waiting `TestCase` objects that conflict with the finished *tc* as ready, in order
+        of priority, unless another conflicting `TestCase` is ready or running.
+        """
+        if tc.unique_id not in self._active:
+            return
+
+        self._active.remove(tc.unique_id)
+        waiting = [
+            self._blocked[uid] for uid in self._conflicts[tc.unique_id] if uid in self._blocked
+        ]
+        for item in sorted(waiting):
+            uid = item[-1].unique_id
+            if self._conflicts[uid].isdisjoint(self._active):
+                del self._blocked[uid]
+                self._active.add(uid)
+                self._setReady(item)
+
+    def _setReady(self, item):
+        """
+        Add the *item* created by `_push` to the heap of ready items for the required resources.
+        """
+        key = self._resources[item[-1].unique_id]
+        heapq.heappush(self._ready.setdefault(key, list()), item)
+
+    def _getConflicts(self):
+        """
+        Return a `dict` of unique identifiers to the `set` of unique identifiers of the `TestCase`
+        objects that cannot execute at the same time, see `Scheduler`.
+
+        The file names expected by the other `TestCase` objects within the same working directory
+        are supplied to the `Runner` of each `TestCase`, see `Runner.setConcurrentFiles`.
+        """
+        conflicts = collections.defaultdict(set)
+        files = collections.defaultdict(list)  # file name to unique_id of TestCase objects
+        directories = collections.defaultdict(list)  # working directory to unique_id
+        names = collections.defaultdict(set)  # working directory to expected file names
+        for uid, tc in self._testcases.items():
+            if uid in self._unresolvable:
+                continue
+            working_dir = os.path.realpath(tc.runner.getParam('working_dir'))
+            expected = tc.runner.getExpectedFiles()
+            directories[working_dir].append(uid)
+            names[working_dir].update(expected)
+            for name in expected:
+                files[os.path.normpath(os.path.join(working_dir, name))].append(uid)
+
+        for uids in files.values():
+            for uid in uids:
+                conflicts[uid].update(other for other in uids if other != uid)
+
+        for working_dir, uids in directories.items():
+            if len(uids) == 1:
+                continue
+            for uid in uids:
+                if not self._testcases[uid].runner.getParam('allow_parallel'):
+                    for other in uids:
+                        if other != uid:
+                            conflicts[uid].add(other)
+                            conflicts[other].add(uid)
+
+            concurrent = frozenset(names[working_dir])
+            for uid in uids:
+                self._testcases[uid].runner.setConcurrentFiles(concurrent)
+
+        return {uid: others for uid, others in conflicts.items() if others}
+
+    @staticmethod
+    def _getDuration(tc, durations, default):
+        """
+        Return the expected execution time of *tc*, see `Scheduler` for details.
+        """
+        duration = durations.get(tc.name(), None) if (durations is not None) else None
+        if (duration is None) and ('timeout' in tc.runner.parameters()):
+            duration = tc.runner.getParam('timeout')
+        return duration if (duration is not None) else default
+
+    def _resolve(self, tc, state, msg, reasons):
+        """
+        Add the *tc* to the list of `TestCase` objects finished without execution.
+
+        The *state*, *msg*, and *reasons* are used to create the results for the *tc*. Nothing is
+        done if the *tc* is already resolved, so it is only reported once.
+        """
+        if tc.unique_id in self._unresolvable:
+            return
+        results = {tc.name(): TestCase.Data(state, None, None, msg, reasons)}
+        self._resolved.append((tc, state, results))
+        self._unresolvable.add(tc.unique_id)
+
+    def _getResources(self, tc, max_cores, max_memory, soft_limit):
+        """
+        Return the cores and memory required by *tc*, limited by the *max_cores* and *max_memory*.
+
+        If the required resources exceed the available resources and *soft_limit* is not enabled,
+        the *tc* is resolved as skipped.
+        """
+        cores = tc.runner.getParam('cores') or 1
+        memory = tc.runner.getParam('memory') or 0
+
+        reasons = list()
+        if (max_cores is not None) and (cores > max_cores):
+            reasons.append('insufficient cores')
+            cores = max_cores
+        if (max_memory is not None) and (memory > max_memory):
+            reasons.append('insufficient memory')
+            memory = max_memory
+
+        if reasons and (not soft_limit):
+            msg = "For the test '{}', the required resources ({} cores, {} MB) exceed the available resources ({} cores, {} MB).".format(
+                tc.name(), tc.runner.getParam('cores'), tc.runner.getParam('memory'), max_cores,
+                max_memory)
+            self._resolve(tc, TestCase.Result.SKIP, msg, reasons)
+
+        return cores, memory
+
+    def _getRequires(self, tc, testcases):
+        """
+        Return the `set` of unique identifiers for the 'requires' parameter of *tc*.
+
+        The *testcases* are the `TestCase` objects within the same group as *tc*.
+        """
+        requires = tc.runner.getParam('requires')
+        if requires is None:
+            return set()
+
+        out = set()
+        not_in = list()
+        for name in requires:
+            found = [other.unique_id for other in testcases \
+                     if (other is not tc) and other.name().endswith(name)]
+            if not found:
+                not_in.append(name)
+            out.update(found)
+
+        if not_in:
+            msg = "For the test '{}', the required test(s) '{}' do not exist. The names provided to the 'requires' parameter must be the names of tests within the same group.".format(
+                tc.name(), ', '.join(not_in))
+            self._resolve(tc, TestCase.Result.FATAL, msg, ['unknown required test(s)'])
+            return set()
+
+        return out
+
+    def _checkCycles(self):
+        """
+        Resolve the `TestCase` objects with circular requirements as a failure.
+
+        The graph is traversed in topological order (Kahn's algorithm), objects that are not visited
+        are part of or depend on a cycle. The unique identifiers of the visited objects are returned
+        in topological order.
+        """
+        order = list()
+        count = {uid: len(requires) for uid, requires in self._requires.items()}
+        stack = [uid for uid, n in count.items() if n == 0]
+        while stack:
+            uid = stack.pop()
+            order.append(uid)
+            for other in self._dependents.get(uid, tuple()):
+                count[other] -= 1
+                if count[other] == 0:
+                    stack.append(other)
+
+        for uid in [uid for uid, n in count.items() if n > 0]:
+            tc = self._testcases[uid]
+            self._requires[uid].clear()
+            msg = "For the test '{}', the 'requires' parameter results in a circular dependency.".format(
+                tc.name())
+            self._resolve(tc, TestCase.Result.FATAL, msg, ['circular dependency'])
+
+        return order
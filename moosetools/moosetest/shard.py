@@ -0,0 +1,101 @@
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import heapq
+import hashlib
+
+
+def shard(groups, index, count, durations=None):
+    """
+    Return the portion of the *groups* of `Runner` objects to execute for shard *index* of *count*.
+
+    The *groups* is a `list` of `list` of `Runner` objects, as returned by `moosetest.discover`. The
+    *index* is one-based, i.e., the shards are numbered 1 to *count*. The same `list` structure is
+    returned, containing only the `Runner` objects for the shard, empty groups are removed.
+
+    The `Runner` objects connected by the 'requires' parameter are always assigned to the same
+    shard (see `moosetest.scheduler.Scheduler` for how the names are matched). If *durations* is
+    provided, which should be a `moosetest.timing.TimingStore` or any object with a `get` method
+    that accepts the `Runner` name and a default value, and it contains a time for any of the
+    objects, the objects are distributed such that the total expected time of each shard is
+    balanced. Objects without a time are expected to require the average of the known times.
+    Otherwise, the objects are distributed by a hash of the name.
+
+    The assignment depends only on the supplied objects and times, thus it is the same on each
+    machine as long as the tests and the timing file are the same.
+    """
+    if (count < 1) or (index < 1) or (index > count):
+        raise ValueError(f"The shard index must be in the range 1 to {count}, but {index} given.")
+
+    # Objects connected by the 'requires' parameter are assigned to the shard together
+    units = list()
+    for runners in groups:
+        units += _get_connected(runners)
+    keys = [unit[0].name() for unit in units]
+
+    # Determine the expected time of each unit
+    times = None
+    if durations is not None:
+        times = [[durations.get(runner.name(), None) for runner in unit] for unit in units]
+        known = [t for unit_times in times for t in unit_times if t is not None]
+        if known:
+            default = sum(known) / len(known)
+            times = [sum(default if t is None else t for t in unit_times) for unit_times in times]
+        else:
+            times = None
+
+    # Balance the expected time by assigning the longest unit to the shard with the least time
+    # (i.e., longest processing time first scheduling), otherwise use the name
+    owner = [None] * len(units)
+    if times is not None:
+        loads = [(0., i) for i in range(count)]
+        for k in sorted(range(len(units)), key=lambda k: (-times[k], keys[k])):
+            load, i = heapq.heappop(loads)
+            owner[k] = i
+            heapq.heappush(loads, (load + times[k], i))
+    else:
+        for k, key in enumerate(keys):
+            owner[k] = int(hashlib.sha256(key.encode()).hexdigest(), 16) % count
+
+    selected = set()
+    for k, unit in enumerate(units):
+        if owner[k] == index - 1:
+            selected.update(id(runner) for runner in unit)
+
+    out = list()
+    for runners in groups:
+        local = [runner for runner in runners if id(runner) in selected]
+        if local:
+            out.append(local)
+    return out
+
+
+def _get_connected(runners):
+    """
+    Return a `list` of `list` of the `Runner` objects in *runners* that are connected by the
+    'requires' parameter, in the supplied order.
+    """
+    parent = list(range(len(runners)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, runner in enumerate(runners):
+        for name in runner.getParam('requires') or tuple():
+            for j, other in enumerate(runners):
+                if (j != i) and other.name().endswith(name):
+                    parent[find(i)] = find(j)
+
+    units = dict()
+    for i, runner in enumerate(runners):
+        units.setdefault(find(i), list()).append(runner)
+    return list(units.values())
@@ -45,8 +45,8 @@ class TestFormatter(unittest.TestCase):
             f.formatComplete(None)
         self.assertIn(f"The 'formatComplete' method must be overridden.", str(ex.exception))
 
-    @mock.patch("moosetools.moosetest.base.Formatter._printResult")
-    @mock.patch("moosetools.moosetest.base.Formatter._printState")
+    @mock.patch.object(Formatter, "_printResult")
+    @mock.patch.object(Formatter, "_printState")
     def testReportResults(self, pstate, presult):
 
         # Runner
@@ -122,7 +122,7 @@ class TestFormatter(unittest.TestCase):
                       r['r'].stderr)
         self.assertEqual(r['r'].reasons, None)
 
-    @mock.patch("moosetools.moosetest.base.Formatter._printState")
+    @mock.patch.object(Formatter, "_printState")
     def testReportProgress(self, pstate):
         # Runner
         fm = Formatter(progress_interval=0)
@@ -155,10 +155,10 @@ class TestFormatter(unittest.TestCase):
         self.assertIn("The progress has not been set via the `setProgress` method.", r['r'].stderr)
         self.assertEqual(r['r'].reasons, None)
 
-    @mock.patch("moosetools.moosetest.base.Formatter.formatDifferResult")
-    @mock.patch("moosetools.moosetest.base.Formatter.formatRunnerResult")
-    @mock.patch("moosetools.moosetest.base.Formatter.formatDifferProgress")
-    @mock.patch("moosetools.moosetest.base.Formatter.formatRunnerProgress")
+    @mock.patch.object(Formatter, "formatDifferResult")
+    @mock.patch.object(Formatter, "formatRunnerResult")
+    @mock.patch.object(Formatter, "formatDifferProgress")
+    @mock.patch.object(Formatter, "formatRunnerProgress")
     def testPrintState(self, r_state, d_state, r_result, d_result):
 
         # Runner
@@ -221,7 +221,7 @@ class TestFormatter(unittest.TestCase):
         self.assertEqual(kwargs['stdout'], 'd_out')
         self.assertEqual(kwargs['stderr'], 'd_err')
 
-    @mock.patch("moosetools.moosetest.base.Formatter._printState")
+    @mock.patch.object(Formatter, "_printState")
     def testProgressTime(self, pstate):
         rr = make_runner(TestRunner, name='r')
         tc = TestCase(runner=rr)
@@ -32,6 +32,13 @@ class TestRunner(unittest.TestCase):
             runner.execute()
         self.assertIn("The 'execute' method must be overridden.", str(ex.exception))
 
+    def testCommand(self):
+        runner = moosetest.base.Runner(name='name')
+        self.assertIsNone(runner.getCommand())
+        with self.assertRaises(NotImplementedError) as ex:
+            runner.executeCommand(0, '', '')
+        self.assertIn("The 'executeCommand' method must be overridden.", str(ex.exception))
+
     def testControllers(self):
         class ProxyController(object):
             @staticmethod
@@ -141,6 +148,27 @@ class TestRunner(unittest.TestCase):
         self.assertIn("The following file(s) were not expected to be modified:\n  /foo/file",
                       log.output[0])
 
+        # unexpected created, with 'check_modified' enabled
+        runner = moosetest.base.Runner(name='run')
+        runner._Runner__pre_execute_files['/foo/file'] = 1.
+        with mock.patch('os.listdir', return_value=[
+                '/foo/file', '/bar/file'
+        ]), self.assertLogs(level='ERROR') as log, mock.patch('os.path.getmtime', return_value=1):
+            runner.postExecute()
+
+        self.assertEqual(len(log.output), 1)
+        self.assertIn("The following file(s) were not expected to be created:\n  /bar/file",
+                      log.output[0])
+
+        # unexpected created and modified, expected by other objects
+        runner = moosetest.base.Runner(name='run')
+        runner.setConcurrentFiles(('/foo/file', '/bar/file'))
+        runner._Runner__pre_execute_files['/foo/file'] = 1.
+        with mock.patch('os.listdir', return_value=['/foo/file', '/bar/file']), mock.patch(
+                'os.path.getmtime', return_value=2), mock.patch.object(runner, 'error') as error:
+            runner.postExecute()
+        error.assert_not_called()
+
     def test_getExpectedFiles(self):
         d0 = moosetest.base.make_differ(moosetest.base.Differ,
                                         name='a',
@@ -17,9 +17,15 @@ import collections
 import logging
 import unittest
 import uuid
+import textwrap
+import asyncio
+import tempfile
 from unittest import mock
 from moosetools.moosetest.base import make_runner, Runner, make_differ, Differ
 from moosetools.moosetest.base import Controller, Formatter, TestCase, State, RedirectOutput
+from moosetools.moosetest.base import OutputBuffer
+from moosetools.moosetest.runners import RunCommand
+from moosetools.moosetest.differs import TextFileContentDiffer
 
 # I do not want the tests directory to be packages with __init__.py, so load from file
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
@@ -43,12 +49,18 @@ class TestState(unittest.TestCase):
 
 
 class TestRedirectOutput(unittest.TestCase):
-    def testSysRedirect(self):
-        out = collections.defaultdict(io.StringIO)
-        new = RedirectOutput.SysRedirect(out)
-        sys.stdout = new
-        print("testing")
-        self.assertEqual("testing\n", out[multiprocessing.current_process().pid].getvalue())
+    def testPrefix(self):
+        with RedirectOutput(prefix='> ') as out:
+            print("test", end='')
+            print(" print\nline")
+            sys.stderr.write("test error\n")
+        self.assertEqual(out.stdout, "> test print\n> line\n")
+        self.assertEqual(out.stderr, "> test error\n")
+
+        # Output accumulates when entered again
+        with out:
+            print("again")
+        self.assertEqual(out.stdout, "> test print\n> line\n> again\n")
 
     def testRedirectOutput(self):
 
@@ -68,6 +80,78 @@ class TestRedirectOutput(unittest.TestCase):
         self.assertIn("test print\n", out.stdout)
         self.assertIn("test log\n", out.stderr)
 
+    def testPerformance(self):
+        # Compare with writing to a replacement object that stored the output for the current
+        # process with the prefix applied to each write, which is how the output was captured
+        # prior to writing directly to the `io.StringIO` objects
+        class SysRedirect(object):
+            def __init__(self, out, prefix=''):
+                self._prefix = prefix
+                self._out = out
+
+            def write(self, message):
+                self._out[multiprocessing.current_process().pid].write(
+                    textwrap.indent(message, self._prefix))
+
+            def flush(self):
+                pass
+
+        n = 100000
+        old = collections.defaultdict(io.StringIO)
+        t0 = time.perf_counter()
+        with RedirectOutput():
+            sys.stdout = SysRedirect(old)
+            for i in range(n):
+                print("test print", i)
+        t_old = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        with RedirectOutput() as out:
+            for i in range(n):
+                print("test print", i)
+        t_new = time.perf_counter() - t0
+
+        self.assertEqual(out.stdout, old[multiprocessing.current_process().pid].getvalue())
+        msg = 'Time for {} prints; SysRedirect: {:.3f} s; RedirectOutput: {:.3f} s'.format(
+            n, t_old, t_new)
+        self.assertTrue(t_new < t_old, msg)
+
+
+class TestOutputBuffer(unittest.TestCase):
+    def testUnlimited(self):
+        buf = OutputBuffer()
+        buf.write(b'foo\r\n')
+        buf.write(b'bar\r')
+        self.assertEqual(buf.size, 9)
+        self.assertFalse(buf.truncated)
+        self.assertEqual(buf.getvalue(), 'foo\nbar\n')
+
+    def testLimit(self):
+        buf = OutputBuffer(10)
+        buf.write(b'abc')
+        self.assertEqual(buf.getvalue(), 'abc')
+        buf.write(b'defgh')
+        buf.write(b'ij')
+        self.assertEqual(buf.getvalue(), 'abcdefghij')
+        self.assertFalse(buf.truncated)
+
+        for i in range(1000):
+            buf.write(b'0123456789')
+        buf.write(b'xyz')
+        self.assertEqual(buf.size, 10013)
+        self.assertTrue(buf.truncated)
+        self.assertEqual(buf.getvalue(), 'abcde\n...10003 bytes removed...\n89xyz')
+
+    def testSpill(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'out.txt')
+            with open(filename, 'wb') as fid:
+                buf = OutputBuffer(4, fid)
+                buf.write(b'abcdef')
+            self.assertEqual(buf.getvalue(), f"ab\n...2 bytes removed, see '{filename}'...\nef")
+            with open(filename, 'r') as fid:
+                self.assertEqual(fid.read(), 'abcdef')
+
 
 class TestTestCase(unittest.TestCase):
     def test_unique_id(self):
@@ -214,7 +298,7 @@ class TestTestCase(unittest.TestCase):
             print('print text')
             raise Execption("reset failed")
 
-        with mock.patch("moosetools.moosetest.base.Runner.reset") as reset:
+        with mock.patch.object(Runner, "reset") as reset:
             reset.side_effect = side_effect
             out = tc._executeObject(obj)
         self.assertEqual(out.state, TestCase.Result.FATAL)
@@ -226,7 +310,7 @@ class TestTestCase(unittest.TestCase):
         self.assertEqual(out.reasons, None)
 
         # Error on preExecute
-        with mock.patch('moosetools.moosetest.base.Runner.status', return_value=1):
+        with mock.patch.object(Runner, 'status', return_value=1):
             out = tc._executeObject(obj)
         self.assertEqual(out.state, TestCase.Result.FATAL)
         self.assertEqual(out.returncode, None)
@@ -236,7 +320,7 @@ class TestTestCase(unittest.TestCase):
         self.assertEqual(out.reasons, [])
 
         # Exception on preExecute
-        with mock.patch('moosetools.moosetest.base.Runner.preExecute', side_effect=Exception()):
+        with mock.patch.object(Runner, 'preExecute', side_effect=Exception()):
             out = tc._executeObject(obj)
         self.assertEqual(out.state, TestCase.Result.FATAL)
         self.assertEqual(out.returncode, None)
@@ -247,7 +331,7 @@ class TestTestCase(unittest.TestCase):
 
         # Error on postExecute
         obj.setValue('raise', False)
-        with mock.patch('moosetools.moosetest.base.Runner.status', side_effect=[0, 0, 1]):
+        with mock.patch.object(Runner, 'status', side_effect=[0, 0, 1]):
             out = tc._executeObject(obj)
         print(out.stdout)
         print(out.stderr)
@@ -259,7 +343,7 @@ class TestTestCase(unittest.TestCase):
         self.assertEqual(out.reasons, [])
 
         # Exception on postExecute
-        with mock.patch('moosetools.moosetest.base.Runner.postExecute', side_effect=Exception()):
+        with mock.patch.object(Runner, 'postExecute', side_effect=Exception()):
             out = tc._executeObject(obj)
         self.assertEqual(out.state, TestCase.Result.FATAL)
         self.assertEqual(out.returncode, None)
@@ -270,7 +354,7 @@ class TestTestCase(unittest.TestCase):
 
         # Error on execute, postExecute still runs
         obj.setValue('error', True)
-        with mock.patch('moosetools.moosetest.base.Runner.postExecute') as mock_postExecute:
+        with mock.patch.object(Runner, 'postExecute') as mock_postExecute:
             out = tc._executeObject(obj)
         mock_postExecute.assert_called_once()
         self.assertEqual(out.state, TestCase.Result.ERROR)
@@ -285,7 +369,7 @@ class TestTestCase(unittest.TestCase):
         # Error on execute, postExecute still runs
         obj.setValue('error', False)
         obj.setValue('raise', True)
-        with mock.patch('moosetools.moosetest.base.Runner.postExecute') as mock_postExecute:
+        with mock.patch.object(Runner, 'postExecute') as mock_postExecute:
             out = tc._executeObject(obj)
         mock_postExecute.assert_called_once()
         self.assertEqual(out.state, TestCase.Result.EXCEPTION)
@@ -350,7 +434,7 @@ class TestTestCase(unittest.TestCase):
             print('print text')
             raise Execption("reset failed")
 
-        with mock.patch("moosetools.moosetest.base.Differ.reset") as reset:
+        with mock.patch.object(Differ, "reset") as reset:
             reset.side_effect = side_effect
             out = tc._executeObject(obj)
         self.assertEqual(out.state, TestCase.Result.FATAL)
@@ -377,7 +461,7 @@ class TestTestCase(unittest.TestCase):
         self.assertEqual(out.stderr, '')
         self.assertEqual(out.reasons, [])
 
-        with mock.patch("moosetools.moosetest.base.Controller.reset") as func:
+        with mock.patch.object(Controller, "reset") as func:
             func.side_effect = Exception("raise")
             out = tc._executeObject(obj)
 
@@ -402,7 +486,7 @@ class TestTestCase(unittest.TestCase):
         self.assertEqual(out.reasons, None)
 
         ctrl.setValue('raise', False)
-        with mock.patch("moosetools.moosetest.base.Controller.status") as func:
+        with mock.patch.object(Controller, "status") as func:
             func.return_value = 1
             out = tc._executeObject(obj)
         self.assertEqual(out.state, TestCase.Result.FATAL)
@@ -413,7 +497,7 @@ class TestTestCase(unittest.TestCase):
             out.stderr)
         self.assertEqual(out.reasons, [])
 
-        with mock.patch("moosetools.moosetest.base.Runner.status") as func:
+        with mock.patch.object(Runner, "status") as func:
             func.return_value = 1
             out = tc._executeObject(obj)
         self.assertEqual(out.state, TestCase.Result.FATAL)
@@ -445,6 +529,37 @@ class TestTestCase(unittest.TestCase):
         self.assertEqual(len(log.output), 1)
         self.assertIn("is not setup to execute with an object of type", log.output[0])
 
+    def testEvaluateControllers(self):
+
+        ctrl = TestController(stdout=True)
+        ctrl.STATIC = True
+        obj = make_runner(TestRunner, [
+            ctrl,
+        ], name='a')
+        tc = TestCase(runner=obj, controllers=(ctrl, ))
+
+        # Static controller executes with the runner, the output is included with the results
+        self.assertIsNone(tc.evaluateControllers())
+        ctrl.setValue('skip', True)  # not executed again
+        state, results = tc.execute()
+        self.assertEqual(state, TestCase.Result.PASS)
+        self.assertEqual(results['a'].stdout, 'controller stdout\n')
+
+        # Skip
+        tc = TestCase(runner=obj, controllers=(ctrl, ))
+        state, results = tc.evaluateControllers()
+        self.assertEqual(state, TestCase.Result.SKIP)
+        self.assertEqual(results['a'].reasons, ['a reason'])
+        self.assertEqual(results['a'].stdout, 'controller stdout\n')
+
+        # Not static, the controller executes with the runner
+        ctrl.STATIC = False
+        tc = TestCase(runner=obj, controllers=(ctrl, ))
+        self.assertIsNone(tc.evaluateControllers())
+        state, results = tc.execute()
+        self.assertEqual(state, TestCase.Result.SKIP)
+        self.assertEqual(results['a'].reasons, ['a reason'])
+
     def testExecute(self):
         ct = TestController()
         dr = make_differ(TestDiffer, [ct], name='d')
@@ -461,7 +576,7 @@ class TestTestCase(unittest.TestCase):
 
         ## RUNNER ################################
         # Reset Exception, Runner
-        with mock.patch("moosetools.moosetest.base.Runner.reset") as func:
+        with mock.patch.object(Runner, "reset") as func:
             func.side_effect = Exception("runner reset raise")
             s, r = tc.execute()
         self.assertEqual(s, TestCase.Result.FATAL)
@@ -475,7 +590,7 @@ class TestTestCase(unittest.TestCase):
         self.assertEqual(r['r'].reasons, None)
 
         # Reset Exception, Controller with Runner
-        with mock.patch("moosetools.moosetest.base.Controller.reset") as func:
+        with mock.patch.object(Controller, "reset") as func:
             func.side_effect = Exception("controller reset raise")
             s, r = tc.execute()
         self.assertEqual(s, TestCase.Result.FATAL)
@@ -505,7 +620,7 @@ class TestTestCase(unittest.TestCase):
 
         # Error Object, Controller with Runner
         ct.setValue('raise', False)
-        with mock.patch("moosetools.moosetest.base.Runner.status") as func:
+        with mock.patch.object(Runner, "status") as func:
             func.return_value = 1
             s, r = tc.execute()
         self.assertEqual(s, TestCase.Result.FATAL)
@@ -567,7 +682,7 @@ class TestTestCase(unittest.TestCase):
 
         ## DIFFER ################################
         # Reset Exception, Differ
-        with mock.patch("moosetools.moosetest.base.Differ.reset") as func:
+        with mock.patch.object(Differ, "reset") as func:
             func.side_effect = Exception("differ reset raise")
             s, r = tc.execute()
         self.assertEqual(s, TestCase.Result.FATAL)
@@ -586,7 +701,7 @@ class TestTestCase(unittest.TestCase):
         self.assertEqual(r['d'].reasons, None)
 
         # Reset Exception, Controller with Differ
-        with mock.patch("moosetools.moosetest.base.Controller.reset") as func:
+        with mock.patch.object(Controller, "reset") as func:
             func.side_effect = [None, Exception("controller reset raise")]
             s, r = tc.execute()
         self.assertEqual(list(r.keys()), ['r', 'd'])
@@ -626,7 +741,7 @@ class TestTestCase(unittest.TestCase):
         ct.setValue('object_name', None)
 
         # Error Object, Controller with Differ
-        with mock.patch("moosetools.moosetest.base.Differ.status") as func:
+        with mock.patch.object(Differ, "status") as func:
             func.return_value = 1
             s, r = tc.execute()
         self.assertEqual(list(r.keys()), ['r', 'd'])
@@ -700,6 +815,123 @@ class TestTestCase(unittest.TestCase):
                       r['d'].stderr)
         self.assertEqual(r['d'].reasons, None)
 
+    def testExecuteAsync(self):
+        ct = TestController()
+        dr = make_differ(TestDiffer, [ct], name='d')
+        rr = make_runner(RunCommand, [ct], differs=(dr, ), name='r', command=('echo', 'foo'))
+        tc = TestCase(runner=rr, controllers=(ct, ))
+
+        # Same result as `execute`
+        s, r = asyncio.run(tc.executeAsync())
+        self.assertEqual(s, TestCase.Result.PASS)
+        self.assertEqual((s, r), tc.execute())
+        self.assertEqual(list(r.keys()), ['r', 'd'])
+        self.assertEqual(r['r'].returncode, 0)
+        self.assertIn('RUNNING COMMAND', r['r'].stdout)
+        self.assertIn('foo\n', r['r'].stdout)
+        self.assertEqual(r['d'], TestCase.Data(TestCase.Result.PASS, 2013, '', '', []))
+
+        # Skip by Controller
+        ct.setValue('skip', True)
+        s, r = asyncio.run(tc.executeAsync())
+        self.assertEqual(s, TestCase.Result.SKIP)
+        self.assertEqual(list(r.keys()), ['r'])
+        self.assertEqual(r['r'].reasons, ['a reason'])
+        ct.setValue('skip', False)
+
+        # Command failure
+        rr.parameters().setValue('command', ('false', ))
+        rr.parameters().setValue('allow_exception', True)
+        s, r = asyncio.run(tc.executeAsync())
+        self.assertEqual(s, TestCase.Result.EXCEPTION)
+        self.assertIn('CalledProcessError', r['r'].stderr)
+
+        # Missing command
+        rr.parameters().setValue('command', ('not_a_command_that_exists', ))
+        s, r = asyncio.run(tc.executeAsync())
+        self.assertEqual(s, TestCase.Result.EXCEPTION)
+        self.assertIn('not_a_command_that_exists', r['r'].stderr)
+
+        # Timeout of the Runner
+        rr.parameters().setValue('command', ('sleep', '2'))
+        rr.parameters().setValue('timeout', 0.5)
+        s, r = asyncio.run(tc.executeAsync())
+        self.assertEqual(s, TestCase.Result.EXCEPTION)
+        self.assertIn('TimeoutExpired', r['r'].stderr)
+
+        # Object without a command
+        tc = TestCase(runner=make_runner(TestRunner, name='r'))
+        self.assertEqual(asyncio.run(tc.executeAsync()), tc.execute())
+
+    def testExecuteOutputLimit(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cmd = (sys.executable, '-c', "print('a' * 1000 + 'b' * 100000 + 'c' * 1000)")
+            dr = make_differ(TextFileContentDiffer, name='d', text_in='b' * 100000)
+            rr = make_runner(RunCommand,
+                             differs=(dr, ),
+                             name='r',
+                             command=cmd,
+                             working_dir=tmpdir,
+                             output_limit=2000,
+                             output_file='out.log')
+            tc = TestCase(runner=rr)
+
+            for s, r in [tc.execute(), asyncio.run(tc.executeAsync())]:
+                self.assertEqual(s, TestCase.Result.PASS, r)
+                stdout = r['r'].stdout
+                self.assertIn('a' * 1000 + '\n...100001 bytes removed', stdout)
+                self.assertIn('out.log', stdout)
+                self.assertTrue(stdout.endswith('c' * 999 + '\n'))
+                self.assertLess(len(stdout), 3000)
+                self.assertEqual(r['d'].state, TestCase.Result.PASS)  # complete output in the file
+
+    def testExecuteResourceUsage(self):
+        cmd = (sys.executable, '-c',
+               "import time; x = b'x' * (64 * 1024**2); print(sum(range(10**6))); time.sleep(0.2)")
+        rr = make_runner(RunCommand, name='r', command=cmd)
+        tc = TestCase(runner=rr)
+
+        s, r = tc.execute()
+        self.assertEqual(s, TestCase.Result.PASS)
+        usage = r['r'].usage
+        self.assertGreater(usage['user_time'] + usage['system_time'], 0)
+        self.assertGreater(usage['max_rss'], 64)
+        self.assertLess(usage['max_rss'], 256)
+        if os.path.exists(f'/proc/{os.getpid()}/io'):
+            self.assertIn('read_bytes', usage)
+            self.assertIn('write_bytes', usage)
+
+        # Not included in the comparison
+        data = TestCase.Data(s, 0, r['r'].stdout, r['r'].stderr, [])
+        self.assertEqual(r['r'], data)
+
+        # The return code is still available
+        rr.parameters().setValue('command', (sys.executable, '-c', "import sys; sys.exit(42)"))
+        s, r = tc.execute()
+        self.assertEqual(r['r'].returncode, 42)
+        self.assertIsNotNone(r['r'].usage)
+
+        # Only the sampled memory is available with the asynchronous execution
+        rr.parameters().setValue('command', cmd)
+        s, r = asyncio.run(tc.executeAsync())
+        self.assertEqual(s, TestCase.Result.PASS)
+        if os.path.exists(f'/proc/{os.getpid()}/status'):
+            self.assertEqual(list(r['r'].usage.keys()), ['max_rss'])
+            self.assertGreater(r['r'].usage['max_rss'], 64)
+        else:
+            self.assertIsNone(r['r'].usage)
+
+    @unittest.skipIf(not os.path.exists(f'/proc/{os.getpid()}/status'), "Requires Linux.")
+    def testExecuteResourceUsageSmall(self):
+
+        # The memory of this process is not included in the memory of the command
+        x = b'x' * (128 * 1024**2)
+        rr = make_runner(RunCommand, name='r', command=('sleep', '0.2'))
+        tc = TestCase(runner=rr)
+        for s, r in [tc.execute(), asyncio.run(tc.executeAsync())]:
+            self.assertEqual(s, TestCase.Result.PASS)
+            self.assertLess(r['r'].usage['max_rss'], 20)
+
     def testSetResults(self):
         ct = TestController()
         dr = make_differ(TestDiffer, [ct], name='d')
@@ -13,8 +13,10 @@ import sys
 import unittest
 import platform
 import argparse
+import tempfile
 from unittest import mock
 
+from moosetools import core
 from moosetools import mooseutils
 from moosetools import moosetest
 
@@ -67,6 +69,71 @@ class TestTestHarness(unittest.TestCase):
 
         self.assertEqual(rcode, 0)
 
+    def testDiscoverIndex(self):
+        path = os.path.join(os.path.dirname(__file__), '..', 'demo')
+        with tempfile.TemporaryDirectory() as tmpdir, mooseutils.CurrentWorkingDirectory(path):
+            filename = os.path.join(tmpdir, 'index.json')
+            th = moosetest.base.TestHarness(index_file=filename)
+            names = [[r.name() for r in runners] for runners in th.discover()]
+            self.assertTrue(os.path.isfile(filename))
+            self.assertIn("tests/tests:Tests/runner0", names[0])
+
+            with mock.patch('os.scandir') as scandir:
+                groups = th.discover()
+            scandir.assert_not_called()
+            self.assertEqual([[r.name() for r in runners] for runners in groups], names)
+
+    def testDiscoverSpecCache(self):
+        path = os.path.join(os.path.dirname(__file__), '..', 'demo')
+        with tempfile.TemporaryDirectory() as tmpdir, mooseutils.CurrentWorkingDirectory(path):
+            filename = os.path.join(tmpdir, 'specs.pickle')
+            th = moosetest.base.TestHarness(spec_cache_file=filename,
+                                            controllers=(moosetest.controllers.TagController(), ))
+            names = [[r.name() for r in runners] for runners in th.discover()]
+            self.assertTrue(os.path.isfile(filename))
+
+            with mock.patch('moosetools.pyhit.parse', side_effect=Exception()):
+                groups = th.discover()
+            self.assertEqual([[r.name() for r in runners] for runners in groups], names)
+
+    def testDiscoverManifest(self):
+        path = os.path.join(os.path.dirname(__file__), '..', 'demo')
+        with tempfile.TemporaryDirectory() as tmpdir, mooseutils.CurrentWorkingDirectory(path):
+            filename = os.path.join(tmpdir, 'manifest.json')
+            with mock.patch.dict(os.environ, {'MOOSETOOLS_FACTORY_MANIFEST': filename}):
+                th = moosetest.base.TestHarness()
+                names = [[r.name() for r in runners] for runners in th.discover()]
+                self.assertTrue(os.path.isfile(filename))
+
+                with mock.patch('inspect.getmembers') as getmembers:
+                    groups = th.discover()
+                getmembers.assert_not_called()
+                self.assertEqual([[r.name() for r in runners] for runners in groups], names)
+
+    def testShard(self):
+        th = moosetest.base.TestHarness(shard='2/3')
+        groups = [[moosetest.runners.RunCommand(name=f'{i}', command=('true', )) for i in range(9)]]
+        with mock.patch('moosetools.moosetest.run', return_value=0) as run:
+            rcode = th.run(groups)
+        self.assertEqual(rcode, 0)
+        self.assertEqual(run.call_args[0][0], moosetest.shard(groups, 2, 3))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'timing.json')
+            th = moosetest.base.TestHarness(shard='2/3', timing_file=filename)
+            with mock.patch('moosetools.moosetest.run', return_value=0):
+                th.run(groups)
+            self.assertFalse(os.path.exists(filename))
+
+            th = moosetest.base.TestHarness(timing_file=filename)
+            with mock.patch('moosetools.moosetest.run', return_value=0):
+                th.run(groups)
+            self.assertTrue(os.path.exists(filename))
+
+        with self.assertRaises(core.MooseException) as ex:
+            moosetest.base.TestHarness(shard='4/3')
+        self.assertIn("The shard must be in the form INDEX/COUNT", str(ex.exception))
+
 
 if __name__ == '__main__':
     unittest.main(module=__name__, verbosity=2, buffer=True)
@@ -173,25 +173,25 @@ class TestBasicFormatter(unittest.TestCase):
 
     def test_formatRunnerProgress(self):
         obj = BasicFormatter()
-        with mock.patch('moosetools.moosetest.formatters.BasicFormatter._formatProgress') as fm:
+        with mock.patch.object(BasicFormatter, '_formatProgress') as fm:
             obj.formatRunnerProgress(name='Andrew')
         fm.assert_called_once_with(name='Andrew')
 
     def test_formatDifferProgress(self):
         obj = BasicFormatter()
-        with mock.patch('moosetools.moosetest.formatters.BasicFormatter._formatProgress') as fm:
+        with mock.patch.object(BasicFormatter, '_formatProgress') as fm:
             obj.formatDifferProgress(name='Andrew', percent=42, duration=42)
         fm.assert_called_once_with(indent=' ' * 4, name='Andrew')
 
     def test_formatRunnerResult(self):
         obj = BasicFormatter()
-        with mock.patch('moosetools.moosetest.formatters.BasicFormatter._formatResult') as fm:
+        with mock.patch.object(BasicFormatter, '_formatResult') as fm:
             obj.formatRunnerResult(name='Andrew')
         fm.assert_called_once_with(name='Andrew')
 
     def test_formatDifferProgress(self):
         obj = BasicFormatter()
-        with mock.patch('moosetools.moosetest.formatters.BasicFormatter._formatResult') as fm:
+        with mock.patch.object(BasicFormatter, '_formatResult') as fm:
             obj.formatDifferResult(name='Andrew')
         fm.assert_called_once_with(indent=' ' * 4, name='Andrew')
 
@@ -199,10 +199,11 @@ class TestBasicFormatter(unittest.TestCase):
         obj = BasicFormatter()
 
         class TestCaseProxy(object):
-            def __init__(self, name, state, t):
+            def __init__(self, name, state, t, usage=None):
                 self._name = name
                 self.state = state
                 self.time = t
+                self.results = {name: TestCase.Data(state, None, None, None, None, usage=usage)}
 
             def name(self):
                 return self._name
@@ -226,6 +227,35 @@ class TestBasicFormatter(unittest.TestCase):
 
         self.assertIn('Longest running test(s)', text)
         self.assertIn('\n  20.00s B\n  10.00s A', text)
+        self.assertNotIn('Highest CPU time test(s)', text)
+        self.assertNotIn('Highest memory test(s)', text)
+
+        # Resource usage
+        complete = [
+            TestCaseProxy('A', TestCase.Result.PASS, 10, {
+                'user_time': 1,
+                'system_time': 0.5,
+                'max_rss': 10
+            }),
+            TestCaseProxy('B', TestCase.Result.PASS, 20, {
+                'user_time': 1,
+                'system_time': 0,
+                'max_rss': 200
+            }),
+            TestCaseProxy('C', TestCase.Result.PASS, 30, {
+                'user_time': 0.1,
+                'system_time': 0,
+                'max_rss': 1
+            }),
+            TestCaseProxy('D', TestCase.Result.SKIP, 0),
+            TestCaseProxy('E', TestCase.Result.PASS, 40, {'max_rss': 50})  # without CPU time
+        ]
+        obj.parameters().setValue('print_resource_usage_tests', 3)
+        with mock.patch('moosetools.mooseutils.color_text', side_effect=lambda *args: args[0]):
+            text = obj.formatComplete(complete, **kwargs)
+        self.assertIn('\nHighest CPU time test(s):\n  1.50s A\n  1.00s B\n  0.10s C\n', text)
+        self.assertTrue(
+            text.endswith('\nHighest memory test(s):\n  200.0MB B\n  50.0MB E\n  10.0MB A'))
 
     def test_setup(self):
         obj = BasicFormatter()
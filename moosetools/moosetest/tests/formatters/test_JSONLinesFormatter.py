@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import os
+import json
+import time
+import tempfile
+import unittest
+from moosetools.moosetest.base import make_runner, TestCase
+from moosetools.moosetest.runners import RunCommand
+from moosetools.moosetest.formatters import JSONLinesFormatter
+
+
+def make_testcase(name, state, stdout='', reasons=None, usage=None):
+    tc = TestCase(runner=make_runner(RunCommand, name=name, command=('true', )))
+    tc.setProgress(TestCase.Progress.FINISHED)
+    tc.setState(state)
+    tc.setResults({name: TestCase.Data(state, 0, stdout, '', reasons, usage=usage)})
+    return tc
+
+
+class TestJSONLinesFormatter(unittest.TestCase):
+    def testDefault(self):
+        obj = JSONLinesFormatter()
+        self.assertEqual(obj.getParam('filename'), 'moosetest.jsonl')
+
+    def testReport(self):
+        tc0 = make_testcase('spec:a', TestCase.Result.PASS, 'out', usage={'max_rss': 1.5})
+        tc1 = make_testcase('spec:b', TestCase.Result.DIFF, reasons=['diff'])
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'sub', 'results.jsonl')
+            obj = JSONLinesFormatter(filename=filename)
+            self.assertFalse(os.path.exists(filename))
+
+            # Each result is available as soon as it is reported
+            obj.reportResults(tc0)
+            with open(filename, 'r') as fid:
+                lines = fid.readlines()
+            self.assertEqual(len(lines), 1)
+            data = json.loads(lines[0])
+            self.assertEqual(data['name'], 'spec:a')
+            self.assertEqual(data['state'], 'PASS')
+            self.assertIn('time', data)
+            self.assertEqual(
+                data['results'], {
+                    'spec:a': {
+                        'state': 'PASS',
+                        'returncode': 0,
+                        'reasons': None,
+                        'stdout': 'out',
+                        'stderr': '',
+                        'usage': {
+                            'max_rss': 1.5
+                        }
+                    }
+                })
+
+            obj.reportResults(tc1)
+            text = obj.reportComplete([tc0, tc1], time.time())
+            self.assertIn('Executed 2 tests', text)
+            with open(filename, 'r') as fid:
+                lines = fid.readlines()
+            self.assertEqual(len(lines), 2)
+            data = json.loads(lines[1])
+            self.assertEqual(data['name'], 'spec:b')
+            self.assertEqual(data['state'], 'DIFF')
+            self.assertEqual(data['results']['spec:b']['reasons'], ['diff'])
+
+    def testEmpty(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'results.jsonl')
+            obj = JSONLinesFormatter(filename=filename)
+            obj.reportComplete([], time.time())
+            with open(filename, 'r') as fid:
+                self.assertEqual(fid.read(), '')
+
+
+if __name__ == '__main__':
+    unittest.main(module=__name__, verbosity=2, buffer=True)
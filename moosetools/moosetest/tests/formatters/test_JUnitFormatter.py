@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import os
+import time
+import tempfile
+import unittest
+import xml.etree.ElementTree as ET
+from moosetools.moosetest.base import make_runner, TestCase
+from moosetools.moosetest.runners import RunCommand
+from moosetools.moosetest.formatters import JUnitFormatter
+
+
+def make_testcase(name, state, stdout='', stderr='', reasons=None):
+    tc = TestCase(runner=make_runner(RunCommand, name=name, command=('true', )))
+    tc.setProgress(TestCase.Progress.FINISHED)
+    tc.setState(state)
+    tc.setResults({name: TestCase.Data(state, 0, stdout, stderr, reasons)})
+    return tc
+
+
+class TestJUnitFormatter(unittest.TestCase):
+    def testDefault(self):
+        obj = JUnitFormatter()
+        self.assertEqual(obj.getParam('filename'), 'moosetest.xml')
+        self.assertEqual(obj.getParam('suite_name'), 'moosetest')
+
+    def testToXML(self):
+        tc = make_testcase('path/spec:a', TestCase.Result.PASS, 'out <&>\x1b[0m', 'err')
+        elem = ET.fromstring(JUnitFormatter.toXML(tc))
+        self.assertEqual(elem.tag, 'testcase')
+        self.assertEqual(elem.get('name'), 'a')
+        self.assertEqual(elem.get('classname'), 'path/spec')
+        self.assertEqual(elem.find('system-out').text, 'out <&>[0m')
+        self.assertEqual(elem.find('system-err').text, 'err')
+        self.assertEqual([e.tag for e in elem], ['system-out', 'system-err'])
+
+        tc = make_testcase('b', TestCase.Result.SKIP, reasons=['skipped', 'because'])
+        elem = ET.fromstring(JUnitFormatter.toXML(tc))
+        self.assertEqual(elem.get('name'), 'b')
+        self.assertEqual(elem.get('classname'), '')
+        self.assertEqual([e.tag for e in elem], ['skipped'])
+        self.assertEqual(elem.find('skipped').get('message'), 'skipped, because')
+
+        tc = make_testcase('c', TestCase.Result.DIFF, reasons=['"diff"'])
+        elem = ET.fromstring(JUnitFormatter.toXML(tc))
+        self.assertEqual(elem.find('failure').get('message'), '"diff"')
+        self.assertEqual(elem.find('failure').get('type'), 'DIFF')
+
+        tc = make_testcase('d', TestCase.Result.EXCEPTION)
+        elem = ET.fromstring(JUnitFormatter.toXML(tc))
+        self.assertEqual(elem.find('error').get('message'), 'EXCEPTION')
+        self.assertEqual(elem.find('error').get('type'), 'EXCEPTION')
+
+    def testReport(self):
+        tc0 = make_testcase('spec:a', TestCase.Result.PASS)
+        tc1 = make_testcase('spec:b', TestCase.Result.ERROR, reasons=['error'])
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'results.xml')
+            obj = JUnitFormatter(filename=filename, suite_name='suite')
+
+            # The file is valid after each result is reported
+            obj.reportResults(tc0)
+            root = ET.parse(filename).getroot()
+            self.assertEqual(root.tag, 'testsuites')
+            suite = root.find('testsuite')
+            self.assertEqual(suite.get('name'), 'suite')
+            self.assertEqual([e.get('name') for e in suite], ['a'])
+
+            obj.reportResults(tc1)
+            suite = ET.parse(filename).getroot().find('testsuite')
+            self.assertEqual([e.get('name') for e in suite], ['a', 'b'])
+
+            text = obj.reportComplete([tc0, tc1], time.time())
+            self.assertIn('Executed 2 tests', text)
+            suite = ET.parse(filename).getroot().find('testsuite')
+            self.assertEqual([e.get('name') for e in suite], ['a', 'b'])
+            self.assertEqual(suite[1].find('failure').get('message'), 'error')
+
+    def testEmpty(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'results.xml')
+            obj = JUnitFormatter(filename=filename)
+            obj.reportComplete([], time.time())
+            root = ET.parse(filename).getroot()
+            self.assertEqual(len(root.find('testsuite')), 0)
+
+
+if __name__ == '__main__':
+    unittest.main(module=__name__, verbosity=2, buffer=True)
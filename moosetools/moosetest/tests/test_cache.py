@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import os
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from moosetools.moosetest.base import make_runner, make_differ, TestCase
+from moosetools.moosetest.runners import RunCommand
+from moosetools.moosetest.differs import TextFileDiffer
+from moosetools.moosetest.cache import ResultCache
+
+# I do not want the tests directory to be packages with __init__.py, so load from file
+sys.path.append(os.path.join(os.path.dirname(__file__)))
+from _helpers import TestRunner, TestController
+
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self._filename = os.path.join(self._tmpdir.name, 'cache.json')
+
+    def tearDown(self):
+        self._tmpdir.cleanup()
+
+    def write(self, name, content):
+        with open(os.path.join(self._tmpdir.name, name), 'w') as fid:
+            fid.write(content)
+
+    def testMemory(self):
+        cache = ResultCache()
+        self.assertIsNone(cache.filename)
+        self.assertEqual(len(cache), 0)
+        self.assertIsNone(cache.get('a'))
+
+        cache.set('a', 'abc')
+        self.assertIn('a', cache)
+        self.assertEqual(cache.get('a'), 'abc')
+        cache.remove('a')
+        cache.remove('a')
+        self.assertNotIn('a', cache)
+        cache.save()  # does nothing
+
+    def testSaveLoad(self):
+        cache = ResultCache(self._filename)
+        cache.set('a', 'abc')
+        cache.set('b', 'def')
+        cache.save()
+
+        with open(self._filename, 'r') as fid:
+            self.assertEqual(json.load(fid), {
+                'version': ResultCache.VERSION,
+                'tests': {
+                    'a': 'abc',
+                    'b': 'def'
+                }
+            })
+
+        cache = ResultCache(self._filename)
+        self.assertEqual(cache.get('a'), 'abc')
+        self.assertEqual(cache.get('b'), 'def')
+        self.assertEqual(os.listdir(self._tmpdir.name), ['cache.json'])
+
+        # Clear
+        cache = ResultCache(self._filename, clear=True)
+        self.assertEqual(len(cache), 0)
+
+        # Old version
+        with open(self._filename, 'w') as fid:
+            json.dump({'version': ResultCache.VERSION - 1, 'tests': {'a': 'abc'}}, fid)
+        cache = ResultCache(self._filename)
+        self.assertEqual(len(cache), 0)
+
+    def testCorrupt(self):
+        with open(self._filename, 'w') as fid:
+            fid.write('{not json')
+
+        with self.assertLogs(level='WARNING') as log:
+            cache = ResultCache(self._filename)
+        self.assertEqual(len(cache), 0)
+        self.assertIn("Failed to load the test cache file", log.output[0])
+
+    def testUpdate(self):
+        tc0 = TestCase(runner=make_runner(TestRunner, name='a'))
+        tc1 = TestCase(runner=make_runner(TestRunner, name='b'))
+        tc2 = TestCase(runner=make_runner(TestRunner, name='c'))
+        tc0.setState(TestCase.Result.PASS)
+        tc1.setState(TestCase.Result.SKIP)
+        tc2.setState(TestCase.Result.ERROR)
+
+        cache = ResultCache()
+        cache.set('b', 'old')
+        cache.set('c', 'old')
+        cache.update(tc0, 'new')
+        cache.update(tc1, 'new')
+        cache.update(tc2, 'new')
+
+        self.assertTrue(cache.check(tc0, 'new'))
+        self.assertFalse(cache.check(tc0, 'old'))
+        self.assertEqual(cache.get('b'), 'old')
+        self.assertNotIn('c', cache)
+
+    def testFingerprint(self):
+        self.write('input.i', 'foo')
+        self.write('gold.txt', 'bar')
+        wd = self._tmpdir.name
+        cache = ResultCache()
+
+        def make_testcase(**kwargs):
+            ct = TestController()
+            dr = make_differ(TextFileDiffer, [ct], name='d', file_goldnames=('gold.txt', ))
+            kwargs.setdefault('command', ('cat', 'input.i'))
+            rr = make_runner(RunCommand, [ct],
+                             name='r',
+                             differs=(dr, ),
+                             working_dir=wd,
+                             file_names_created=('out.txt', ),
+                             **kwargs)
+            return TestCase(runner=rr, controllers=(ct, ))
+
+        fp = cache.fingerprint(make_testcase())
+        self.assertEqual(fp, cache.fingerprint(make_testcase()))
+
+        # Parameters
+        self.assertNotEqual(fp, cache.fingerprint(make_testcase(command=('cat', 'other.i'))))
+        self.assertNotEqual(fp, cache.fingerprint(make_testcase(timeout=4)))
+
+        # Output files are not included
+        self.write('out.txt', 'output')
+        self.assertEqual(fp, cache.fingerprint(make_testcase()))
+
+        # Input and gold files
+        self.write('input.i', 'foo2')
+        fp2 = cache.fingerprint(make_testcase())
+        self.assertNotEqual(fp, fp2)
+
+        self.write('gold.txt', 'bar2')
+        self.assertNotEqual(fp2, cache.fingerprint(make_testcase()))
+
+        # Executable
+        self.write('app', '#!/bin/sh\n')
+        fp = cache.fingerprint(make_testcase(command=('./app', )))
+        self.write('app', '#!/bin/sh\necho foo\n')
+        self.assertNotEqual(fp, cache.fingerprint(make_testcase(command=('./app', ))))
+
+        # Shared libraries of the executable
+        self.write('libapp.so', 'foo')
+        with mock.patch.object(ResultCache,
+                               '_getDependencies',
+                               return_value=[os.path.join(self._tmpdir.name, 'libapp.so')]):
+            fp = ResultCache().fingerprint(make_testcase(command=('./app', )))
+            self.write('libapp.so', 'foo2')
+            self.assertNotEqual(fp, ResultCache().fingerprint(make_testcase(command=('./app', ))))
+
+        # Environment, the variables matching the patterns or referenced by the command
+        fp = ResultCache().fingerprint(make_testcase())
+        with mock.patch.dict(os.environ, {'MOOSE_DIR': '/moose'}):
+            self.assertNotEqual(fp, ResultCache().fingerprint(make_testcase()))
+        with mock.patch.dict(os.environ, {'MOOSETEST_OTHER': 'andrew'}):
+            self.assertEqual(fp, ResultCache().fingerprint(make_testcase()))
+
+        cmd = ('echo', '${MOOSETEST_OTHER}')
+        fp = ResultCache().fingerprint(make_testcase(command=cmd))
+        with mock.patch.dict(os.environ, {'MOOSETEST_OTHER': 'andrew'}):
+            self.assertNotEqual(fp, ResultCache().fingerprint(make_testcase(command=cmd)))
+
+    @unittest.skipIf(not sys.platform.startswith('linux'), "Requires Linux")
+    def test_getDependencies(self):
+        libs = ResultCache._getDependencies(shutil.which('sh'))
+        self.assertTrue(any('libc' in os.path.basename(lib) for lib in libs), libs)
+        self.assertEqual(ResultCache._getDependencies(__file__), [])
+
+
+if __name__ == '__main__':
+    unittest.main(module=__name__, verbosity=2, buffer=True)
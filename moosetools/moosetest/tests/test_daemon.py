@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import os
+import sys
+import stat
+import time
+import tempfile
+import unittest
+import multiprocessing
+from unittest import mock
+from moosetools.moosetest import daemon
+
+
+def func():
+    print(' '.join(sys.argv), os.getcwd(), os.getenv('MOOSETEST_DAEMON_TEST'))
+    print('error', file=sys.stderr)
+    if sys.argv[-1] == 'exit':
+        sys.exit(4)
+    return 3
+
+
+@unittest.skipIf(not hasattr(os, 'fork'), "Requires os.fork")
+class TestDaemon(unittest.TestCase):
+    def testNotAvailable(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self.assertIsNone(daemon.request(os.path.join(tmpdir, 'socket'), ['moosetest']))
+
+    def testRequest(self):
+        ctx = multiprocessing.get_context('fork')
+        with tempfile.TemporaryDirectory() as tmpdir:
+            address = os.path.join(tmpdir, 'socket')
+            proc = ctx.Process(target=daemon.serve, args=(address, func))
+            proc.start()
+            try:
+                for i in range(100):
+                    if os.path.exists(address):
+                        break
+                    time.sleep(0.05)
+                self.assertEqual(stat.S_IMODE(os.stat(address).st_mode), 0o600)
+
+                stdout = os.path.join(tmpdir, 'stdout')
+                stderr = os.path.join(tmpdir, 'stderr')
+                os.environ['MOOSETEST_DAEMON_TEST'] = 'andrew'
+                for argv, returncode in [(['moosetest', '--foo'], 3), (['moosetest', 'exit'], 4)]:
+                    with open(stdout, 'w') as out, open(stderr, 'w') as err:
+                        rcode = daemon.request(address, argv, (0, out.fileno(), err.fileno()))
+                    self.assertEqual(rcode, returncode)
+                    with open(stdout, 'r') as fid:
+                        self.assertEqual(fid.read(), f"{' '.join(argv)} {os.getcwd()} andrew\n")
+                    with open(stderr, 'r') as fid:
+                        self.assertEqual(fid.read(), 'error\n')
+            finally:
+                os.environ.pop('MOOSETEST_DAEMON_TEST', None)
+                proc.terminate()
+                proc.join()
+            self.assertFalse(os.path.exists(address))
+
+    @unittest.skipIf(not hasattr(daemon.socket, 'SO_PEERCRED'), "Requires SO_PEERCRED")
+    def testRequestOtherUser(self):
+        ctx = multiprocessing.get_context('fork')
+        with tempfile.TemporaryDirectory() as tmpdir:
+            address = os.path.join(tmpdir, 'socket')
+
+            # The request of another user is rejected, so the client executes as usual
+            with mock.patch.object(daemon, '_get_peer_uid', return_value=os.getuid() + 1):
+                proc = ctx.Process(target=daemon.serve, args=(address, func))
+                proc.start()
+            try:
+                for i in range(100):
+                    if os.path.exists(address):
+                        break
+                    time.sleep(0.05)
+                self.assertIsNone(daemon.request(address, ['moosetest']))
+            finally:
+                proc.terminate()
+                proc.join()
+
+    @unittest.skipIf(not hasattr(daemon.socket, 'SO_PEERCRED'), "Requires SO_PEERCRED")
+    def test_get_peer_uid(self):
+        a, b = daemon.socket.socketpair(daemon.socket.AF_UNIX)
+        with a, b:
+            self.assertEqual(daemon._get_peer_uid(a), os.getuid())
+
+
+if __name__ == '__main__':
+    unittest.main(module=__name__, verbosity=2, buffer=True)
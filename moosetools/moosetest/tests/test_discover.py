@@ -16,13 +16,15 @@ import queue
 import platform
 import uuid
 import logging
+import tempfile
 import concurrent.futures
 
 from moosetools import pyhit
 from moosetools.parameters import InputParameters
 from moosetools.moosetest import discover
 from moosetools.moosetest.controllers import TagController
-from moosetools.moosetest.discover import MooseTestFactory
+from moosetools.moosetest.discover import MooseTestFactory, find_spec_files
+from moosetools.moosetest.index import DirectoryIndex
 
 # I do not want the tests directory to be packages with __init__.py, so load from file
 sys.path.append(os.path.join(os.path.dirname(__file__)))
@@ -43,6 +45,21 @@ class TestMooseTestFactory(unittest.TestCase):
         self.assertIn('ctrl', params)
         self.assertIsInstance(params.getValue('ctrl'), InputParameters)
 
+    def testTemplate(self):
+        f = MooseTestFactory(controllers=(TestController(), ))
+        f.load()
+        otype = f._registered_types['TestDiffer']
+        with mock.patch.object(otype, 'validParams', wraps=otype.validParams) as validParams:
+            params0 = f.params('TestDiffer')
+            params1 = f.params('TestDiffer')
+        validParams.assert_called_once()
+        self.assertIsNot(params0, params1)
+        self.assertIsNot(params0.getValue('ctrl'), params1.getValue('ctrl'))
+
+        params0.setValue('name', 'andrew')
+        self.assertIsNone(params1.getValue('name'))
+        self.assertIsNone(f.params('TestDiffer').getValue('name'))
+
     def testWithDefaults(self):
         f = MooseTestFactory(object_defaults={'_helpers.TestController': {'remove': 'true'}})
         f.load()
@@ -82,5 +99,87 @@ class TestDiscover(unittest.TestCase):
         differs = groups[0][2].getParam('differs')
 
 
+class TestFindSpecFiles(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self._start = self._tmpdir.name
+        for path in [
+                'tests', 'a/tests', 'a/b/tests', 'a/b/other', 'c/tests', '.git/tests',
+                'build/tests', 'module/tests', 'module/.git', 'module/sub/tests'
+        ]:
+            self.write(path)
+
+    def tearDown(self):
+        self._tmpdir.cleanup()
+
+    def write(self, path):
+        filename = os.path.join(self._start, path)
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        with open(filename, 'w') as fid:
+            fid.write('')
+
+    def relpaths(self, files):
+        return [os.path.relpath(f, self._start) for f in files]
+
+    def testDefault(self):
+        files = find_spec_files(self._start, ['tests'])
+        self.assertEqual(self.relpaths(files),
+                         ['tests', 'a/tests', 'a/b/tests', 'build/tests', 'c/tests'])
+
+        files = find_spec_files(self._start, ['tests', 'other'], n_threads=1)
+        self.assertEqual(self.relpaths(files),
+                         ['tests', 'a/tests', 'a/b/other', 'a/b/tests', 'build/tests', 'c/tests'])
+
+        # The start directory may be a repository
+        files = find_spec_files(os.path.join(self._start, 'module'), ['tests'])
+        self.assertEqual([os.path.relpath(f, os.path.join(self._start, 'module')) for f in files],
+                         ['tests', 'sub/tests'])
+
+    def testPrune(self):
+        files = find_spec_files(self._start, ['tests'], prune=('bui*', 'b'))
+        self.assertEqual(self.relpaths(files), ['tests', '.git/tests', 'a/tests', 'c/tests'])
+
+        files = find_spec_files(self._start, ['tests'], prune=tuple(), prune_repositories=False)
+        self.assertEqual(self.relpaths(files), [
+            'tests', '.git/tests', 'a/tests', 'a/b/tests', 'build/tests', 'c/tests', 'module/tests',
+            'module/sub/tests'
+        ])
+
+    def testIndex(self):
+        index = DirectoryIndex()
+        with mock.patch('os.scandir', side_effect=os.scandir) as scandir:
+            files = find_spec_files(self._start, ['tests'], index=index)
+        self.assertEqual(self.relpaths(files),
+                         ['tests', 'a/tests', 'a/b/tests', 'build/tests', 'c/tests'])
+        self.assertEqual(scandir.call_count, 6)  # '.git' is pruned by name
+        self.assertEqual(len(index), 6)
+
+        # Nothing changed, so nothing is read
+        with mock.patch('os.scandir', side_effect=os.scandir) as scandir:
+            files = find_spec_files(self._start, ['tests'], index=index)
+        self.assertEqual(self.relpaths(files),
+                         ['tests', 'a/tests', 'a/b/tests', 'build/tests', 'c/tests'])
+        self.assertEqual(scandir.call_count, 0)
+
+        # Only the modified directory is read
+        self.write('c/d/tests')
+        os.remove(os.path.join(self._start, 'a', 'b', 'tests'))
+        path = os.path.join(self._start, 'c')
+        os.utime(path, ns=(0, 0))
+        path = os.path.join(self._start, 'a', 'b')
+        os.utime(path, ns=(0, 0))
+        with mock.patch('os.scandir', side_effect=os.scandir) as scandir:
+            files = find_spec_files(self._start, ['tests'], index=index)
+        self.assertEqual(self.relpaths(files),
+                         ['tests', 'a/tests', 'build/tests', 'c/tests', 'c/d/tests'])
+        self.assertEqual(scandir.call_count, 3)
+
+        # Different settings are not used
+        with mock.patch('os.scandir', side_effect=os.scandir) as scandir:
+            files = find_spec_files(self._start, ['other'], index=index)
+        self.assertEqual(self.relpaths(files), ['a/b/other'])
+        self.assertEqual(scandir.call_count, 7)
+
+
 if __name__ == '__main__':
     unittest.main(module=__name__, verbosity=2, buffer=True)
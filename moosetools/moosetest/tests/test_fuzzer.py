@@ -8,23 +8,23 @@
 #* Licensed under LGPL 2.1, please see LICENSE for details
 #* https://www.gnu.org/licenses/lgpl-2.1.html
 
-import platform
+import sys
 import unittest
 from moosetools import moosetest
 
 
 class TestFuzzer(unittest.TestCase):
-    @unittest.skipIf(platform.python_version() < '3.7', "Python 3.7 or greater required")
+    @unittest.skipIf(sys.version_info < (3, 7), "Python 3.7 or greater required")
     def testFuzzer(self):
         rcode = moosetest.fuzzer()
         self.assertIn(rcode, (0, 1))
 
-    @unittest.skipIf(platform.python_version() < '3.7', "Python 3.7 or greater required")
+    @unittest.skipIf(sys.version_info < (3, 7), "Python 3.7 or greater required")
     def testFuzzerAgain(self):
         rcode = moosetest.fuzzer(group_num=(1, 8))
         self.assertIn(rcode, (0, 1))
 
-    @unittest.skipIf(platform.python_version() < '3.7', "Python 3.7 or greater required")
+    @unittest.skipIf(sys.version_info < (3, 7), "Python 3.7 or greater required")
     def testFuzzerYetAgain(self):
         rcode = moosetest.fuzzer(group_num=(2, 6))
         self.assertIn(rcode, (0, 1))
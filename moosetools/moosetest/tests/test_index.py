@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import os
+import json
+import tempfile
+import unittest
+from moosetools.moosetest.index import DirectoryIndex
+
+
+class TestDirectoryIndex(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self._filename = os.path.join(self._tmpdir.name, 'index.json')
+
+    def tearDown(self):
+        self._tmpdir.cleanup()
+
+    def testMemory(self):
+        index = DirectoryIndex()
+        self.assertIsNone(index.filename)
+        self.assertEqual(len(index), 0)
+        self.assertIsNone(index.get(''))
+
+        index.prepare('a')
+        index.update({'': (1, ['tests'], ['sub']), 'sub': (2, [], [])})
+        self.assertEqual(len(index), 2)
+        self.assertIn('sub', index)
+        self.assertEqual(index.get(''), (1, ['tests'], ['sub']))
+
+        # Same signature, the entries are kept
+        index.prepare('a')
+        self.assertEqual(len(index), 2)
+
+        # Different signature
+        index.prepare('b')
+        self.assertEqual(len(index), 0)
+        index.save()  # does nothing
+
+    def testSaveLoad(self):
+        index = DirectoryIndex(self._filename)
+        index.prepare('a')
+        index.update({'': (1, ['tests'], ['sub']), 'sub': (2, [], [])})
+        index.save()
+
+        with open(self._filename, 'r') as fid:
+            data = json.load(fid)
+        self.assertEqual(data['version'], DirectoryIndex.VERSION)
+        self.assertEqual(data['signature'], 'a')
+
+        index = DirectoryIndex(self._filename)
+        self.assertEqual(index.filename, self._filename)
+        self.assertEqual(index.get(''), (1, ['tests'], ['sub']))
+        self.assertEqual(index.get('sub'), (2, [], []))
+        index.prepare('a')
+        self.assertEqual(len(index), 2)
+
+    def testCorrupt(self):
+        with open(self._filename, 'w') as fid:
+            fid.write('{"version": 1, "signature": "a", "directories": {"": 1}}')
+        with self.assertLogs(level='WARNING') as log:
+            index = DirectoryIndex(self._filename)
+        self.assertEqual(len(index), 0)
+        self.assertIn("Failed to load the directory index file", log.output[0])
+
+        # Other versions are ignored
+        with open(self._filename, 'w') as fid:
+            json.dump({'version': 0, 'signature': 'a', 'directories': {'': [1, [], []]}}, fid)
+        index = DirectoryIndex(self._filename)
+        self.assertEqual(len(index), 0)
+
+
+if __name__ == '__main__':
+    unittest.main(module=__name__, verbosity=2, buffer=True)
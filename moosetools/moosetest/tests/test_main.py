@@ -9,13 +9,12 @@
 #* https://www.gnu.org/licenses/lgpl-2.1.html
 
 import os
-import platform
 import sys
 import argparse
 import unittest
 from unittest import mock
 
-from moosetools import pyhit, mooseutils
+from moosetools import pyhit, mooseutils, factory
 from moosetools.moosetest import main
 from moosetools.moosetest.base import Controller, TestCase, RedirectOutput, TestHarness
 from moosetools.moosetest.main import _make_harness, _make_controllers, _make_formatter, _setup_environment, _locate_config, _load_config, _get_object_defaults
@@ -44,14 +43,14 @@ class Test_make_harness(unittest.TestCase):
         self.assertEqual(th.getParam('n_threads'), 1)
 
     def testExceptions(self):
-        with mock.patch('moosetools.factory.Factory.status', return_value=1):
+        with mock.patch.object(factory.Factory, 'status', return_value=1):
             with self.assertRaises(RuntimeError) as ex, mock.patch(
                     'os.path.isdir', return_value=True), mock.patch('os.chdir'):
                 th = _make_harness('.moosetest', pyhit.Node(None), tuple(), None, None)
             self.assertIn("An error occurred during registration of the TestHarness",
                           str(ex.exception))
 
-        with mock.patch('moosetools.factory.Parser.status', return_value=1):
+        with mock.patch.object(factory.Parser, 'status', return_value=1):
             with self.assertRaises(RuntimeError) as ex, mock.patch(
                     'os.path.isdir', return_value=True), mock.patch('os.chdir'):
                 th = _make_harness('.moosetest', pyhit.Node(None), tuple(), None, None)
@@ -83,13 +82,13 @@ class Test_make_controllers(unittest.TestCase):
         self.assertEqual(list(controllers)[0].getParam('prefix'), 'environment')
 
     def testExceptions(self):
-        with mock.patch('moosetools.factory.Factory.status', return_value=1):
+        with mock.patch.object(factory.Factory, 'status', return_value=1):
             with self.assertRaises(RuntimeError) as ex, mock.patch(
                     'os.path.isdir', return_value=True), mock.patch('os.chdir'):
                 _make_controllers('.moosetest', pyhit.Node(None))
             self.assertIn("An error occurred registering the Controller type", str(ex.exception))
 
-        with mock.patch('moosetools.factory.Parser.status', return_value=1):
+        with mock.patch.object(factory.Parser, 'status', return_value=1):
             with self.assertRaises(RuntimeError) as ex, mock.patch(
                     'os.path.isdir', return_value=True), mock.patch('os.chdir'):
                 _make_controllers('.moosetest', pyhit.Node(None))
@@ -116,13 +115,13 @@ class Test_make_formatter(unittest.TestCase):
         self.assertEqual(formatter.getParam('width'), 1980)
 
     def testExceptions(self):
-        with mock.patch('moosetools.factory.Factory.status', return_value=1):
+        with mock.patch.object(factory.Factory, 'status', return_value=1):
             with self.assertRaises(RuntimeError) as ex, mock.patch(
                     'os.path.isdir', return_value=True), mock.patch('os.chdir'):
                 formatter = _make_formatter('.moosetest', pyhit.Node(None))
             self.assertIn("An error occurred registering the Formatter type", str(ex.exception))
 
-        with mock.patch('moosetools.factory.Parser.status', return_value=1):
+        with mock.patch.object(factory.Parser, 'status', return_value=1):
             with self.assertRaises(RuntimeError) as ex, mock.patch(
                     'os.path.isdir', return_value=True), mock.patch('os.chdir'):
                 formatter = _make_formatter('.moosetest', pyhit.Node(None))
@@ -171,7 +170,7 @@ class Test_load_config(unittest.TestCase):
         self.assertIn("The configuration file, 'wrong'", str(ex.exception))
 
 
-@unittest.skipIf(platform.python_version() < '3.7', "Python 3.7 or greater required")
+@unittest.skipIf(sys.version_info < (3, 7), "Python 3.7 or greater required")
 class Test_main(unittest.TestCase):
     def setUp(self):
         self._args = argparse.Namespace(config=os.path.join(os.path.dirname(__file__), 'demo',
@@ -191,7 +190,7 @@ class Test_main(unittest.TestCase):
         rcode = main()
         self.assertEqual(rcode, 0)
 
-    @mock.patch('moosetools.moosetest.base.TestHarness.status')
+    @mock.patch.object(TestHarness, 'status')
     @mock.patch('argparse.ArgumentParser.parse_known_args')
     def test_exceptions(self, mock_cli_args, mock_status):
         mock_cli_args.return_value = (self._args, None)
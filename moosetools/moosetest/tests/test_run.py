@@ -10,38 +10,28 @@
 
 import os
 import sys
+import signal
 import unittest
 from unittest import mock
-import queue
 import uuid
-import platform
+import time
 import logging
-import concurrent.futures
+import tempfile
+import multiprocessing
+import multiprocessing.connection
 
 from moosetools.moosetest.base import make_runner, make_differ, TestCase, State, Formatter, Runner, Differ
 from moosetools.moosetest.runners import RunCommand
 from moosetools.moosetest import run, fuzzer
-from moosetools.moosetest.run import _execute_testcase, _execute_testcases
+from moosetools.moosetest.run import _execute_testcase, _Worker, _restore_process_state
 from moosetools.moosetest.run import _report_progress_and_results
+from moosetools.moosetest.cache import ResultCache
 
 # I do not want the tests directory to be packages with __init__.py, so load from file
 sys.path.append(os.path.join(os.path.dirname(__file__)))
 from _helpers import TestController, TestRunner, TestDiffer
 
 
-class PipeProxy(object):
-    def __init__(self):
-        self.state = None
-        self.result = None
-
-    def send(self, data):
-        self.state = data[0]
-        self.result = data[1]
-
-    def close(self):
-        pass
-
-
 def get_uid(tc):
     return tc.getParam('_unique_id')
 
@@ -53,20 +43,38 @@ def make_testcase_map(*args):
     return out
 
 
+# Command that creates the 'started' file and waits for SIGINT, which creates the 'interrupted' file
+_INTERRUPT_COMMAND = '''
+import sys, time, signal
+def handler(*args):
+    open('interrupted', 'w').close()
+    sys.exit(0)
+signal.signal(signal.SIGINT, handler)
+signal.signal(signal.SIGTERM, handler)
+open('started', 'w').close()
+time.sleep(10)
+'''
+
+
+def _wait_for_file(filename, timeout=5):
+    start = time.monotonic()
+    while (not os.path.isfile(filename)) and (time.monotonic() - start < timeout):
+        time.sleep(0.01)
+
+
 class TestRunExecuteHelpers(unittest.TestCase):
-    @unittest.skipIf(platform.python_version() < '3.7', "Python 3.7 or greater required")
+    @unittest.skipIf(sys.version_info < (3, 7), "Python 3.7 or greater required")
     def test_execute_testcase(self):
         r = make_runner(RunCommand, name='test', command=('sleep', '0'))
         tc = TestCase(runner=r)
 
         # No error
-        conn = PipeProxy()
-        _execute_testcase(tc, conn)
+        state, results = _execute_testcase(tc)
 
-        self.assertEqual(conn.state, TestCase.Result.PASS)
-        self.assertIn('test', conn.result)
+        self.assertEqual(state, TestCase.Result.PASS)
+        self.assertIn('test', results)
 
-        data = conn.result['test']
+        data = results['test']
         self.assertEqual(data.state, TestCase.Result.PASS)
         self.assertEqual(data.returncode, 0)
         self.assertEqual(data.stderr, "")
@@ -74,207 +82,213 @@ class TestRunExecuteHelpers(unittest.TestCase):
         self.assertEqual(data.reasons, [])
 
         # Exception
-        with mock.patch('moosetools.moosetest.base.TestCase.execute',
-                        side_effect=Exception("wrong")):
-            _execute_testcase(tc, conn)
+        with mock.patch.object(TestCase, 'execute', side_effect=Exception("wrong")):
+            state, results = _execute_testcase(tc)
 
-        self.assertEqual(conn.state, TestCase.Result.FATAL)
-        self.assertIn('test', conn.result)
+        self.assertEqual(state, TestCase.Result.FATAL)
+        self.assertIn('test', results)
 
-        data = conn.result['test']
+        data = results['test']
         self.assertEqual(data.state, TestCase.Result.FATAL)
         self.assertEqual(data.returncode, None)
         self.assertEqual(data.stdout, None)
         self.assertIn("wrong", data.stderr)
         self.assertEqual(data.reasons, None)
 
-    @unittest.skipIf(platform.python_version() < '3.7', "Python 3.7 or greater required")
-    def test_execute_testcases(self):
+    @unittest.skipIf(sys.version_info < (3, 7), "Python 3.7 or greater required")
+    def test_worker(self):
+        ctx = multiprocessing.get_context('fork')
+        worker = _Worker(ctx)
+        self.assertFalse(worker.busy)
+        self.assertFalse(worker.concurrent)
+        self.assertIsNone(worker.deadline)
 
+        # No error, the same process is used for many TestCase objects
         r0 = make_runner(TestRunner, name='test0', sleep=0.2)
-        r1 = make_runner(TestRunner, name='test1', sleep=0.3)
-
         tc0 = TestCase(runner=r0)
-        tc1 = TestCase(runner=r1)
+        for i in range(2):
+            worker.submit(tc0, 2, (1, 0))
+            self.assertTrue(worker.busy)
+            self.assertIsNotNone(worker.deadline)
+            self.assertFalse(worker.expired())
+
+            u, state, results = worker.recv()
+            self.assertEqual(u, tc0.unique_id)
+            self.assertEqual(state, TestCase.Result.PASS)
+            data = results['test0']
+            self.assertEqual(data.state, TestCase.Result.PASS)
+            self.assertEqual(data.returncode, 2011)
+            self.assertEqual(data.stdout, "")
+            self.assertEqual(data.stderr, "")
+            self.assertEqual(data.reasons, [])
+            self.assertEqual(worker.release(u), (tc0, (1, 0)))
+            self.assertFalse(worker.busy)
 
-        # No error
-        q = queue.Queue()
-        _execute_testcases([tc0, tc1], q, 2)
-
-        u, p, s, r = q.get()
-        self.assertEqual(u, tc0.unique_id)
-        self.assertEqual(p, TestCase.Progress.RUNNING)
-        self.assertEqual(s, None)
-        self.assertEqual(r, None)
-
-        u, p, s, r = q.get()
-        self.assertEqual(u, tc0.unique_id)
-        self.assertEqual(p, TestCase.Progress.FINISHED)
-        self.assertEqual(s, TestCase.Result.PASS)
-        self.assertIn('test0', r)
-        data = r['test0']
-        self.assertEqual(data.state, TestCase.Result.PASS)
-        self.assertEqual(data.returncode, 2011)
-        self.assertEqual(data.stdout, "")
-        self.assertEqual(data.stderr, "")
-        self.assertEqual(data.reasons, [])
-
-        u, p, s, r = q.get()
-        self.assertEqual(u, tc1.unique_id)
-        self.assertEqual(p, TestCase.Progress.RUNNING)
-        self.assertEqual(s, None)
-        self.assertEqual(r, None)
-
-        u, p, s, r = q.get()
-        self.assertEqual(u, tc1.unique_id)
-        self.assertEqual(p, TestCase.Progress.FINISHED)
-        self.assertEqual(s, TestCase.Result.PASS)
-        self.assertIn('test1', r)
-        data = r['test1']
-        self.assertEqual(data.state, TestCase.Result.PASS)
-        self.assertEqual(data.returncode, 2011)
-        self.assertEqual(data.stdout, "")
-        self.assertEqual(data.stderr, "")
-        self.assertEqual(data.reasons, [])
-
-        # Exception and run
+        # Exception
         r0.parameters().setValue('raise', True)
-        _execute_testcases([tc0, tc1], q, 2)
-
-        u, p, s, r = q.get()
-        self.assertEqual(u, tc0.unique_id)
-        self.assertEqual(p, TestCase.Progress.RUNNING)
-        self.assertEqual(s, None)
-        self.assertEqual(r, None)
-
-        u, p, s, r = q.get()
-        self.assertEqual(u, tc0.unique_id)
-        self.assertEqual(p, TestCase.Progress.FINISHED)
-        self.assertEqual(s, TestCase.Result.EXCEPTION)
-        self.assertIn('test0', r)
-        data = r['test0']
+        worker.submit(tc0, None, (1, 0))
+        self.assertIsNone(worker.deadline)
+        u, state, results = worker.recv()
+        self.assertEqual(state, TestCase.Result.EXCEPTION)
+        data = results['test0']
         self.assertEqual(data.state, TestCase.Result.EXCEPTION)
-        self.assertEqual(data.returncode, None)
-        self.assertEqual(data.stdout, "")
         self.assertIn("runner raise", data.stderr)
-        self.assertEqual(data.reasons, None)
-
-        u, p, s, r = q.get()
-        self.assertEqual(u, tc1.unique_id)
-        self.assertEqual(p, TestCase.Progress.RUNNING)
-        self.assertEqual(s, None)
-        self.assertEqual(r, None)
-
-        u, p, s, r = q.get()
-        self.assertEqual(u, tc1.unique_id)
-        self.assertEqual(p, TestCase.Progress.FINISHED)
-        self.assertEqual(s, TestCase.Result.PASS)
-        self.assertIn('test1', r)
-        data = r['test1']
-        self.assertEqual(data.state, TestCase.Result.PASS)
-        self.assertEqual(data.returncode, 2011)
-        self.assertEqual(data.stderr, "")
-        self.assertEqual(data.stdout, "")
-        self.assertEqual(data.reasons, [])
-
-        # Exception and skip
-        r1.parameters().setValue('requires', ('test0', ))
-        _execute_testcases([tc0, tc1], q, 2)
-
-        u, p, s, r = q.get()
-        self.assertEqual(u, tc0.unique_id)
-        self.assertEqual(p, TestCase.Progress.RUNNING)
-        self.assertEqual(s, None)
-        self.assertEqual(r, None)
-
-        u, p, s, r = q.get()
-        self.assertEqual(u, tc0.unique_id)
-        self.assertEqual(p, TestCase.Progress.FINISHED)
-        self.assertEqual(s, TestCase.Result.EXCEPTION)
-        self.assertIn('test0', r)
-        data = r['test0']
-        self.assertEqual(data.state, TestCase.Result.EXCEPTION)
-        self.assertEqual(data.returncode, None)
-        self.assertEqual(data.stdout, "")
-        self.assertIn("runner raise", data.stderr)
-        self.assertEqual(data.reasons, None)
-
-        u, p, s, r = q.get()
-        self.assertEqual(u, tc1.unique_id)
-        self.assertEqual(p, TestCase.Progress.FINISHED)
-        self.assertEqual(s, TestCase.Result.SKIP)
-        self.assertIn('test1', r)
-        data = r['test1']
-        self.assertEqual(data.state, TestCase.Result.SKIP)
-        self.assertEqual(data.returncode, None)
-        self.assertEqual(
-            data.stderr,
-            "For the test 'test1', the required test(s) 'test0' have not executed and passed.")
-        self.assertEqual(data.stdout, None)
-        self.assertEqual(data.reasons, ['failed dependency'])
-
-        # 'Incorrect' requires
-        r0.parameters().setValue('requires', ('wrong', ))
-        _execute_testcases([tc0, tc1], q, 2)
-        u, p, s, r = q.get()
-        self.assertEqual(u, tc0.unique_id)
-        self.assertEqual(p, TestCase.Progress.FINISHED)
-        self.assertEqual(s, TestCase.Result.FATAL)
-        self.assertIn('test0', r)
-        data = r['test0']
-        self.assertEqual(data.state, TestCase.Result.FATAL)
-        self.assertEqual(data.returncode, None)
-        self.assertEqual(data.stdout, None)
-        self.assertEqual(
-            data.stderr,
-            "For the test 'test0', the required test(s) 'wrong' have not executed. Either the names provided the the 'requires' parameter are incorrect or the tests are in the wrong order."
-        )
-        self.assertEqual(data.reasons, ['unknown required test(s)'])
-
-        u, p, s, r = q.get()
-        self.assertEqual(u, tc1.unique_id)
-        self.assertEqual(p, TestCase.Progress.FINISHED)
-        self.assertEqual(s, TestCase.Result.SKIP)
-        self.assertIn('test1', r)
-        data = r['test1']
-        self.assertEqual(data.state, TestCase.Result.SKIP)
-        self.assertEqual(data.returncode, None)
-        self.assertEqual(
-            data.stderr,
-            "For the test 'test1', the required test(s) 'test0' have not executed and passed.")
-        self.assertEqual(data.stdout, None)
-        self.assertEqual(data.reasons, ['failed dependency'])
+        worker.release(u)
 
         # Timeout
         r2 = make_runner(RunCommand, name='test2', command=('sleep', '2'))
         tc2 = TestCase(runner=r2)
-        _execute_testcases([tc2], q, 1)
-
-        u, p, s, r = q.get()
-        self.assertEqual(u, tc2.unique_id)
-        self.assertEqual(p, TestCase.Progress.RUNNING)
-        self.assertEqual(s, None)
-        self.assertEqual(r, None)
-
-        u, p, s, r = q.get()
-        self.assertEqual(u, tc2.unique_id)
-        self.assertEqual(p, TestCase.Progress.FINISHED)
-        self.assertEqual(s, TestCase.Result.TIMEOUT)
-        self.assertIn('test2', r)
-        data = r['test2']
-        self.assertEqual(data.state, TestCase.Result.TIMEOUT)
-        self.assertEqual(data.returncode, None)
-        self.assertEqual(data.stdout, None)
-        self.assertEqual(data.stderr, None)
-        self.assertEqual(data.reasons, ['max time (1) exceeded'])
+        worker.submit(tc2, 0.5, (1, 0))
+        self.assertEqual(multiprocessing.connection.wait([worker.connection], 1), [])
+        self.assertTrue(worker.expired())
+        self.assertEqual(worker.releaseAll(), [(tc2, (1, 0))])
+        worker.stop()
+
+        # Exit
+        with mock.patch.object(sys.modules['moosetools.moosetest.run'],
+                               '_execute_testcase',
+                               side_effect=lambda tc: os._exit(1)):
+            worker = _Worker(ctx)
+        worker.submit(tc2, None, (1, 0))
+        with self.assertRaises(EOFError):
+            worker.recv()
+        worker.stop()
+
+    def test_worker_compact(self):
+        ctx = multiprocessing.get_context('fork')
+        worker = _Worker(ctx)
+
+        # The parameters copied from a template are sent in the compact format, the schema is sent
+        # with the first TestCase only
+        controllers = (TestController(), )
+        params = TestCase.validParams()
+        params.setDefault('controllers', controllers)
+        for i in range(2):
+            r = make_runner(TestRunner, controllers, name=f'test{i}', sleep=0)
+            tc = TestCase(params.copy(), runner=r)
+            worker.submit(tc, 2, (1, 0))
+            self.assertEqual(len(worker._schemas), 1)
+
+            u, state, results = worker.recv()
+            self.assertEqual(u, tc.unique_id)
+            self.assertEqual(state, TestCase.Result.PASS)
+            self.assertEqual(results[f'test{i}'].returncode, 2011)
+            worker.release(u)
+        worker.stop()
+
+    def test_worker_interrupt(self):
+        ctx = multiprocessing.get_context('fork')
+        for concurrent in (False, True):
+            worker = _Worker(ctx, concurrent)
+
+            # The standard input of the commands is the null device
+            cmd = (sys.executable, '-c',
+                   "import os; print(os.path.samestat(os.fstat(0), os.stat(os.devnull)))")
+            tc = TestCase(runner=make_runner(RunCommand, name='stdin', command=cmd))
+            worker.submit(tc, None, (1, 0))
+            u, state, results = worker.recv()
+            worker.release(u)
+            self.assertEqual(state, TestCase.Result.PASS)
+            self.assertTrue(results['stdin'].stdout.endswith('True\n'))
+
+            # The SIGINT is sent to the command, which exits, and then the worker exits
+            with tempfile.TemporaryDirectory() as tmpdir:
+                cmd = (sys.executable, '-c', _INTERRUPT_COMMAND)
+                tc = TestCase(
+                    runner=make_runner(RunCommand, name='int', command=cmd, working_dir=tmpdir))
+                worker.submit(tc, None, (1, 0))
+                _wait_for_file(os.path.join(tmpdir, 'started'))
+                worker.interrupt()
+                worker.join(5)
+                self.assertFalse(worker._proc.is_alive())
+                self.assertEqual(worker._proc.exitcode, 0)
+                self.assertTrue(os.path.isfile(os.path.join(tmpdir, 'interrupted')))
+                worker.stop()
+
+    @unittest.skipIf(sys.version_info < (3, 7), "Python 3.7 or greater required")
+    def test_worker_concurrent(self):
+        ctx = multiprocessing.get_context('fork')
+        worker = _Worker(ctx, concurrent=True)
+        self.assertTrue(worker.concurrent)
+
+        # Many commands execute at the same time, the timeout is handled by the worker
+        tcs = [
+            TestCase(runner=make_runner(RunCommand, name=f'test{i}', command=('sleep', '1')))
+            for i in range(4)
+        ]
+        tc_timeout = TestCase(runner=make_runner(RunCommand, name='slow', command=('sleep', '5')))
+        start = time.perf_counter()
+        for tc in tcs:
+            worker.submit(tc, 3, (1, 0))
+        worker.submit(tc_timeout, 2, (1, 0))
+        self.assertGreater(worker.deadline, start + 2)  # the root process allows a margin
 
-
-@unittest.skipIf(platform.python_version() < '3.7', "Python 3.7 or greater required")
+        for i in range(5):
+            u, state, results = worker.recv()
+            tc, _ = worker.release(u)
+            if tc is tc_timeout:
+                self.assertEqual(state, TestCase.Result.TIMEOUT)
+                self.assertEqual(results['slow'].reasons, ['max time (2) exceeded'])
+            else:
+                self.assertEqual(state, TestCase.Result.PASS)
+                self.assertIn('sleep 1', results[tc.name()].stdout)
+        self.assertLess(time.perf_counter() - start, 4)
+        self.assertFalse(worker.busy)
+        worker.stop()
+
+        # The root process stops a worker that is not responding, only the expired TestCase objects
+        # are released as such
+        async def blocking(tc):
+            time.sleep(30)
+
+        with mock.patch.object(TestCase, 'executeAsync', autospec=True, side_effect=blocking):
+            worker = _Worker(ctx, concurrent=True)
+            tcs = [
+                TestCase(runner=make_runner(RunCommand, name=f'test{i}', command=('true', )))
+                for i in range(2)
+            ]
+            worker.submit(tcs[0], 0.5, (1, 0))
+            worker.submit(tcs[1], 30, (1, 0))
+        self.assertEqual(multiprocessing.connection.wait([worker.connection], 4), [])
+        self.assertTrue(worker.expired())
+        worker.stop()
+        self.assertEqual(worker.releaseExpired(), [(tcs[0], (1, 0))])
+        self.assertEqual(worker.releaseAll(), [(tcs[1], (1, 0))])
+
+    def test_restore_process_state(self):
+        cwd = os.getcwd()
+        path = list(sys.path)
+        umask = os.umask(0o022)
+        os.umask(umask)
+        handler = signal.getsignal(signal.SIGUSR1)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with open(os.path.join(tmpdir, 'moosetest_restored.py'), 'w') as fid:
+                fid.write("VALUE = 1980")
+
+            with _restore_process_state():
+                os.chdir(tmpdir)
+                os.environ['MOOSETEST_RESTORED'] = 'Andrew'
+                os.environ['PATH'] = tmpdir
+                sys.path.insert(0, tmpdir)
+                import moosetest_restored
+                os.umask(0o077)
+                signal.signal(signal.SIGUSR1, lambda *args: None)
+
+        self.assertEqual(os.getcwd(), cwd)
+        self.assertNotIn('MOOSETEST_RESTORED', os.environ)
+        self.assertNotEqual(os.environ['PATH'], tmpdir)
+        self.assertEqual(sys.path, path)
+        self.assertNotIn('moosetest_restored', sys.modules)
+        self.assertEqual(os.umask(umask), umask)
+        self.assertIs(signal.getsignal(signal.SIGUSR1), handler)
+
+
+@unittest.skipIf(sys.version_info < (3, 7), "Python 3.7 or greater required")
 class TestReportHelper(unittest.TestCase):
-    @mock.patch('moosetools.moosetest.base.Formatter.reportResults')
-    @mock.patch('moosetools.moosetest.base.TestCase.setResults')
-    @mock.patch('moosetools.moosetest.base.TestCase.setState')
-    @mock.patch('moosetools.moosetest.base.TestCase.setProgress')
+    @mock.patch.object(Formatter, 'reportResults')
+    @mock.patch.object(TestCase, 'setResults')
+    @mock.patch.object(TestCase, 'setState')
+    @mock.patch.object(TestCase, 'setProgress')
     def test_report_progress_and_results(self, tc_prog, tc_state, tc_results, fm_results):
 
         fm = Formatter()
@@ -303,7 +317,7 @@ class TestReportHelper(unittest.TestCase):
         fm_results.assert_called_once_with(tc0)
 
 
-@unittest.skipIf(platform.python_version() < '3.7', "Python 3.7 or greater required")
+@unittest.skipIf(sys.version_info < (3, 7), "Python 3.7 or greater required")
 class TestRun(unittest.TestCase):
     ANY = 42
 
@@ -312,11 +326,11 @@ class TestRun(unittest.TestCase):
             self.value = value
 
     def setUp(self):
-        r_state_mock = mock.patch('moosetools.moosetest.base.Formatter.formatRunnerProgress')
-        r_results_mock = mock.patch('moosetools.moosetest.base.Formatter.formatRunnerResult')
-        d_state_mock = mock.patch('moosetools.moosetest.base.Formatter.formatDifferProgress')
-        d_results_mock = mock.patch('moosetools.moosetest.base.Formatter.formatDifferResult')
-        complete_mock = mock.patch('moosetools.moosetest.base.Formatter.formatComplete')
+        r_state_mock = mock.patch.object(Formatter, 'formatRunnerProgress')
+        r_results_mock = mock.patch.object(Formatter, 'formatRunnerResult')
+        d_state_mock = mock.patch.object(Formatter, 'formatDifferProgress')
+        d_results_mock = mock.patch.object(Formatter, 'formatDifferResult')
+        complete_mock = mock.patch.object(Formatter, 'formatComplete')
 
         self._r_state = r_state_mock.start()
         self.addCleanup(r_state_mock.stop)
@@ -360,14 +374,19 @@ class TestRun(unittest.TestCase):
             else:
                 self.assertEqual(call[1][key], value)  # call.kwargs[key] in python > 3.7
 
-    def testFutureException(self):
+    def testWorkerExit(self):
         r = TestRunner(name='Andrew', stderr=True, stdout=True)
         fm = Formatter()
 
-        with mock.patch('concurrent.futures.Future.exception', return_value=Exception('future exception')), \
-        self.assertRaises(Exception) as cm:
+        with mock.patch.object(sys.modules['moosetools.moosetest.run'],
+                               '_execute_testcase',
+                               side_effect=lambda tc: os._exit(1)):
             rcode = run([[r]], tuple(), fm)
-        self.assertIn('future exception', str(cm.exception))
+        self.assertEqual(rcode, 1)
+        self.assertCall(self._r_results,
+                        name='Andrew',
+                        state=TestCase.Result.FATAL,
+                        reasons=['worker process exited'])
 
     def testRunnerOnly(self):
         r = TestRunner(name='Andrew', stderr=True, stdout=True)
@@ -455,8 +474,10 @@ class TestRun(unittest.TestCase):
         # TIMEOUT
         self.resetMockObjects()
         r.setValue('raise', False)
-        r.setValue('sleep', 1)
+        r.setValue('sleep', 5)
+        start = time.monotonic()
         rcode = run([[r]], tuple(), fm, timeout=0.5)
+        self.assertLess(time.monotonic() - start, 3)  # the test is stopped, not waited for
         self.assertEqual(rcode, 1)
         self._r_state.assert_called_once()
         self._r_results.assert_called_once()
@@ -538,7 +559,7 @@ class TestRun(unittest.TestCase):
         # ERROR, RUNNER (during execution of Controller)
         self.resetMockObjects()
         c.setValue('error', False)
-        with mock.patch('moosetools.moosetest.base.Runner.status', return_value=1):
+        with mock.patch.object(Runner, 'status', return_value=1):
             rcode = run([[r]], (c, ), fm)
         self.assertEqual(rcode, 1)
         self._r_state.assert_called_once()
@@ -1047,6 +1068,44 @@ class TestRun(unittest.TestCase):
                         stdout='',
                         stderr=TestRun.IN("Max failures of 1 exceeded."))
 
+    def testMaxFailStop(self):
+        # The running tests, and the commands they started, are stopped when max failures is reached
+        with tempfile.TemporaryDirectory() as tmpdir:
+            code = "import os, sys, time; open(sys.argv[1], 'w').write(str(os.getpid())); time.sleep(10)"
+            r0 = make_runner(TestRunner, name='Andrew', error=True, sleep=0.5)
+            r1 = make_runner(RunCommand,
+                             name='Best',
+                             command=(sys.executable, '-c', code, os.path.join(tmpdir, 'pid1')))
+            r2 = make_runner(RunCommand,
+                             name='Other',
+                             command=(sys.executable, '-c', code, os.path.join(tmpdir, 'pid2')))
+            r3 = make_runner(TestRunner, name='Just')
+            fm = Formatter()
+
+            t0 = time.perf_counter()
+            rcode = run([[r0], [r1], [r2], [r3]], tuple(), fm, n_threads=3, max_fails=1)
+            self.assertLess(time.perf_counter() - t0, 5)
+            self.assertEqual(rcode, 1)
+
+            results = {c[1]['name']: c[1] for c in self._r_results.call_args_list}
+            self.assertEqual(results['Andrew']['state'], TestCase.Result.ERROR)
+            for name in ('Best', 'Other', 'Just'):
+                self.assertEqual(results[name]['state'], TestCase.Result.SKIP)
+                self.assertEqual(results[name]['reasons'], ['max failures reached'])
+
+            # The commands are no longer running (they are reaped by init, so allow time for that)
+            for name in ('pid1', 'pid2'):
+                with open(os.path.join(tmpdir, name), 'r') as fid:
+                    pid = int(fid.read())
+                for i in range(100):
+                    try:
+                        os.kill(pid, 0)
+                    except ProcessLookupError:
+                        break
+                    time.sleep(0.05)
+                else:
+                    self.fail(f"The process {pid} is still running.")
+
     def testMinFailState(self):
         # SKIP as failure
         c = TestController(skip=True)
@@ -1141,6 +1200,258 @@ class TestRun(unittest.TestCase):
             IN("For the test 'Best Andrew', the required test(s) 'Other Andrew' have not executed and passed."
                ))
 
+    def testRequiresOrder(self):
+        # The tests within a group are independent, except for the 'requires' parameter
+        r0 = make_runner(TestRunner, name='Other Andrew', requires=('Just Andrew', ))
+        r1 = make_runner(TestRunner, name='Just Andrew', sleep=0.5)
+        r2 = make_runner(TestRunner, name='Best Andrew')
+        fm = Formatter()
+
+        rcode = run([[r0, r1, r2]], tuple(), fm, n_threads=2)
+        self.assertEqual(rcode, 0)
+        self.assertEqual(self._r_state.call_count, 3)
+        self.assertCall(self._r_state.call_args_list[0],
+                        name='Best Andrew',
+                        state=TestCase.Result.PASS,
+                        reasons=[],
+                        percent=TestRun.ANY,
+                        duration=TestRun.ANY)
+        self.assertCall(self._r_state.call_args_list[1],
+                        name='Just Andrew',
+                        state=TestCase.Result.PASS,
+                        reasons=[],
+                        percent=TestRun.ANY,
+                        duration=TestRun.ANY)
+        self.assertCall(self._r_state.call_args_list[2],
+                        name='Other Andrew',
+                        state=TestCase.Result.PASS,
+                        reasons=[],
+                        percent=100,
+                        duration=TestRun.ANY)
+
+    def testPerformance(self):
+        # Compare the per-test overhead of the persistent workers with creating a process for each
+        # test, which is how the tests were executed prior to using persistent workers
+        n = 100
+        runners = [TestRunner(name=f'Andrew {i}') for i in range(n)]
+        testcases = [TestCase(runner=r) for r in runners]
+
+        t0 = time.perf_counter()
+        for tc in testcases:
+            _execute_testcase(tc)
+        t_exec = time.perf_counter() - t0
+
+        ctx = multiprocessing.get_context('fork')
+        t0 = time.perf_counter()
+        for tc in testcases:
+            conn_recv, conn_send = ctx.Pipe(False)
+            proc = ctx.Process(target=lambda tc, conn: conn.send(_execute_testcase(tc)),
+                               args=(tc, conn_send))
+            proc.start()
+            conn_recv.recv()
+            proc.join()
+            proc.close()
+        t_fork = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        rcode = run([runners], tuple(), Formatter(), n_threads=1, timeout=10)
+        t_worker = time.perf_counter() - t0
+        self.assertEqual(rcode, 0)
+
+        msg = 'Overhead per test; Process: {:.2f} ms; Worker: {:.2f} ms'.format(
+            (t_fork - t_exec) / n * 1000, (t_worker - t_exec) / n * 1000)
+        self.assertTrue(t_worker < t_fork, msg)
+
+    def testWorkingDirectory(self):
+        # The tests with the same working directory are executed at the same time, the files
+        # created by one are not reported by the file checks of another
+        with tempfile.TemporaryDirectory() as tmpdir:
+            runners = list()
+            for i in range(6):
+                runners.append(
+                    make_runner(RunCommand,
+                                name=f'Andrew {i}',
+                                command=('sh', '-c', f'sleep 0.5; echo {i} > file{i}'),
+                                working_dir=tmpdir,
+                                file_names_created=(f'file{i}', )))
+            fm = Formatter()
+
+            start = time.perf_counter()
+            rcode = run([runners], tuple(), fm, n_threads=6)
+            self.assertLess(time.perf_counter() - start, 2.5)
+            self.assertEqual(rcode, 0)
+            results = {c[1]['name']: c[1]['state'] for c in self._r_state.call_args_list}
+            self.assertEqual(len(results), 6)
+            for state in results.values():
+                self.assertEqual(state, TestCase.Result.PASS)
+            self.assertEqual(sorted(os.listdir(tmpdir)), [f'file{i}' for i in range(6)])
+
+    def testInterrupt(self):
+        # The SIGINT received by the root process is forwarded to the running commands
+        with tempfile.TemporaryDirectory() as tmpdir:
+            runner = make_runner(RunCommand,
+                                 name='Andrew',
+                                 command=(sys.executable, '-c', _INTERRUPT_COMMAND),
+                                 working_dir=tmpdir,
+                                 file_check_created=False)
+            fm = Formatter()
+
+            wait = multiprocessing.connection.wait
+
+            def interrupt(*args):
+                if not os.path.isfile(os.path.join(tmpdir, 'started')):
+                    _wait_for_file(os.path.join(tmpdir, 'started'))
+                    raise KeyboardInterrupt()
+                return wait(*args)
+
+            with mock.patch('multiprocessing.connection.wait', side_effect=interrupt):
+                with self.assertRaises(KeyboardInterrupt):
+                    run([[runner]], tuple(), fm, n_threads=1)
+            self.assertTrue(os.path.isfile(os.path.join(tmpdir, 'interrupted')))
+
+    def testTerminate(self):
+        # The SIGTERM received by the root process is forwarded to the running commands, then the
+        # process is ended by the signal after the workers are stopped
+        with tempfile.TemporaryDirectory() as tmpdir:
+            runner = make_runner(RunCommand,
+                                 name='Andrew',
+                                 command=(sys.executable, '-c', _INTERRUPT_COMMAND),
+                                 working_dir=tmpdir,
+                                 file_check_created=False)
+            fm = Formatter()
+
+            wait = multiprocessing.connection.wait
+            kill = os.kill
+
+            def terminate(*args):
+                if not os.path.isfile(os.path.join(tmpdir, 'started')):
+                    _wait_for_file(os.path.join(tmpdir, 'started'))
+                    kill(os.getpid(), signal.SIGTERM)
+                return wait(*args)
+
+            run_module = sys.modules['moosetools.moosetest.run']
+            with mock.patch('multiprocessing.connection.wait', side_effect=terminate), \
+                 mock.patch.object(os, 'kill') as root_kill:
+                with self.assertRaises(run_module._Terminated):
+                    run([[runner]], tuple(), fm, n_threads=1)
+            root_kill.assert_called_once_with(os.getpid(), signal.SIGTERM)
+            self.assertEqual(signal.getsignal(signal.SIGTERM), signal.SIG_DFL)
+            self.assertTrue(os.path.isfile(os.path.join(tmpdir, 'interrupted')))
+
+    def testAsyncCommands(self):
+        # RunCommand objects execute concurrently from a single process, other objects use the
+        # process workers
+        r0 = make_runner(RunCommand, name='Andrew', command=('sleep', '1'))
+        r1 = make_runner(RunCommand, name='Best', command=('sleep', '1'))
+        r2 = make_runner(RunCommand, name='Other', command=('sleep', '2'))
+        r3 = TestRunner(name='Just')
+        fm = Formatter()
+
+        t0 = time.perf_counter()
+        rcode = run([[r0, r1, r2, r3]], tuple(), fm, n_threads=4, timeout=1.5, async_commands=True)
+        self.assertLess(time.perf_counter() - t0, 2)
+        self.assertEqual(rcode, 1)
+
+        results = {c[1]['name']: c[1]['state'] for c in self._r_state.call_args_list}
+        self.assertEqual(results['Andrew'], TestCase.Result.PASS)
+        self.assertEqual(results['Best'], TestCase.Result.PASS)
+        self.assertEqual(results['Other'], TestCase.Result.TIMEOUT)
+        self.assertEqual(results['Just'], TestCase.Result.PASS)
+
+    def testAsyncCommandsNotResponding(self):
+        # The root process stops a concurrent worker that does not enforce the timeout (e.g., the
+        # event loop is blocked)
+        async def blocking(tc):
+            time.sleep(30)
+
+        r0 = make_runner(RunCommand, name='Andrew', command=('sleep', '30'))
+        r1 = make_runner(RunCommand, name='Best', command=('sleep', '30'))
+        fm = Formatter()
+        with mock.patch.object(TestCase, 'executeAsync', autospec=True, side_effect=blocking), \
+             mock.patch.object(sys.modules['moosetools.moosetest.run'],
+                               'CONCURRENT_TIMEOUT_MARGIN', 0.5):
+            t0 = time.perf_counter()
+            rcode = run([[r0], [r1]], tuple(), fm, n_threads=2, timeout=1, async_commands=True)
+        self.assertLess(time.perf_counter() - t0, 10)
+        self.assertEqual(rcode, 1)
+
+        states = {c[1]['name']: c[1]['state'] for c in self._r_state.call_args_list}
+        reasons = {c[1]['name']: c[1]['reasons'] for c in self._r_state.call_args_list}
+        self.assertEqual(states['Andrew'], TestCase.Result.TIMEOUT)
+        self.assertEqual(reasons['Andrew'], ['max time (1) exceeded'])
+
+        # The other test is stopped with the worker, it was sent after 'Andrew' so its own deadline
+        # may not have passed when the worker is stopped
+        if states['Best'] == TestCase.Result.FATAL:
+            self.assertEqual(reasons['Best'], ['worker process stopped'])
+        else:
+            self.assertEqual(states['Best'], TestCase.Result.TIMEOUT)
+
+    def testProgress(self):
+        # Progress is only checked for running tests when a message is due
+        r0 = TestRunner(name='Long', sleep=1.1)
+        r1 = TestRunner(name='Short', sleep=0.1)
+        fm = Formatter(progress_interval=0.25)
+        with mock.patch.object(Formatter,
+                               'reportProgress',
+                               autospec=True,
+                               side_effect=Formatter.reportProgress) as report:
+            rcode = run([[r0], [r1]], tuple(), fm, n_threads=2)
+        self.assertEqual(rcode, 0)
+
+        running = [
+            c[1]['name'] for c in self._r_state.call_args_list
+            if c[1]['state'] == TestCase.Progress.RUNNING
+        ]
+        self.assertEqual(set(running), {'Long'})
+        self.assertGreaterEqual(len(running), 3)
+        self.assertLessEqual(len(running), 4)
+        self.assertEqual(report.call_count, len(running))
+
+    def testCache(self):
+        cache = ResultCache()
+        r0 = TestRunner(name='Andrew')
+        r1 = TestRunner(name='Best', error=True)
+        fm = Formatter()
+
+        rcode = run([[r0, r1]], tuple(), fm, cache=cache)
+        self.assertEqual(rcode, 1)
+        self.assertIn('Andrew', cache)
+        self.assertNotIn('Best', cache)
+
+        # The passing test is not executed again
+        self.resetMockObjects()
+        rcode = run([[r0, r1]], tuple(), fm, cache=cache)
+        self.assertEqual(rcode, 1)
+
+        results = {c[1]['name']: c[1] for c in self._r_results.call_args_list}
+        self.assertEqual(results['Andrew']['state'], TestCase.Result.PASS)
+        self.assertEqual(results['Andrew']['reasons'], ['cached'])
+        self.assertEqual(results['Best']['state'], TestCase.Result.ERROR)
+
+    def testStaticControllers(self):
+        c = TestController(object_name='Best', skip=True)
+        c.STATIC = True
+        r0 = make_runner(TestRunner, (c, ), name='Andrew')
+        r1 = make_runner(TestRunner, (c, ), name='Best')
+        r2 = make_runner(TestRunner, (c, ), name='Other', requires=('Best', ))
+        fm = Formatter()
+
+        # Only the test that executes is sent to a worker
+        with mock.patch.object(_Worker, 'submit', autospec=True,
+                               side_effect=_Worker.submit) as submit:
+            rcode = run([[r0, r1, r2]], (c, ), fm)
+        self.assertEqual(rcode, 0)
+        self.assertEqual(submit.call_count, 1)
+        self.assertEqual(submit.call_args[0][1].name(), 'Andrew')
+
+        results = {c[1]['name']: c[1] for c in self._r_results.call_args_list}
+        self.assertEqual(results['Andrew']['state'], TestCase.Result.PASS)
+        self.assertEqual(results['Best']['state'], TestCase.Result.SKIP)
+        self.assertEqual(results['Best']['reasons'], ['a reason'])
+        self.assertEqual(results['Other']['state'], TestCase.Result.SKIP)
+        self.assertEqual(results['Other']['reasons'], ['failed dependency'])
+
 
 if __name__ == '__main__':
     unittest.main(module=__name__, verbosity=2, buffer=True)
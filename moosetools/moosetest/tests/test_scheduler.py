@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import os
+import sys
+import time
+import tempfile
+import unittest
+
+from moosetools.moosetest.base import make_runner, TestCase
+from moosetools.moosetest.runners import RunCommand
+from moosetools.moosetest.scheduler import Scheduler
+
+# I do not want the tests directory to be packages with __init__.py, so load from file
+sys.path.append(os.path.join(os.path.dirname(__file__)))
+from _helpers import TestRunner
+
+
+def make_testcase(name, **kwargs):
+    return TestCase(runner=make_runner(TestRunner, name=name, **kwargs))
+
+
+def finish(scheduler, tc, state):
+    tc.setProgress(TestCase.Progress.FINISHED)
+    tc.setState(state)
+    tc.setResults({tc.name(): TestCase.Data(state, None, None, None, None)})
+    scheduler.finish(tc)
+
+
+class TestScheduler(unittest.TestCase):
+    def testIndependent(self):
+        tc0 = make_testcase('a/0')
+        tc1 = make_testcase('a/1')
+        tc2 = make_testcase('b/0')
+        scheduler = Scheduler([[tc0, tc1], [tc2]])
+
+        self.assertEqual(len(scheduler), 3)
+        self.assertEqual(scheduler.resolved(), [])
+        self.assertIs(scheduler.pop(), tc0)
+        self.assertIs(scheduler.pop(), tc1)
+        self.assertIs(scheduler.pop(), tc2)
+        self.assertIsNone(scheduler.pop())
+
+        finish(scheduler, tc1, TestCase.Result.PASS)
+        finish(scheduler, tc0, TestCase.Result.ERROR)
+        self.assertEqual(len(scheduler), 1)
+        self.assertEqual(scheduler.resolved(), [])
+
+    def testRequires(self):
+        # The required test is listed after the dependent test, the order does not matter
+        tc0 = make_testcase('a/0', requires=('1', ))
+        tc1 = make_testcase('a/1')
+        tc2 = make_testcase('a/2', requires=('0', '1'))
+        scheduler = Scheduler([[tc0, tc1, tc2]])
+
+        self.assertIs(scheduler.pop(), tc1)
+        self.assertIsNone(scheduler.pop())
+
+        finish(scheduler, tc1, TestCase.Result.PASS)
+        self.assertIs(scheduler.pop(), tc0)
+        self.assertIsNone(scheduler.pop())
+
+        finish(scheduler, tc0, TestCase.Result.PASS)
+        self.assertIs(scheduler.pop(), tc2)
+        self.assertIsNone(scheduler.pop())
+        self.assertEqual(scheduler.resolved(), [])
+
+    def testRequiresOtherGroup(self):
+        # Names are only matched within the group
+        tc0 = make_testcase('a/0')
+        tc1 = make_testcase('b/1', requires=('a/0', ))
+        scheduler = Scheduler([[tc0], [tc1]])
+
+        resolved = scheduler.resolved()
+        self.assertEqual(len(resolved), 1)
+        tc, state, results = resolved[0]
+        self.assertIs(tc, tc1)
+        self.assertEqual(state, TestCase.Result.FATAL)
+        data = results['b/1']
+        self.assertEqual(data.reasons, ['unknown required test(s)'])
+        self.assertEqual(
+            data.stderr,
+            "For the test 'b/1', the required test(s) 'a/0' do not exist. The names provided to the 'requires' parameter must be the names of tests within the same group."
+        )
+
+        self.assertIs(scheduler.pop(), tc0)
+        self.assertIsNone(scheduler.pop())
+
+    def testFailedDependency(self):
+        tc0 = make_testcase('a/0')
+        tc1 = make_testcase('a/1', requires=('0', ))
+        tc2 = make_testcase('a/2', requires=('1', ))
+        tc3 = make_testcase('a/3')
+        scheduler = Scheduler([[tc0, tc1, tc2, tc3]])
+
+        self.assertIs(scheduler.pop(), tc0)
+        self.assertIs(scheduler.pop(), tc3)
+        self.assertIsNone(scheduler.pop())
+
+        finish(scheduler, tc0, TestCase.Result.ERROR)
+        resolved = scheduler.resolved()
+        self.assertEqual(len(resolved), 1)
+        tc, state, results = resolved[0]
+        self.assertIs(tc, tc1)
+        self.assertEqual(state, TestCase.Result.SKIP)
+        data = results['a/1']
+        self.assertEqual(data.reasons, ['failed dependency'])
+        self.assertEqual(
+            data.stderr,
+            "For the test 'a/1', the required test(s) 'a/0' have not executed and passed.")
+
+        # Chained dependency
+        finish(scheduler, tc1, state)
+        resolved = scheduler.resolved()
+        self.assertEqual(len(resolved), 1)
+        tc, state, results = resolved[0]
+        self.assertIs(tc, tc2)
+        self.assertEqual(state, TestCase.Result.SKIP)
+        self.assertEqual(
+            results['a/2'].stderr,
+            "For the test 'a/2', the required test(s) 'a/1' have not executed and passed.")
+
+        finish(scheduler, tc2, state)
+        self.assertIsNone(scheduler.pop())
+        self.assertEqual(len(scheduler), 1)
+
+    def testCycle(self):
+        tc0 = make_testcase('a/0', requires=('2', ))
+        tc1 = make_testcase('a/1', requires=('0', ))
+        tc2 = make_testcase('a/2', requires=('1', ))
+        tc3 = make_testcase('a/3')
+        scheduler = Scheduler([[tc0, tc1, tc2, tc3]])
+
+        resolved = scheduler.resolved()
+        self.assertEqual([r[0] for r in resolved], [tc0, tc1, tc2])
+        for tc, state, results in resolved:
+            self.assertEqual(state, TestCase.Result.FATAL)
+            self.assertEqual(results[tc.name()].reasons, ['circular dependency'])
+
+        self.assertIs(scheduler.pop(), tc3)
+        self.assertIsNone(scheduler.pop())
+
+    def testCycleDependent(self):
+        # The cycle depends on a test that is not part of it
+        tc0 = make_testcase('a/0')
+        tc1 = make_testcase('a/1', requires=('0', '2'))
+        tc2 = make_testcase('a/2', requires=('1', ))
+        scheduler = Scheduler([[tc0, tc1, tc2]], durations={'a/0': 1, 'a/1': 2, 'a/2': 3})
+
+        resolved = scheduler.resolved()
+        self.assertEqual([r[0] for r in resolved], [tc1, tc2])
+        for tc, state, results in resolved:
+            self.assertEqual(state, TestCase.Result.FATAL)
+            self.assertEqual(results[tc.name()].reasons, ['circular dependency'])
+
+        self.assertIs(scheduler.pop(), tc0)
+        self.assertIsNone(scheduler.pop())
+        finish(scheduler, tc0, TestCase.Result.PASS)
+        self.assertEqual(scheduler.resolved(), [])
+        self.assertIsNone(scheduler.pop())
+
+    def testCycleResolved(self):
+        # A test skipped due to resources that is also part of a cycle is only reported once
+        tc0 = make_testcase('a/0', requires=('1', ), cores=8)
+        tc1 = make_testcase('a/1', requires=('0', ))
+        scheduler = Scheduler([[tc0, tc1]], max_cores=4, soft_limit=False)
+
+        resolved = scheduler.resolved()
+        self.assertEqual([(r[0], r[1]) for r in resolved], [(tc0, TestCase.Result.SKIP),
+                                                            (tc1, TestCase.Result.FATAL)])
+        self.assertIsNone(scheduler.pop())
+
+    def testDurations(self):
+        tc0 = make_testcase('a/0')
+        tc1 = make_testcase('a/1')
+        tc2 = make_testcase('a/2')
+        tc3 = make_testcase('a/3')
+        tc4 = make_testcase('b/0')
+        durations = {'a/0': 1, 'a/1': 3, 'b/0': 2}
+
+        # Longest first, 'a/2' and 'a/3' use the default and keep the supplied order
+        scheduler = Scheduler([[tc0, tc1, tc2, tc3], [tc4]], durations=durations)
+        self.assertEqual([scheduler.pop() for i in range(5)], [tc1, tc4, tc0, tc2, tc3])
+        self.assertIsNone(scheduler.pop())
+
+        scheduler = Scheduler([[tc0, tc1, tc2, tc3], [tc4]],
+                              durations=durations,
+                              default_duration=10)
+        self.assertEqual([scheduler.pop() for i in range(5)], [tc2, tc3, tc1, tc4, tc0])
+
+        # Runner 'timeout' parameter
+        tc5 = TestCase(runner=make_runner(RunCommand, name='c/0', command=('true', ), timeout=4))
+        scheduler = Scheduler([[tc0, tc1, tc2, tc3], [tc4], [tc5]], durations=durations)
+        self.assertIs(scheduler.pop(), tc5)
+
+    def testDurationsCriticalPath(self):
+        # The dependent test is included in the expected time
+        tc0 = make_testcase('a/0')
+        tc1 = make_testcase('a/1', requires=('0', ))
+        tc2 = make_testcase('b/0')
+        durations = {'a/0': 1, 'a/1': 3, 'b/0': 2}
+
+        scheduler = Scheduler([[tc0, tc1], [tc2]], durations=durations)
+        self.assertIs(scheduler.pop(), tc0)
+        self.assertIs(scheduler.pop(), tc2)
+        self.assertIsNone(scheduler.pop())
+
+        finish(scheduler, tc0, TestCase.Result.PASS)
+        self.assertIs(scheduler.pop(), tc1)
+
+    def testResources(self):
+        tc0 = make_testcase('a/0', cores=3)
+        tc1 = make_testcase('a/1', memory=1024)
+        tc2 = make_testcase('a/2')
+        scheduler = Scheduler([[tc0, tc1, tc2]], max_cores=4, max_memory=2048)
+
+        self.assertEqual(scheduler.resources(tc0), (3, 0))
+        self.assertEqual(scheduler.resources(tc1), (1, 1024))
+        self.assertEqual(scheduler.resources(tc2), (1, 0))
+
+        # The highest priority object that fits the available resources is returned
+        self.assertIs(scheduler.pop(2, 2048), tc1)
+        self.assertIs(scheduler.pop(1, 0), tc2)
+        self.assertIsNone(scheduler.pop(2, 1024))
+        self.assertIs(scheduler.pop(3, 1024), tc0)
+        self.assertEqual(scheduler.resolved(), [])
+
+    def testResourcesPriority(self):
+        # The priority applies across the objects with different resources
+        tc0 = make_testcase('a/0', cores=2)
+        tc1 = make_testcase('a/1')
+        tc2 = make_testcase('a/2', cores=4)
+        tc3 = make_testcase('a/3', cores=2)
+        durations = {'a/0': 2, 'a/1': 1, 'a/2': 4, 'a/3': 3}
+        scheduler = Scheduler([[tc0, tc1, tc2, tc3]], durations=durations, max_cores=4)
+
+        self.assertIs(scheduler.pop(3), tc3)
+        self.assertIs(scheduler.pop(3), tc0)
+        self.assertIs(scheduler.pop(4), tc2)
+        self.assertIs(scheduler.pop(4), tc1)
+        self.assertIsNone(scheduler.pop(4))
+
+    def testResourcesPerformance(self):
+        # The objects that require more than the available resources are not inspected
+        testcases = [make_testcase(f'a/{i}', cores=4) for i in range(1000)]
+        scheduler = Scheduler([testcases], max_cores=4)
+
+        start = time.perf_counter()
+        for i in range(2000):
+            self.assertIsNone(scheduler.pop(2))
+        self.assertLess(time.perf_counter() - start, 1)
+        self.assertIs(scheduler.pop(4), testcases[0])
+
+    def testResourcesSoftLimit(self):
+        tc0 = make_testcase('a/0', cores=8)
+        tc1 = make_testcase('a/1', memory=4096)
+        scheduler = Scheduler([[tc0, tc1]], max_cores=4, max_memory=2048)
+
+        # Limited to the available resources, so they execute when nothing else is running
+        self.assertEqual(scheduler.resources(tc0), (4, 0))
+        self.assertEqual(scheduler.resources(tc1), (1, 2048))
+        self.assertEqual(scheduler.resolved(), [])
+        self.assertIs(scheduler.pop(4, 2048), tc0)
+        self.assertIs(scheduler.pop(4, 2048), tc1)
+
+    def testResourcesHardLimit(self):
+        tc0 = make_testcase('a/0', cores=8)
+        tc1 = make_testcase('a/1', memory=4096)
+        tc2 = make_testcase('a/2')
+        scheduler = Scheduler([[tc0, tc1, tc2]], max_cores=4, max_memory=2048, soft_limit=False)
+
+        resolved = scheduler.resolved()
+        self.assertEqual([r[0] for r in resolved], [tc0, tc1])
+        for tc, state, results in resolved:
+            self.assertEqual(state, TestCase.Result.SKIP)
+        self.assertEqual(results['a/1'].reasons, ['insufficient memory'])
+        self.assertEqual(
+            results['a/1'].stderr,
+            "For the test 'a/1', the required resources (1 cores, 4096 MB) exceed the available resources (4 cores, 2048 MB)."
+        )
+        self.assertEqual(resolved[0][2]['a/0'].reasons, ['insufficient cores'])
+
+        self.assertIs(scheduler.pop(), tc2)
+        self.assertIsNone(scheduler.pop())
+
+    def testResolved(self):
+        tc0 = make_testcase('a/0')
+        tc1 = make_testcase('a/1', requires=('0', ))
+        tc2 = make_testcase('a/2', requires=('unknown', ))
+        results = {'a/0': TestCase.Data(TestCase.Result.REMOVE, None, None, None, ['removed'])}
+        scheduler = Scheduler(
+            [[tc0, tc1, tc2]],
+            resolved={
+                tc0.unique_id: (TestCase.Result.REMOVE, results),
+                tc2.unique_id: (TestCase.Result.SKIP, results)
+            })
+
+        resolved = scheduler.resolved()
+        self.assertEqual(resolved, [(tc0, TestCase.Result.REMOVE, results),
+                                    (tc2, TestCase.Result.SKIP, results)])
+        self.assertIsNone(scheduler.pop())
+
+        # Dependents are handled as usual
+        finish(scheduler, tc0, TestCase.Result.REMOVE)
+        resolved = scheduler.resolved()
+        self.assertEqual(len(resolved), 1)
+        self.assertIs(resolved[0][0], tc1)
+        self.assertEqual(resolved[0][2]['a/1'].reasons, ['failed dependency'])
+
+    def testConflicts(self):
+        # The objects with the same files, or the same working directory when 'allow_parallel' is
+        # disabled, are executed one at a time, by priority
+        tc0 = make_testcase('a/0', file_names_created=('out.e', ))
+        tc1 = make_testcase('a/1', file_names_modified=('out.e', ))
+        tc2 = make_testcase('a/2')
+        tc3 = make_testcase('a/3', allow_parallel=False)
+        tc4 = make_testcase('b/0', allow_parallel=False, working_dir=tempfile.gettempdir())
+        durations = {'a/0': 5, 'a/1': 4, 'a/2': 3, 'a/3': 2, 'b/0': 1}
+        scheduler = Scheduler([[tc0, tc1, tc2, tc3], [tc4]], durations=durations)
+
+        self.assertIs(scheduler.pop(), tc0)
+        self.assertIs(scheduler.pop(), tc2)
+        self.assertIs(scheduler.pop(), tc4)
+        self.assertIsNone(scheduler.pop())
+
+        # The conflicts are released regardless of the state
+        finish(scheduler, tc4, TestCase.Result.PASS)
+        finish(scheduler, tc0, TestCase.Result.ERROR)
+        self.assertIs(scheduler.pop(), tc1)
+        self.assertIsNone(scheduler.pop())
+
+        finish(scheduler, tc1, TestCase.Result.PASS)
+        self.assertIsNone(scheduler.pop())
+        finish(scheduler, tc2, TestCase.Result.PASS)
+        self.assertIs(scheduler.pop(), tc3)
+        finish(scheduler, tc3, TestCase.Result.PASS)
+        self.assertIsNone(scheduler.pop())
+        self.assertEqual(len(scheduler), 0)
+
+        # The files expected by the objects in the same directory are ignored by the file checks
+        self.assertEqual(tc2.runner._Runner__concurrent_files, {'out.e'})
+        self.assertEqual(tc4.runner._Runner__concurrent_files, set())
+
+
+if __name__ == '__main__':
+    unittest.main(module=__name__, verbosity=2, buffer=True)
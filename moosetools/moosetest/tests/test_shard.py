@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import os
+import sys
+import unittest
+
+from moosetools.moosetest.base import make_runner
+from moosetools.moosetest.shard import shard
+from moosetools.moosetest.timing import TimingStore
+
+# I do not want the tests directory to be packages with __init__.py, so load from file
+sys.path.append(os.path.join(os.path.dirname(__file__)))
+from _helpers import TestRunner
+
+
+def make_groups(n_groups, n_runners):
+    return [[TestRunner(name=f'{g}/{i}') for i in range(n_runners)] for g in range(n_groups)]
+
+
+def names(groups):
+    return [runner.name() for runners in groups for runner in runners]
+
+
+class TestShard(unittest.TestCase):
+    def testErrors(self):
+        groups = make_groups(1, 1)
+        for index, count in [(0, 2), (3, 2), (1, 0)]:
+            with self.assertRaises(ValueError) as ex:
+                shard(groups, index, count)
+        self.assertIn("The shard index must be in the range 1 to 0, but 1 given.",
+                      str(ex.exception))
+
+    def testHash(self):
+        groups = make_groups(10, 20)
+        shards = [shard(groups, i, 4) for i in range(1, 5)]
+
+        # Each test is in a single shard, the order within a group is maintained
+        all_names = sum([names(s) for s in shards], [])
+        self.assertEqual(sorted(all_names), sorted(names(groups)))
+        for s in shards:
+            for runners in s:
+                self.assertEqual(runners, sorted(runners,
+                                                 key=lambda r: int(r.name().split('/')[1])))
+            self.assertGreater(len(names(s)), 20)
+
+        # Deterministic, new objects with the same names
+        self.assertEqual(names(shard(make_groups(10, 20), 2, 4)), names(shards[1]))
+
+        # Single shard
+        self.assertEqual(names(shard(groups, 1, 1)), names(groups))
+
+    def testRequires(self):
+        groups = make_groups(2, 10)
+        groups[0].append(make_runner(TestRunner, name='0/a', requires=('0/1', '0/2')))
+        groups[0].append(make_runner(TestRunner, name='0/b', requires=('a', )))
+        groups[1].append(make_runner(TestRunner, name='1/a', requires=('0/1', )))  # other group
+
+        for i in range(1, 4):
+            s = names(shard(groups, i, 3))
+            chain = [name in s for name in ('0/1', '0/2', '0/a', '0/b')]
+            self.assertTrue(all(chain) or not any(chain), s)
+
+    def testDurations(self):
+        groups = make_groups(1, 6)
+        groups[0].append(make_runner(TestRunner, name='0/a', requires=('0/0', )))
+        timing = TimingStore()
+        for name, duration in [('0/0', 5), ('0/1', 9), ('0/2', 4), ('0/3', 3), ('0/4', 2),
+                               ('0/a', 3)]:
+            timing.set(name, duration)
+
+        # Longest first to the shard with the least time, '0/5' uses the average time
+        self.assertEqual(names(shard(groups, 1, 3, durations=timing)), ['0/1'])
+        self.assertEqual(names(shard(groups, 2, 3, durations=timing)), ['0/0', '0/3', '0/a'])
+        self.assertEqual(names(shard(groups, 3, 3, durations=timing)), ['0/2', '0/4', '0/5'])
+
+        # Without any times the hash is used
+        self.assertEqual(names(shard(groups, 1, 3, durations=TimingStore())),
+                         names(shard(groups, 1, 3)))
+
+
+if __name__ == '__main__':
+    unittest.main(module=__name__, verbosity=2, buffer=True)
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import os
+import sys
+import json
+import tempfile
+import unittest
+from unittest import mock
+
+from moosetools.moosetest.base import make_runner, TestCase
+from moosetools.moosetest.timing import TimingStore
+
+# I do not want the tests directory to be packages with __init__.py, so load from file
+sys.path.append(os.path.join(os.path.dirname(__file__)))
+from _helpers import TestRunner
+
+
+class TestTimingStore(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self._filename = os.path.join(self._tmpdir.name, 'timing.json')
+
+    def tearDown(self):
+        self._tmpdir.cleanup()
+
+    def testMemory(self):
+        store = TimingStore()
+        self.assertIsNone(store.filename)
+        self.assertEqual(len(store), 0)
+        self.assertIsNone(store.get('a'))
+        self.assertEqual(store.get('a', 42), 42)
+
+        store.set('a', 1)
+        self.assertIn('a', store)
+        self.assertEqual(store.get('a'), 1.)
+        store.save()  # does nothing
+
+    def testSaveLoad(self):
+        store = TimingStore(self._filename)
+        self.assertEqual(len(store), 0)
+        store.set('a', 1.5)
+        store.set('b', 3)
+        store.save()
+
+        with open(self._filename, 'r') as fid:
+            self.assertEqual(json.load(fid), {'a': 1.5, 'b': 3.})
+
+        store = TimingStore(self._filename)
+        self.assertEqual(store.get('a'), 1.5)
+        self.assertEqual(store.get('b'), 3.)
+        self.assertEqual(os.listdir(self._tmpdir.name), ['timing.json'])
+
+    def testCorrupt(self):
+        with open(self._filename, 'w') as fid:
+            fid.write('{not json')
+
+        with self.assertLogs(level='WARNING') as log:
+            store = TimingStore(self._filename)
+        self.assertEqual(len(store), 0)
+        self.assertIn("Failed to load the test timing file", log.output[0])
+
+    def testUpdate(self):
+        tc0 = TestCase(runner=make_runner(TestRunner, name='a'))
+        tc1 = TestCase(runner=make_runner(TestRunner, name='b'))
+        tc2 = TestCase(runner=make_runner(TestRunner, name='c'))
+
+        tc0.setProgress(TestCase.Progress.RUNNING)
+        tc0.setProgress(TestCase.Progress.FINISHED)
+        tc0.setState(TestCase.Result.PASS)
+
+        tc1.setProgress(TestCase.Progress.FINISHED)  # never started
+        tc1.setState(TestCase.Result.SKIP)
+
+        store = TimingStore()
+        store.update([tc0, tc1, tc2])
+        self.assertIn('a', store)
+        self.assertNotIn('b', store)
+        self.assertNotIn('c', store)
+
+
+if __name__ == '__main__':
+    unittest.main(module=__name__, verbosity=2, buffer=True)
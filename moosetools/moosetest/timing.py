@@ -0,0 +1,74 @@
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+from moosetools import mooseutils
+from moosetools.moosetest.base import TestCase
+
+
+class TimingStore(object):
+    """
+    Persistent storage of the execution time of `TestCase` objects, keyed by the `TestCase` name.
+
+    The times are loaded from the JSON file in *filename*, if it exists, and written to the same
+    file with the `save` method. If *filename* is `None` the times are only stored in memory.
+
+    The stored times are used by the `moosetest.scheduler.Scheduler` to execute the longest running
+    tests first, see `moosetest.run` for use.
+    """
+    def __init__(self, filename=None):
+        self._filename = filename
+        convert = lambda data: {str(k): float(v) for k, v in data.items()}
+        self._times = mooseutils.load_data_file(filename, convert, 'test timing') or dict()
+
+    @property
+    def filename(self):
+        """
+        Return the filename used for storing the times.
+        """
+        return self._filename
+
+    def __len__(self):
+        return len(self._times)
+
+    def __contains__(self, name):
+        return name in self._times
+
+    def get(self, name, default=None):
+        """
+        Return the stored execution time for the `TestCase` with *name*.
+
+        If a time does not exist for the supplied name the *default* is returned.
+        """
+        return self._times.get(name, default)
+
+    def set(self, name, duration):
+        """
+        Store the execution time in seconds, *duration*, for the `TestCase` with *name*.
+        """
+        self._times[name] = float(duration)
+
+    def update(self, testcases):
+        """
+        Store the execution time of the finished `TestCase` objects in *testcases*.
+
+        Only `TestCase` objects that started execution are considered, tests that were skipped or
+        removed do not represent the time required for running the test.
+        """
+        for tc in testcases:
+            if tc.finished and (tc.start_time is not None) and \
+               (tc.state not in (TestCase.Result.SKIP, TestCase.Result.REMOVE)):
+                self.set(tc.name(), tc.time)
+
+    def save(self):
+        """
+        Write the stored times to the file supplied upon construction, see
+        `mooseutils.save_data_file`.
+        """
+        if self._filename is not None:
+            mooseutils.save_data_file(self._filename, self._times)
@@ -90,6 +90,10 @@ class Node(object):
         """Iterate of the children (e.g., `for child in node:`)"""
         return iter(self.__children)
 
+    def __reversed__(self):
+        """Iterate of the children in reverse order (e.g., `for child in reversed(node):`)"""
+        return reversed(self.__children)
+
     def insert(self, idx, child):
         """Insert a nod *child* before the supplied *idx* in the list of children."""
         self.__children.insert(idx, child)
@@ -101,8 +105,9 @@ class Node(object):
         nodes = [self]
         parent = self.__parent
         while parent is not None:
-            nodes.insert(0, parent)
+            nodes.append(parent)
             parent = parent.parent
+        nodes.reverse()
         return nodes
 
     @property
@@ -190,17 +195,20 @@ class Node(object):
             return '{}: {}'.format(self.name, repr(self.__attributes))
         return self.name
 
-    def __print(self, indent=u''):
+    def __print(self):
         """Helper function printing to the screen."""
-        if (self.parent is None) or (self.parent.children[-1] is self):
-            out = u'{}\u2514\u2500 {}\n'.format(indent, repr(self))
-            indent += u"   "
+        out = list()
+        stack = [(self, u'')]
+        while stack:
+            node, indent = stack.pop()
+            if (node.__parent is None) or (node.__parent.__children[-1] is node):
+                out.append(u'{}\u2514\u2500 {}\n'.format(indent, repr(node)))
+                indent += u"   "
 
-        else:
-            out = u'{}\u251c\u2500 {}\n'.format(indent, repr(self))
-            indent += u"\u2502  "
+            else:
+                out.append(u'{}\u251c\u2500 {}\n'.format(indent, repr(node)))
+                indent += u"\u2502  "
 
-        for child in self.children:
-            out += child.__print(indent)
+            stack.extend((child, indent) for child in reversed(node.__children))
 
-        return out
+        return u''.join(out)
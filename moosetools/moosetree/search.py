@@ -8,6 +8,7 @@
 #* https://www.gnu.org/licenses/lgpl-2.1.html
 """Tools for iterating and locating nodes."""
 import sys
+import collections
 from enum import Enum
 
 
@@ -69,25 +70,32 @@ def iterate(node, func=None, abort_on_find=False, method=None):
         return __preorder_iterate(node, func, abort_on_find)
 
 
+# The iteration functions iterate over the children of each node (see `Node.__iter__`), rather than
+# using the `Node.children` property, to avoid creating a copy of the list for each node. The
+# children of a node are read after the node is returned, so the tree may be modified during
+# iteration.
+
+
 def __breadthfirst_iterate(node, func, abort_on_find):
     """Breadth-first iteration"""
-    stack = node.children
-    while stack:
-        child = stack.pop(0)
+    queue = collections.deque(node)
+    while queue:
+        child = queue.popleft()
         if func(child):
             yield child
             if abort_on_find:
                 return
-        stack += child.children
+        queue.extend(child)
 
 
 def __preorder_iterate(node, func, abort_on_find):
     """Pre-Order iteration"""
     stack = node.children
+    stack.reverse()
     while stack:
-        child = stack.pop(0)
+        child = stack.pop()
         if func(child):
             yield child
             if abort_on_find:
                 return
-        stack = child.children + stack
+        stack.extend(reversed(child))
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+"""
+Benchmark of the construction and traversal of large `moosetree.Node` trees.
+
+This is not executed with the tests, run it directly (e.g., `python benchmark.py`) to compare the
+performance of changes to the `moosetree` package.
+"""
+import argparse
+import collections
+import time
+from moosetools import moosetree
+
+
+def build(n, width):
+    """
+    Return a tree with *n* nodes, in addition to the root, with *width* children for each node.
+    """
+    root = moosetree.Node(None, 'root')
+    parents = collections.deque([root])
+    count = 0
+    while count < n:
+        parent = parents.popleft()
+        for i in range(min(width, n - count)):
+            parents.append(moosetree.Node(parent, 'node', index=count))
+            count += 1
+    return root
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-n', '--number', type=int, default=1000000, help="Number of nodes.")
+    parser.add_argument('-w',
+                        '--width',
+                        type=int,
+                        nargs='+',
+                        default=[2, 100],
+                        help="Number of children for each node.")
+    args = parser.parse_args()
+
+    for width in args.width:
+        start = time.perf_counter()
+        root = build(args.number, width)
+        cases = [('build', None), ('pre-order', lambda: list(root.descendants)),
+                 ('breadth-first', lambda: list(moosetree.iterate(root))),
+                 ('findall', lambda: list(moosetree.findall(root, index=args.number - 1))),
+                 ('count', lambda: root.count), ('str', lambda: str(root))]
+        print(f"{args.number} nodes, {width} children for each node")
+        for name, func in cases:
+            if func is not None:
+                start = time.perf_counter()
+                func()
+            print(f"{name:>14}: {time.perf_counter() - start:8.3f} s")
+
+
+if __name__ == '__main__':
+    main()
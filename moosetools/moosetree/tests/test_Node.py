@@ -80,6 +80,7 @@ class TestNode(unittest.TestCase):
 
         children = [c for c in n0]
         self.assertEqual(children, n0.children)
+        self.assertEqual(list(reversed(n0)), [n2, n1])
 
         with self.assertRaises(AttributeError):
             n0.children = [n0]
@@ -124,6 +124,36 @@ class TestIterator(unittest.TestCase):
         self.assertEqual(nodes[27].name, 'ABCAA')
         self.assertEqual(nodes[28].name, 'ABCAB')
 
+    def testModify(self):
+        # The children of a node are read after the node is returned, so the tree can be changed
+        for method in (moosetree.IterMethod.PRE_ORDER, moosetree.IterMethod.BREADTH_FIRST):
+            root = build_tree()
+            names = list()
+            for node in moosetree.iterate(root, method=method):
+                names.append(node.name)
+                if node.name == 'A':
+                    node(1).parent = None  # AB
+                elif node.name == 'B':
+                    root(2).parent = None  # C, which was already read
+                elif node.name == 'BA':
+                    moosetree.Node(node, 'BAC')
+            self.assertEqual(len(names), 21)
+            self.assertNotIn('AB', names)
+            self.assertNotIn('ABCAB', names)
+            self.assertIn('BAC', names)
+            self.assertIn('CCC', names)
+
+    def testDeep(self):
+        root = moosetree.Node(None, 'root')
+        node = root
+        for i in range(5000):
+            node = moosetree.Node(node, str(i))
+        for method in (moosetree.IterMethod.PRE_ORDER, moosetree.IterMethod.BREADTH_FIRST):
+            nodes = list(moosetree.iterate(root, method=method))
+            self.assertEqual(len(nodes), 5000)
+            self.assertEqual(nodes[-1].name, '4999')
+        self.assertEqual(len(node.path), 5001)
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
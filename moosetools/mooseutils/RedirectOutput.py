@@ -12,7 +12,6 @@ import io
 import collections
 import threading
 import logging
-import platform
 
 
 class RedirectOutput(object):
@@ -37,8 +36,10 @@ class RedirectOutput(object):
         """
         def __init__(self, io):
             self._io = io
-            self._tid = threading.get_native_id(
-            ) if platform.python_version() >= '3.8.0' else threading.get_ident()
+            if sys.version_info >= (3, 8):
+                self._tid = threading.get_native_id()
+            else:
+                self._tid = threading.get_ident()
 
         def write(self, message):
             self._io[self._tid].write(message)
@@ -48,8 +49,10 @@ class RedirectOutput(object):
 
     def __init__(self, *, merge=False):
         self._merge = merge
-        self._tid = threading.get_native_id(
-        ) if platform.python_version() >= '3.8.0' else threading.get_ident()
+        if sys.version_info >= (3, 8):
+            self._tid = threading.get_native_id()
+        else:
+            self._tid = threading.get_ident()
         self._stdout = collections.defaultdict(
             lambda: io.TextIOWrapper(io.BytesIO(), RedirectOutput.SYS_STDOUT.encoding))
         self._stderr = collections.defaultdict(
@@ -84,7 +87,7 @@ class RedirectOutput(object):
         sys.stdout = RedirectOutput.SysRedirect(self._stdout)
         sys.stderr = sys.stdout if self._merge else RedirectOutput.SysRedirect(self._stderr)
 
-        if platform.python_version() < '3.7.0':
+        if sys.version_info < (3, 7):
             for h in self._handlers:
                 h.stream = sys.stderr
         else:
@@ -101,7 +104,7 @@ class RedirectOutput(object):
         sys.stdout = RedirectOutput.SYS_STDOUT
         sys.stderr = RedirectOutput.SYS_STDERR
 
-        if platform.python_version() < '3.7.0':
+        if sys.version_info < (3, 7):
             for h in self._handlers:
                 h.stream = RedirectOutput.SYS_STDERR
         else:
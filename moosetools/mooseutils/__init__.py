@@ -39,3 +39,4 @@ try:
 except:
     pass
 from .validate import validate_extension, validate_paths_exist
+from .data_file import load_data_file, save_data_file
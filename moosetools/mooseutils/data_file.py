@@ -0,0 +1,62 @@
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import os
+import json
+import pickle
+import logging
+
+
+def load_data_file(filename, convert=None, name=None, binary=False):
+    """
+    Return the content of the JSON file *filename*, `None` if the file does not exist.
+
+    If provided, the loaded content is passed to the *convert* function and the result is returned.
+    If the file cannot be loaded or converted `None` is returned, with a warning that uses *name* to
+    describe the file if it is provided (e.g., "test timing"). The file is read with `pickle`
+    rather than as JSON if *binary* is `True`.
+    """
+    if (filename is None) or (not os.path.isfile(filename)):
+        return None
+
+    try:
+        with open(filename, 'rb' if binary else 'r') as fid:
+            data = pickle.load(fid) if binary else json.load(fid)
+        return convert(data) if convert is not None else data
+    except Exception:
+        if name is not None:
+            log = logging.getLogger(__name__)
+            log.warning("Failed to load the %s file '%s', it will be re-created.", name, filename)
+    return None
+
+
+def save_data_file(filename, data, binary=False):
+    """
+    Write *data* to the JSON file *filename*, creating the directory if needed.
+
+    The data is written to a temporary file and then moved, so a partially written file is not
+    created if the process is interrupted. The temporary file is removed if writing fails. The data
+    is written with `pickle` rather than as JSON if *binary* is `True`.
+    """
+    dirname = os.path.dirname(filename)
+    if dirname:
+        os.makedirs(dirname, exist_ok=True)
+
+    tmp = f'{filename}.{os.getpid()}.tmp'
+    try:
+        with open(tmp, 'wb' if binary else 'w') as fid:
+            if binary:
+                pickle.dump(data, fid)
+            else:
+                json.dump(data, fid, sort_keys=True)
+        os.replace(tmp, filename)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import os
+import json
+import tempfile
+import unittest
+from moosetools import mooseutils
+
+
+class TestDataFile(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self._filename = os.path.join(self._tmpdir.name, 'sub', 'data.json')
+
+    def tearDown(self):
+        self._tmpdir.cleanup()
+
+    def testSaveLoad(self):
+        self.assertIsNone(mooseutils.load_data_file(None))
+        self.assertIsNone(mooseutils.load_data_file(self._filename))
+
+        mooseutils.save_data_file(self._filename, {'b': 2, 'a': 1})
+        self.assertEqual(os.listdir(os.path.dirname(self._filename)), ['data.json'])
+        self.assertEqual(mooseutils.load_data_file(self._filename), {'a': 1, 'b': 2})
+        self.assertEqual(mooseutils.load_data_file(self._filename, lambda d: sorted(d)), ['a', 'b'])
+
+    def testBinary(self):
+        mooseutils.save_data_file(self._filename, {'a': {1, 2}}, binary=True)
+        self.assertEqual(mooseutils.load_data_file(self._filename, binary=True), {'a': {1, 2}})
+        with self.assertLogs(level='WARNING') as log:
+            self.assertIsNone(mooseutils.load_data_file(self._filename, name='test'))
+        self.assertIn("Failed to load the test file", log.output[0])
+
+    def testLoadError(self):
+        os.makedirs(os.path.dirname(self._filename))
+        with open(self._filename, 'w') as fid:
+            fid.write('{not json')
+
+        with self.assertLogs(level='WARNING') as log:
+            self.assertIsNone(mooseutils.load_data_file(self._filename, name='test'))
+        self.assertIn("Failed to load the test file", log.output[0])
+
+        with open(self._filename, 'w') as fid:
+            fid.write('[1, 2]')
+        with self.assertLogs(level='WARNING') as log:
+            self.assertIsNone(mooseutils.load_data_file(self._filename, dict.items, 'test'))
+        self.assertIn("Failed to load the test file", log.output[0])
+
+    def testSaveError(self):
+        mooseutils.save_data_file(self._filename, {'a': 1})
+        with self.assertRaises(TypeError):
+            mooseutils.save_data_file(self._filename, {'a': object()})
+        self.assertEqual(os.listdir(os.path.dirname(self._filename)), ['data.json'])
+        with open(self._filename, 'r') as fid:
+            self.assertEqual(json.load(fid), {'a': 1})
+
+
+if __name__ == '__main__':
+    unittest.main(module=__name__, verbosity=2)
@@ -7,12 +7,15 @@
 #* Licensed under LGPL 2.1, please see LICENSE for details
 #* https://www.gnu.org/licenses/lgpl-2.1.html
 
-from collections import OrderedDict
+import os
 import re
 import enum
 import logging
 import copy
+import copyreg
 import argparse
+import itertools
+import contextlib
 
 from moosetools import core
 from .Parameter import Parameter
@@ -26,6 +29,18 @@ class InputParameters(object):
 
     __PARAM_TYPE__ = Parameter
 
+    __slots__ = ('__parameters', '__schema')
+
+    #: The group and sub-parameter names of nested parameter names (e.g., 'foo_bar'), see
+    #  `_getParameter`. The names only depend on the string, so they are shared by all instances.
+    __NESTED_NAMES = dict()
+
+    #: The schemas received in the compact format, by identifier, and the identifiers of the schemas
+    #  known by the receiver when pickling within the `compact` context.
+    __SCHEMAS = dict()
+    __SCHEMA_IDS = itertools.count()
+    __COMPACT = None
+
     class ErrorMode(enum.Enum):
         """Defines the error mode for all instances"""
         NONE = 0  # disable errors
@@ -35,7 +50,8 @@ class InputParameters(object):
         EXCEPTION = 4  # raises MooseException, the import occurs when raised to avoid cyclic imports
 
     def __init__(self):
-        self.__parameters = OrderedDict()
+        self.__parameters = dict()
+        self.__schema = None  # see `copy`
         self.add(
             '_moose_object',
             private=True,
@@ -114,6 +130,129 @@ class InputParameters(object):
 
             self.__parameters[key] = params._InputParameters__parameters[key]
 
+    def copy(self):
+        """
+        Return a copy of this object, with a copy of each `Parameter` (see `Parameter.copy`).
+
+        This is considerably faster than creating the parameters again (e.g., by calling a
+        `validParams` function), but the values are not copied. As such, a value that is modified
+        in place (e.g., a `dict`) is modified in both objects.
+
+        The copies share a schema (i.e., the `Parameter` objects without the values) that allows
+        them to be pickled in a compact format, see `compact`. Parameters added to either object
+        are pickled in full and removing a parameter removes the schema from that object.
+        """
+        out = self.__class__.__new__(self.__class__)
+        if hasattr(self, '__dict__'):  # attributes of a derived class without __slots__
+            out.__dict__.update(self.__dict__)
+        out.__parameters = {key: param.copy() for key, param in self.__parameters.items()}
+
+        if self.__schema is None:
+            params = tuple(param.copy() for param in self.__parameters.values())
+            for param in params:
+                _, default, required, _, _ = param._getState()
+                param._setState(None, default, required, False, False)
+            key = (os.getpid(), next(InputParameters.__SCHEMA_IDS))
+            self.__schema = (key, tuple(self.__parameters.keys()), params)
+        out.__schema = self.__schema
+        return out
+
+    @staticmethod
+    @contextlib.contextmanager
+    def compact(schemas):
+        """
+        Pickle `InputParameters` objects that have a schema (see `copy`) in a compact format within
+        the context.
+
+        In the compact format the `Parameter` objects are represented by the identifier of the
+        schema, only the values and defaults that differ from the schema and the state that changes
+        after construction (e.g., the required flag) are included. The schema itself is included if
+        the identifier is not in the `set` *schemas*. The identifiers of the included schemas are
+        added to *schemas* when the context exits without an exception.
+
+        When loaded the schemas are stored, so the same *schemas* should be used for all data sent
+        to a receiver (e.g., a process, see `moosetest.run`). For example, the following sends the
+        schema of the parameters of `obj` once.
+
+        ```python
+        schemas = set()
+        with InputParameters.compact(schemas):
+            conn.send(obj)
+        ```
+        """
+        previous = InputParameters.__COMPACT
+        InputParameters.__COMPACT = pending = set(schemas)
+        try:
+            yield
+        finally:
+            InputParameters.__COMPACT = previous
+        schemas.update(pending)
+
+    def __reduce_ex__(self, protocol):
+        """
+        Return the data for pickling, see `compact`.
+        """
+        known = InputParameters.__COMPACT
+        if (known is None) or (self.__schema is None) or (type(self) is not InputParameters):
+            return super().__reduce_ex__(protocol)
+
+        key, _, params = self.__schema
+        schema = None if key in known else self.__schema
+        known.add(key)
+
+        # The value is omitted if it is the default, which is omitted if it is the default of the
+        # schema, thus only the values that were changed are included
+        values = list()
+        defaults = dict()
+        flags = bytearray()
+        for index, (param, origin) in enumerate(zip(self.__parameters.values(), params)):
+            value, default, required, set_by_user, validated = param._getState()
+            if default is not origin.default:
+                defaults[index] = default
+            if value is not default:
+                values.append(value)
+            flags.append(required | (set_by_user << 1) | (validated << 2)
+                         | ((value is default) << 3))
+
+        # Parameters added after the copy, see `copy`
+        extra = tuple(itertools.islice(self.__parameters.items(), len(params), None))
+        state = (key, schema, tuple(values), defaults, bytes(flags), extra)
+        return copyreg.__newobj__, (InputParameters, ), state
+
+    def __getstate__(self):
+        """
+        Return the state for pickling, see `__reduce_ex__` for the compact format.
+        """
+        return self.__parameters
+
+    def __setstate__(self, state):
+        """
+        Restore the state from pickling, in the compact format or otherwise.
+        """
+        if isinstance(state, dict):
+            self.__parameters = state
+            self.__schema = None
+            return
+
+        key, schema, values, defaults, flags, extra = state
+        if schema is None:
+            schema = InputParameters.__SCHEMAS[key]
+        else:
+            InputParameters.__SCHEMAS[key] = schema
+
+        _, names, params = schema
+        values = iter(values)
+        self.__parameters = dict()
+        for index, (name, origin) in enumerate(zip(names, params)):
+            param = origin.copy()
+            default = defaults.get(index, origin.default)
+            value = default if (flags[index] & 8) else next(values)
+            param._setState(value, default, bool(flags[index] & 1), bool(flags[index] & 2),
+                            bool(flags[index] & 4))
+            self.__parameters[name] = param
+        self.__parameters.update(extra)
+        self.__schema = schema
+
     def parameter(self, *args):
         """
         Return the desired `Parameter` object.
@@ -161,6 +300,7 @@ class InputParameters(object):
             self.__errorHelper("The parameter '{}' does not exist.", name)
         else:
             self.__parameters.pop(name)
+            self.__schema = None
 
     def isValid(self, *args):
         """
@@ -258,7 +398,7 @@ class InputParameters(object):
             value: The value for setting set the parameter
         """
         param = self._getParameter(*args[:-1])
-        if (param is not None) and param.isInstance(InputParameters) and isinstance(args[-1], dict):
+        if (param is not None) and isinstance(args[-1], dict) and param.isInstance(InputParameters):
             param.value.update(**args[-1])
         elif param is not None:
             ret, err = param.setValue(args[-1])
@@ -394,11 +534,15 @@ class InputParameters(object):
             return
 
         opt = self.__parameters.get(args[0])
+        if (opt is not None) and (len(args) == 1):
+            return opt
+
         if (opt is None) and ('_' in args[0]):
-            group, subname = args[0].split('_', 1)
-            sub_args = [group, subname] + list(args[1:]) if len(args) > 1 else [group, subname]
-            if group in self.__parameters:
-                return self._getParameter(*sub_args)
+            names = InputParameters.__NESTED_NAMES.get(args[0])
+            if names is None:
+                names = InputParameters.__NESTED_NAMES[args[0]] = tuple(args[0].split('_', 1))
+            if names[0] in self.__parameters:
+                return self._getParameter(*names, *args[1:])
 
         if opt is None:
             if not suppress_error:
@@ -9,9 +9,24 @@
 
 import textwrap
 import inspect
+import types
+import enum
 import logging
 
 
+def _is_input_parameters(value):
+    """
+    Return True if *value* is an `InputParameters` object.
+
+    The import, which is needed to avoid a cyclic import, is avoided for common types since it is
+    slow relative to the calling methods.
+    """
+    if isinstance(value, (type(None), bool, int, float, str, tuple, enum.Enum)):
+        return False
+    from .InputParameters import InputParameters
+    return isinstance(value, InputParameters)
+
+
 class Parameter(object):
     """
     Storage container for an "param" that can be type checked, restricted, and documented.
@@ -47,6 +62,15 @@ class Parameter(object):
         mutable[bool]: Do not allow the value to change after validation.
         user_data: Arbitrary meta data for use by objects.
     """
+    __slots__ = ('__name', '__value', '__default', '__vtype', '__allow', '__doc', '__array',
+                 '__size', '__required', '__verify', '__set_by_user', '__mutable', '__validated',
+                 '__user_data', '__private', '__check')
+
+    #: Compiled value checks (see `__compileCheck`), keyed by the arguments that define them. A
+    #  definition is stored after the arguments are checked, so the checks are not repeated for
+    #  the many objects created with the same arguments (e.g., from a `validParams` function).
+    __CHECKS = dict()
+
     def __init__(self,
                  name,
                  default=None,
@@ -91,6 +115,38 @@ class Parameter(object):
             msg = "The supplied 'doc' argument must be a 'str', but {} was provided."
             raise TypeError(msg.format(type(self.__doc)))
 
+        if self.__size is not None:
+            self.__array = True
+
+        # Check the arguments and compile the value checks, unless done for the same arguments
+        try:
+            key = Parameter.__getDefinitionKey(vtype, allow, size, array, required, self.__private,
+                                               verify, mutable)
+            compiled = key in Parameter.__CHECKS
+        except TypeError:  # unhashable arguments, which are checked every time
+            key = None
+            compiled = False
+
+        if compiled:
+            self.__check = Parameter.__CHECKS[key]
+        else:
+            self.__checkDefinition()
+            self.__check = Parameter.__compileCheck(self.__vtype, self.__allow, self.__size,
+                                                    self.__array)
+            if key is not None:
+                Parameter.__CHECKS[key] = self.__check
+
+        if self.__default is not None:
+            retcode, msg = self.setDefault(self.__default)
+            self.__set_by_user = False
+            if retcode > 0:
+                raise TypeError(msg)
+
+    def __checkDefinition(self):
+        """
+        Check the arguments supplied to the constructor, a `TypeError` is raised if they are not
+        valid.
+        """
         if (self.__vtype is not None) and (any(not isinstance(v, type) for v in self.__vtype)):
             msg = "The supplied 'vtype' argument must be a 'type', but {} was provided."
             raise TypeError(msg.format(type(self.__vtype)))
@@ -146,14 +202,85 @@ class Parameter(object):
             msg = "The supplied 'mutable' argument must be a 'bool', but {} was provided."
             raise TypeError(msg.format(type(self.__mutable)))
 
-        elif self.__size is not None:
-            self.__array = True
+    @staticmethod
+    def __getDefinitionKey(vtype, allow, size, array, required, private, verify, mutable):
+        """
+        Return a key for the constructor arguments that define the checks, see `__CHECKS`.
 
-        if self.__default is not None:
-            retcode, msg = self.setDefault(self.__default)
-            self.__set_by_user = False
-            if retcode > 0:
-                raise TypeError(msg)
+        The types of the values are included, because values that compare equal are not necessarily
+        valid (e.g., a 'size' of 3.0). Functions are represented by the code, so a function created
+        for each object (e.g., a lambda in a `validParams` function) does not add an entry.
+        """
+        if isinstance(allow, tuple):
+            allow = (allow, tuple(type(v) for v in allow))
+        if isinstance(verify, tuple):
+            func = verify[0] if verify else None
+            if isinstance(func, types.FunctionType) and not hasattr(func, '__wrapped__'):
+                func = func.__code__
+            verify = (type(verify[0]) if verify else None, func, verify[1:])
+        return (vtype, allow, type(size), size, bool(array), type(required), type(private),
+                type(mutable), verify)
+
+    @staticmethod
+    def __compileCheck(vtype, allow, size, array):
+        """
+        Return a function that checks the type, allowed values, and size of a value.
+
+        The function is called with the parameter name and the value and returns the error message
+        if the value is not valid, otherwise `None`. Only the checks needed for the supplied
+        arguments are included and `None` is returned if no checks are needed.
+        """
+        if array:
+            check_items = (vtype is not None) or (allow is not None)
+
+            def check(name, val):
+                if not isinstance(val, tuple):
+                    msg = "'{}' was defined as an array, which require {} for assignment, but a {} " \
+                          "was provided."
+                    return msg.format(name, tuple, type(val))
+
+                if check_items:
+                    for v in val:
+                        if (v is not None) and (vtype is not None) and not isinstance(v, vtype):
+                            msg = "The values within '{}' must be of type {} but {} provided."
+                            return msg.format(name, vtype, type(v))
+
+                        if (v is not None) and (allow is not None) and (v not in allow):
+                            msg = "Attempting to set '{}' to a value of {} but only the following " \
+                                  "are allowed: {}"
+                            return msg.format(name, val, allow)
+
+                if (size is not None) and (len(val) != size):
+                    msg = "'{}' was defined as an array with length {} but a value with length {} " \
+                          "was provided."
+                    return msg.format(name, size, len(val))
+
+            return check
+
+        elif allow is not None:
+
+            def check(name, val):
+                if (val is not None) and (vtype is not None) and not isinstance(val, vtype):
+                    msg = "'{}' must be of type {} but {} provided."
+                    return msg.format(name, vtype, type(val))
+
+                if (val is not None) and (val not in allow):
+                    msg = "Attempting to set '{}' to a value of {} but only the following are " \
+                          "allowed: {}"
+                    return msg.format(name, val, allow)
+
+            return check
+
+        elif vtype is not None:
+
+            def check(name, val):
+                if (val is not None) and not isinstance(val, vtype):
+                    msg = "'{}' must be of type {} but {} provided."
+                    return msg.format(name, vtype, type(val))
+
+            return check
+
+        return None
 
     @property
     def name(self):
@@ -277,6 +404,74 @@ class Parameter(object):
             self.__set_by_user = True
         return retcode, error
 
+    def copy(self):
+        """
+        Return a copy of this object, without repeating the checks performed by the constructor.
+
+        The value and default are not copied, except for sub-parameters (i.e., an `InputParameters`
+        value), which are copied with `InputParameters.copy`.
+        """
+        out = self.__class__.__new__(self.__class__)
+        out.__name = self.__name
+        out.__value = self.__value
+        out.__default = self.__default
+        out.__vtype = self.__vtype
+        out.__allow = self.__allow
+        out.__doc = self.__doc
+        out.__array = self.__array
+        out.__size = self.__size
+        out.__required = self.__required
+        out.__verify = self.__verify
+        out.__set_by_user = self.__set_by_user
+        out.__mutable = self.__mutable
+        out.__validated = self.__validated
+        out.__user_data = self.__user_data
+        out.__private = self.__private
+        out.__check = self.__check
+        if hasattr(self, '__dict__'):  # attributes of a derived class without __slots__
+            out.__dict__.update(self.__dict__)
+
+        if _is_input_parameters(self.__value):
+            out.__value = self.__value.copy()
+            if self.__default is self.__value:
+                out.__default = out.__value
+        return out
+
+    def __getstate__(self):
+        """
+        Return the state for pickling, the compiled check is excluded because it is a closure.
+        """
+        state = {s: getattr(self, f'_Parameter{s}') for s in Parameter.__slots__ if s != '__check'}
+        if hasattr(self, '__dict__'):
+            state.update(self.__dict__)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restore the state from pickling and compile the check, see `__getstate__`.
+        """
+        for key, value in state.items():
+            setattr(self, f'_Parameter{key}' if key in Parameter.__slots__ else key, value)
+        self.__check = Parameter.__compileCheck(self.__vtype, self.__allow, self.__size,
+                                                self.__array)
+
+    def _getState(self):
+        """
+        Return the value, default, required, set by user, and validated state, which are the parts
+        of the state that change after construction (see `InputParameters.compact`).
+        """
+        return self.__value, self.__default, self.__required, self.__set_by_user, self.__validated
+
+    def _setState(self, value, default, required, set_by_user, validated):
+        """
+        Restore the state returned by `_getState`, without performing any checks.
+        """
+        self.__value = value
+        self.__default = default
+        self.__required = required
+        self.__set_by_user = set_by_user
+        self.__validated = validated
+
     def isInstance(self, types):
         """
         Returns True if the value of the parameters is in the supplied *types*.
@@ -301,8 +496,7 @@ class Parameter(object):
             msg = "The parameter '{}' is marked as required, but no value is assigned."
             return 1, msg.format(self.name)
 
-        from .InputParameters import InputParameters
-        if self.isInstance(InputParameters):
+        if _is_input_parameters(self.__value):
             self.__value.validate()
 
         self.__validated = True
@@ -311,8 +505,7 @@ class Parameter(object):
     def toString(self, prefix='', level=0):
         """Create a string of Parameter information."""
         self.validate()
-        from .InputParameters import InputParameters
-        is_sub_option = self.isInstance(InputParameters)
+        is_sub_option = _is_input_parameters(self.__value)
 
         out = [self.__name]
         if prefix is not None:
@@ -359,38 +552,10 @@ class Parameter(object):
             msg = "'{}' was defined as required, which requires a type of {} for assignment, a value of None may not be utilized."
             return 1, msg.format(self.name, self.__vtype)
 
-        if self.__array and not isinstance(val, tuple):
-            msg = "'{}' was defined as an array, which require {} for assignment, but a {} was " \
-                  "provided."
-            return 1, msg.format(self.name, tuple, type(val))
-
-        if self.__array:
-            for v in val:
-                if (v is not None) and (self.__vtype
-                                        is not None) and not isinstance(v, self.__vtype):
-                    msg = "The values within '{}' must be of type {} but {} provided."
-                    return 1, msg.format(self.name, self.__vtype, type(v))
-
-                if (v is not None) and (self.__allow is not None) and (v not in self.__allow):
-                    msg = "Attempting to set '{}' to a value of {} but only the following are allowed: {}"
-                    return 1, msg.format(self.name, val, self.__allow)
-
-            if self.__size is not None:
-                if (val is not None) and (len(val) != self.__size):
-                    msg = "'{}' was defined as an array with length {} but a value with length {} " \
-                          "was provided."
-                    return 1, msg.format(self.name, self.__size, len(val))
-
-        else:
-            if (val is not None) and (self.__vtype
-                                      is not None) and not isinstance(val, self.__vtype):
-                msg = "'{}' must be of type {} but {} provided."
-                return 1, msg.format(self.name, self.__vtype, type(val))
-
-            # Check that the value is allowed
-            if (val is not None) and (self.__allow is not None) and (val not in self.__allow):
-                msg = "Attempting to set '{}' to a value of {} but only the following are allowed: {}"
-                return 1, msg.format(self.name, val, self.__allow)
+        if self.__check is not None:
+            msg = self.__check(self.__name, val)
+            if msg is not None:
+                return 1, msg
 
         # Call custom verify function
         if (val is not None) and (self.__verify is not None) and (not self.__verify[0](val)):
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+"""
+Micro-benchmark of the create, set, and get throughput of `InputParameters` objects.
+
+This is not executed with the tests, run it directly (e.g., `python benchmark.py`) to compare the
+performance of changes to the `parameters` package.
+"""
+import argparse
+import timeit
+from moosetools.parameters import InputParameters
+
+
+def create():
+    """
+    Return parameters similar to those of a typical `MooseObject`, with a sub-parameter.
+    """
+    sub = InputParameters()
+    sub.add('names', vtype=str, array=True, doc="Names to check.")
+    sub.add('remove', vtype=bool, default=False, doc="Remove the object.")
+
+    params = InputParameters()
+    params.add('name', vtype=str, doc="The name of the object.")
+    params.add('log_level', vtype=str, default='INFO', allow=('DEBUG', 'INFO', 'WARNING', 'ERROR'))
+    params.add('command', vtype=str, array=True, required=True, doc="The command to execute.")
+    params.add('timeout', vtype=(int, float), default=300, verify=(lambda v: v > 0, "positive"))
+    params.add('size', vtype=int, size=3, default=(1, 2, 3))
+    params.add('working_dir', vtype=str, doc="The working directory.")
+    params.add('ctrl', default=sub)
+    for i in range(20):
+        params.add(f'par{i}', vtype=int, default=i, doc="A parameter.")
+    return params
+
+
+def set_values(params):
+    """
+    Set values of the parameters created by `create`.
+    """
+    params.setValue('name', 'andrew')
+    params.setValue('log_level', 'DEBUG')
+    params.setValue('command', ('echo', 'hello', 'world'))
+    params.setValue('timeout', 42)
+    params.setValue('size', (4, 5, 6))
+    params.setValue('ctrl_names', ('a', 'b'))
+    for i in range(20):
+        params.setValue(f'par{i}', i + 1)
+
+
+def get_values(params):
+    """
+    Get values of the parameters created by `create`.
+    """
+    params.getValue('name')
+    params.getValue('log_level')
+    params.getValue('command')
+    params.getValue('timeout')
+    params.getValue('size')
+    params.getValue('ctrl_names')
+    params.getValue('ctrl', 'remove')
+    for i in range(20):
+        params.getValue(f'par{i}')
+
+
+def construct():
+    """
+    Create, set, and validate parameters, as done when constructing a `MooseObject`.
+    """
+    params = create()
+    set_values(params)
+    params.validate()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-n', '--number', type=int, default=2000, help="Number of repetitions.")
+    args = parser.parse_args()
+
+    params = create()
+    set_values(params)
+    cases = [('create', create), ('copy', params.copy), ('set', lambda: set_values(params)),
+             ('get', lambda: get_values(params)), ('construct', construct)]
+    for name, func in cases:
+        t = min(timeit.repeat(func, number=args.number, repeat=3)) / args.number
+        print(f"{name:>9}: {t * 1e6:8.2f} us/call {1 / t:10.0f} calls/s")
+
+
+if __name__ == '__main__':
+    main()
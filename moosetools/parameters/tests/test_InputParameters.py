@@ -11,6 +11,7 @@
 import os
 import sys
 import re
+import pickle
 import unittest
 
 from moosetools.core import MooseException
@@ -409,6 +410,111 @@ class TestInputParameters(unittest.TestCase):
         p = font.parameter('size')
         self.assertIsInstance(p, Parameter)
 
+    def testCopy(self):
+        font = InputParameters()
+        font.add('size', default=24)
+        text = InputParameters()
+        text.add('font', font)
+        text.add('color', vtype=str, allow=('red', 'blue'))
+
+        other = text.copy()
+        self.assertIsNot(other, text)
+        self.assertIsNot(other.parameter('color'), text.parameter('color'))
+        self.assertIsNot(other.getValue('font'), font)
+        self.assertEqual(other.getValue('font_size'), 24)
+        self.assertEqual(other.parameter('color').allow, ('red', 'blue'))
+
+        other.setValue('color', 'red')
+        other.setValue('font_size', 42)
+        self.assertEqual(other.getValue('color'), 'red')
+        self.assertEqual(other.getValue('font_size'), 42)
+        self.assertIsNone(text.getValue('color'))
+        self.assertEqual(text.getValue('font_size'), 24)
+
+        other.validate()
+        self.assertFalse(text.parameter('color').is_validated)
+
+    def testPickle(self):
+        font = InputParameters()
+        font.add('size', default=24)
+        text = InputParameters()
+        text.add('font', font)
+        text.add('color', vtype=str, allow=('red', 'blue'))
+        text.setValue('color', 'red')
+
+        other = pickle.loads(pickle.dumps(text))
+        self.assertEqual(other.getValue('color'), 'red')
+        self.assertEqual(other.getValue('font_size'), 24)
+
+        with self.assertRaises(MooseException) as e:
+            other.setValue('color', 'green')
+        self.assertIn("only the following are allowed", e.exception.message)
+
+    def testCompact(self):
+        font = InputParameters()
+        font.add('size', default=24)
+        template = InputParameters()
+        template.add('font', font)
+        template.add('color', vtype=str, allow=('red', 'blue'))
+        template.add('name', vtype=str, required=True)
+
+        text = template.copy()
+        text.setValue('name', 'andrew')
+        text.setValue('font_size', 42)
+        text.add('_hit_path', default='foo', private=True)
+        other = template.copy()
+        other.setValue('name', 'bob')
+        other.setRequired('color', True)
+        other.setDefault('color', 'blue')
+
+        # The schema is included the first time
+        schemas = set()
+        with InputParameters.compact(schemas):
+            data = pickle.dumps(text)
+        self.assertEqual(len(schemas), 2)  # 'font' parameters have a schema
+        with InputParameters.compact(schemas):
+            data2 = pickle.dumps(other)
+        self.assertLess(len(data2), len(data))
+        self.assertLess(len(data2), len(pickle.dumps(other)) / 2)
+
+        out = pickle.loads(data)
+        self.assertEqual(out.getValue('name'), 'andrew')
+        self.assertEqual(out.getValue('font_size'), 42)
+        self.assertEqual(out.getValue('_hit_path'), 'foo')
+        self.assertTrue(out.isSetByUser('name'))
+        self.assertFalse(out.isSetByUser('color'))
+        self.assertTrue(out.isRequired('name'))
+        self.assertIs(out.getValue('font'), out.getDefault('font'))
+
+        out = pickle.loads(data2)
+        self.assertEqual(out.getValue('name'), 'bob')
+        self.assertEqual(out.getValue('font_size'), 24)
+        self.assertEqual(out.getValue('color'), 'blue')
+        self.assertTrue(out.isRequired('color'))
+        self.assertNotIn('_hit_path', out)
+        with self.assertRaises(MooseException) as e:
+            out.setValue('color', 'green')
+        self.assertIn("only the following are allowed", e.exception.message)
+
+        # Copies of loaded objects are also compact
+        with InputParameters.compact(schemas):
+            out = pickle.loads(pickle.dumps(out.copy()))
+        self.assertEqual(out.getValue('name'), 'bob')
+
+        # Removing a parameter removes the schema
+        other.remove('color')
+        with InputParameters.compact(schemas):
+            out = pickle.loads(pickle.dumps(other))
+        self.assertNotIn('color', out)
+        self.assertEqual(out.getValue('name'), 'bob')
+
+        # The schemas are not updated if an error occurs
+        schemas = set()
+        with self.assertRaises((pickle.PicklingError, AttributeError)):
+            with InputParameters.compact(schemas):
+                pickle.dumps((text, lambda: None))
+        self.assertEqual(schemas, set())
+
     def testSetRequired(self):
 
         date = InputParameters()
@@ -13,6 +13,7 @@ import sys
 import re
 import unittest
 import logging
+import pickle
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
 from parameters import InputParameters, Parameter
@@ -488,6 +489,67 @@ class TestParameter(unittest.TestCase):
         self.assertTrue(opt.is_validated)
         self.assertTrue(sub.parameter('year').is_validated)
 
+    def testCopy(self):
+        opt = Parameter('foo', default=1980, vtype=int, doc='year', user_data=[1])
+        other = opt.copy()
+        self.assertIsNot(other, opt)
+        self.assertEqual(other.name, 'foo')
+        self.assertEqual(other.value, 1980)
+        self.assertEqual(other.vtype, (int, ))
+        self.assertEqual(other.doc, 'year')
+        self.assertIs(other.user_data, opt.user_data)
+
+        ret, err = other.setValue(1949)
+        self.assertEqual(ret, 0)
+        self.assertEqual(other.value, 1949)
+        self.assertEqual(opt.value, 1980)
+
+        ret, err = other.setValue('1949')
+        self.assertEqual(ret, 1)
+        self.assertIn("'foo' must be of type", err)
+
+    def testDefinition(self):
+        # The checks of the arguments are not repeated for the same definition
+        opt = Parameter('foo', vtype=int, size=3, default=(1, 2, 3))
+        other = Parameter('bar', vtype=int, size=3)
+        self.assertIs(other._Parameter__check, opt._Parameter__check)
+        ret, err = other.setValue((1, 2))
+        self.assertEqual(ret, 1)
+        self.assertIn("'bar' was defined as an array with length 3", err)
+
+        # Arguments that compare equal to a valid definition are still checked
+        with self.assertRaises(TypeError) as e:
+            Parameter('foo', vtype=int, size=3.0)
+        self.assertIn("The supplied 'size' argument must be a 'int'", str(e.exception))
+
+        with self.assertRaises(TypeError) as e:
+            Parameter('foo', vtype=int, size=3, required=1)
+        self.assertIn("The supplied 'required' argument must be a 'bool'", str(e.exception))
+
+        # Functions are checked with each definition
+        Parameter('foo', verify=(lambda v: v > 0, "positive"))
+        with self.assertRaises(TypeError) as e:
+            Parameter('foo', verify=(lambda v, w: v > 0, "positive"))
+        self.assertIn("that has 2 arguments", str(e.exception))
+
+        # Unhashable arguments are checked every time
+        opt = Parameter('foo', vtype=list, allow=([1], [2]), default=[1])
+        ret, err = opt.setValue([3])
+        self.assertEqual(ret, 1)
+        self.assertIn("only the following are allowed", err)
+
+    def testPickle(self):
+        opt = Parameter('foo', default=(1980, ), vtype=int, array=True, user_data=[1])
+        other = pickle.loads(pickle.dumps(opt))
+        self.assertEqual(other.name, 'foo')
+        self.assertEqual(other.value, (1980, ))
+        self.assertEqual(other.vtype, (int, ))
+        self.assertEqual(other.user_data, [1])
+
+        ret, err = other.setValue(('1949', ))
+        self.assertEqual(ret, 1)
+        self.assertIn("The values within 'foo' must be of type", err)
+
     def testUserData(self):
         opt = Parameter('year', user_data=dict(person='Andrew'))
         self.assertEqual(opt.user_data, dict(person='Andrew'))